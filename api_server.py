@@ -0,0 +1,335 @@
+"""
+TalentScout API Server - HTTP/WebSocket API for the interview engine
+
+Serves the same interviews as the Streamlit UI without re-running a script
+per interaction, so one lightweight worker can hold many sessions.
+
+Run with: uvicorn api_server:app --host 0.0.0.0 --port 8000
+"""
+
+import asyncio
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
+from pydantic import BaseModel
+
+# Add utils to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.interview_engine import InterviewEngine, InterviewSession, InterviewStateError, create_interview_engine
+from utils.message_log import Message
+from utils.metrics import metrics
+from utils.session_store import SessionStore, create_session_store
+from utils.warmup import warm_up
+
+# Seconds between checks for finished background evaluations on open WebSockets
+FEEDBACK_POLL_SECONDS = 1.0
+
+
+class ProfileRequest(BaseModel):
+    """Candidate information form"""
+    name: str
+    email: str
+    phone: str
+    years_of_experience: float
+    location: str
+    desired_positions: Union[str, List[str]]
+    tech_stack: Union[str, List[str]]
+
+
+class PrefetchRequest(BaseModel):
+    """Form inputs known so far, to start generating questions early"""
+    tech_stack: Union[str, List[str]]
+    years_of_experience: float
+
+
+class AnswerRequest(BaseModel):
+    """Answer to the current technical question"""
+    answer: str
+    # Index of the question being answered (session.question_index); a retried
+    # request for an answered question is then rejected with 409
+    question_index: Optional[int] = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the shared engine and worker pool once per process"""
+    if os.getenv('NLP_WARMUP', 'true').lower() == 'true':
+        warm_up(background=True)
+    engine = create_interview_engine()
+    app.state.engine = engine
+    app.state.sessions = create_session_store(engine.restore_session)
+    # Engine steps block on LLM calls, so they run on threads; sessions waiting
+    # for the candidate hold no thread at all
+    app.state.executor = ThreadPoolExecutor(
+        max_workers=int(os.getenv('API_WORKER_THREADS', '64')), thread_name_prefix='api-step'
+    )
+    sweeper = asyncio.create_task(_expire_sessions(app.state.sessions))
+    try:
+        yield
+    finally:
+        sweeper.cancel()
+        app.state.executor.shutdown(wait=False, cancel_futures=True)
+        app.state.sessions.close()
+        engine.transcript_log.close()
+
+
+app = FastAPI(title="TalentScout Interview API", lifespan=lifespan)
+
+
+async def _expire_sessions(sessions: SessionStore):
+    """Periodically drop idle sessions"""
+    while True:
+        await asyncio.sleep(SessionStore.EXPIRE_INTERVAL)
+        await asyncio.get_running_loop().run_in_executor(None, sessions.expire)
+
+
+def find_session(state, session_id: str) -> InterviewSession:
+    """
+    Look up a session by its token
+
+    Raises:
+        HTTPException: 404 if there is no such session
+    """
+    session = state.sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired session")
+    return session
+
+
+async def run_step(state, session: InterviewSession, fn: Callable, *args):
+    """Run a blocking engine step on the worker pool and save the session"""
+    state.engine.llm_client.mark_active()
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(state.executor, partial(fn, session, *args))
+    state.sessions.save(session)
+    return result
+
+
+def step_response(session: InterviewSession, added: List[Message]) -> Dict:
+    """Messages added by a step, plus the session state without the full chat"""
+    return {'messages': session.message_views(added), 'session': session.to_dict(include_messages=False)}
+
+
+def _require_active(session: InterviewSession):
+    if not session.conversation_active:
+        raise HTTPException(status_code=409, detail="The interview has ended")
+
+
+@app.get("/health")
+async def health(request: Request):
+    """Liveness and LLM provider status"""
+    router = request.app.state.engine.llm_client.router
+    return {
+        'status': 'ok',
+        'sessions': len(request.app.state.sessions),
+        'providers': router.status() if router is not None else None,
+    }
+
+
+@app.get("/metrics")
+async def get_metrics():
+    """Process-wide latency and counter metrics"""
+    return metrics.snapshot()
+
+
+@app.post("/sessions", status_code=201)
+async def create_session(request: Request):
+    """Start a session; its id is the token for all further requests"""
+    state = request.app.state
+    session = state.engine.new_session()
+    state.sessions.add(session)
+    return {'session_id': session.interview_id, 'session': session.to_dict()}
+
+
+@app.get("/sessions/{session_id}")
+async def get_session(session_id: str, request: Request):
+    """Current state and chat, including feedback that has finished since the last request"""
+    state = request.app.state
+    session = find_session(state, session_id)
+    if session.evaluation_queue.has_completed():
+        await run_step(state, session, state.engine.collect_evaluations)
+    return session.to_dict()
+
+
+@app.delete("/sessions/{session_id}", status_code=204)
+async def delete_session(session_id: str, request: Request):
+    """Forget a session"""
+    state = request.app.state
+    find_session(state, session_id)
+    state.sessions.delete(session_id)
+
+
+@app.post("/sessions/{session_id}/prefetch", status_code=202)
+async def prefetch_questions(session_id: str, body: PrefetchRequest, request: Request):
+    """Start generating questions while the candidate is still filling in the form"""
+    state = request.app.state
+    session = find_session(state, session_id)
+    state.engine.prefetch_questions(session, InterviewEngine._split(body.tech_stack), body.years_of_experience)
+    return {'status': 'accepted'}
+
+
+@app.post("/sessions/{session_id}/start")
+async def start_interview(session_id: str, body: ProfileRequest, request: Request):
+    """Submit the information form: greets the candidate and asks the technical questions"""
+    state = request.app.state
+    session = find_session(state, session_id)
+    profile = body.model_dump() if hasattr(body, 'model_dump') else body.dict()
+    errors = state.engine.validate_profile(profile)
+    if errors:
+        raise HTTPException(status_code=422, detail=errors)
+
+    try:
+        added = await run_step(state, session, state.engine.start_interview, profile)
+    except InterviewStateError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return step_response(session, added)
+
+
+@app.post("/sessions/{session_id}/questions")
+async def retry_questions(session_id: str, request: Request):
+    """Generate the technical questions again after they were unavailable"""
+    state = request.app.state
+    session = find_session(state, session_id)
+    _require_active(session)
+    if session.conversation_stage == 'greeting':
+        raise HTTPException(status_code=409, detail="Submit the information form first")
+    added = await run_step(state, session, state.engine.generate_questions)
+    return step_response(session, added)
+
+
+@app.post("/sessions/{session_id}/answers")
+async def submit_answer(session_id: str, body: AnswerRequest, request: Request):
+    """Answer the current question; feedback arrives later unless evaluation is inline"""
+    state = request.app.state
+    session = find_session(state, session_id)
+    if not body.answer.strip():
+        raise HTTPException(status_code=422, detail="The answer is empty")
+    try:
+        added = await run_step(state, session, state.engine.submit_answer, body.answer, None, body.question_index)
+    except InterviewStateError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return step_response(session, added)
+
+
+@app.post("/sessions/{session_id}/end")
+async def end_interview(session_id: str, request: Request):
+    """End the interview early; waits for outstanding feedback and saves the transcript"""
+    state = request.app.state
+    session = find_session(state, session_id)
+    _require_active(session)
+    added = await run_step(state, session, state.engine.end_interview)
+    return step_response(session, added)
+
+
+@app.get("/sessions/{session_id}/transcript")
+async def get_transcript(session_id: str, request: Request):
+    """Interview transcript without contact details"""
+    state = request.app.state
+    return state.engine.export_transcript(find_session(state, session_id))
+
+
+def _forward_stream(websocket: WebSocket, loop: asyncio.AbstractEventLoop, chunks: Iterator[str]) -> str:
+    """
+    Send inline evaluation chunks to the client as they arrive (runs on a worker thread)
+
+    If a send fails (the client went away or stopped reading), forwarding
+    stops but the rest of the evaluation is still collected: it is saved with
+    the session and the client gets it with the state when it reconnects.
+    """
+    text = []
+    forwarding = True
+    for chunk in chunks:
+        text.append(chunk)
+        if not forwarding:
+            continue
+        sent = asyncio.run_coroutine_threadsafe(
+            websocket.send_json({'type': 'feedback_chunk', 'text': chunk}), loop
+        )
+        try:
+            sent.result(timeout=10)
+        except Exception:
+            sent.cancel()
+            forwarding = False
+    return ''.join(text)
+
+
+async def _push_feedback(websocket: WebSocket, state, session: InterviewSession):
+    """
+    Send background evaluations to the client as soon as they finish
+
+    Stops when a send fails (the client went away): the feedback is already
+    saved with the session, so the client gets it with the state when it
+    reconnects.
+    """
+    while True:
+        await asyncio.sleep(FEEDBACK_POLL_SECONDS)
+        if session.evaluation_queue.has_completed():
+            updated = await run_step(state, session, state.engine.collect_evaluations)
+            if updated:
+                try:
+                    await websocket.send_json({'type': 'feedback', 'messages': session.message_views(updated)})
+                except Exception:
+                    return
+
+
+@app.websocket("/sessions/{session_id}/ws")
+async def session_socket(websocket: WebSocket, session_id: str):
+    """
+    Interview over a WebSocket
+
+    Client messages: {"type": "answer", "text": ..., "question_index": ...} (the index is
+    optional, see AnswerRequest), {"type": "retry_questions"}, {"type": "end"}.
+    Server messages: "state" (on connect), "messages" (after each step),
+    "feedback_chunk" (inline evaluation streaming), "feedback" (background
+    evaluations as they finish) and "error".
+    """
+    state = websocket.app.state
+    try:
+        session = find_session(state, session_id)
+    except HTTPException:
+        await websocket.close(code=4404)
+        return
+
+    await websocket.accept()
+    await websocket.send_json({'type': 'state', 'session': session.to_dict()})
+    loop = asyncio.get_running_loop()
+    poller = asyncio.create_task(_push_feedback(websocket, state, session))
+    try:
+        while True:
+            data = await websocket.receive_json()
+            current = find_session(state, session_id)
+            if current is not session:
+                # The store reloaded the session (e.g. after evicting it): follow the new object
+                session = current
+                poller.cancel()
+                poller = asyncio.create_task(_push_feedback(websocket, state, session))
+            kind = data.get('type')
+            if not session.conversation_active:
+                await websocket.send_json({'type': 'error', 'detail': "The interview has ended"})
+                continue
+
+            if kind == 'answer' and (data.get('text') or '').strip():
+                try:
+                    added = await run_step(state, session, state.engine.submit_answer, data['text'],
+                                           partial(_forward_stream, websocket, loop), data.get('question_index'))
+                except InterviewStateError as e:
+                    await websocket.send_json({'type': 'error', 'detail': str(e)})
+                    continue
+            elif kind == 'retry_questions' and session.conversation_stage != 'greeting':
+                added = await run_step(state, session, state.engine.generate_questions)
+            elif kind == 'end':
+                added = await run_step(state, session, state.engine.end_interview)
+            else:
+                await websocket.send_json({'type': 'error', 'detail': f"Unexpected message: {kind}"})
+                continue
+            await websocket.send_json({'type': 'messages', **step_response(session, added)})
+    except (WebSocketDisconnect, HTTPException):
+        pass
+    finally:
+        poller.cancel()
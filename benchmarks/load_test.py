@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Load Test
+Runs N simulated candidates through full interviews (form, question generation,
+5 answers, conclusion) concurrently, driving the Streamlit app headlessly with
+streamlit's AppTest against the local mock LLM server.
+
+Reports p50/p95/p99 latency per stage, interview throughput, LLM requests and
+process memory, without spending real API credits.
+
+Usage: python benchmarks/load_test.py [--candidates 20] [--concurrency 5] [--provider ollama]
+                                      [--latency 0.5] [--tokens-per-second 50] [--evaluation async]
+"""
+
+import argparse
+import logging
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from mock_llm_server import MockConfig, start_server
+from utils.metrics import MetricsRegistry
+
+APP_PATH = str(project_root / "app.py")
+STAGES = ['form', 'questions', 'answer', 'conclusion', 'interview']
+TECH_STACKS = ["Python, Django, PostgreSQL", "JavaScript, React, Node.js", "Java, Spring, MySQL",
+               "Go, Kubernetes, Docker", "Python, FastAPI, Redis"]
+ANSWERS = [
+    "A decorator wraps a function to add behaviour such as logging or caching without changing it.",
+    "select_related uses a SQL join for foreign keys while prefetch_related runs a second query.",
+    "An index is a B-tree that avoids full table scans, but every write has to update it too.",
+    "I put the version in the URL and keep old versions running until clients have migrated.",
+    "I would take heap snapshots over time and compare which objects keep growing.",
+]
+
+
+def configure_environment(args, server_url: str, data_dir: str):
+    """Point the app at the mock server and a throwaway data directory"""
+    os.environ['LLM_PROVIDER'] = args.provider
+    os.environ['LLM_FALLBACK_PROVIDERS'] = ''
+    if args.provider == 'openai':
+        os.environ['OPENAI_BASE_URL'] = f"{server_url}/v1"
+        os.environ.setdefault('OPENAI_API_KEY', 'mock-key')
+    else:
+        os.environ['OLLAMA_BASE_URL'] = server_url
+        os.environ['OLLAMA_READ_TIMEOUT'] = str(max(30.0, args.latency * 20))
+        os.environ['OLLAMA_POOL_SIZE'] = str(max(10, args.concurrency * 2))
+
+    os.environ['ASYNC_EVALUATION'] = 'false' if args.evaluation == 'inline' else 'true'
+    os.environ['EVALUATION_MODE'] = 'batch' if args.evaluation == 'batch' else 'per_answer'
+    os.environ['STORAGE_BACKEND'] = 'sqlite'
+    os.environ['QUESTION_CACHE_PATH'] = os.path.join(data_dir, 'question_cache.db')
+    os.environ['TRANSCRIPT_LOG_DIR'] = os.path.join(data_dir, 'transcripts')
+    # The app stores candidates under ./data
+    os.chdir(data_dir)
+
+
+def share_test_runtime():
+    """
+    Let concurrent AppTest runs share one runtime and one compiled script
+
+    AppTest installs a mock streamlit Runtime at the start of every run and
+    removes it at the end, so with several interviews in flight one finishing
+    run pulls the runtime out from under the others. Keep returning the most
+    recently installed one instead, and compile app.py once instead of on
+    every run (concurrent ast.parse calls can fail on Python 3.11), like the
+    single runtime and script cache of a real server.
+    """
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    current = {}
+    compile_lock = threading.Lock()
+    get_bytecode = ScriptCache.get_bytecode
+    bytecode = {}
+
+    def instance(cls):
+        if cls._instance is not None:
+            current['runtime'] = cls._instance
+        if 'runtime' not in current:
+            raise RuntimeError("Runtime hasn't been created!")
+        return current['runtime']
+
+    Runtime.instance = classmethod(instance)
+    Runtime.exists = classmethod(lambda cls: cls._instance is not None or 'runtime' in current)
+
+    def shared_bytecode(self, script_path: str):
+        with compile_lock:
+            if script_path not in bytecode:
+                bytecode[script_path] = get_bytecode(self, script_path)
+            return bytecode[script_path]
+
+    ScriptCache.get_bytecode = shared_bytecode
+    # Reading session state from the candidate threads is expected here
+    logging.getLogger('streamlit.runtime.scriptrunner_utils.script_run_context').addFilter(
+        lambda record: 'missing ScriptRunContext' not in record.getMessage())
+
+
+def run_interview(number: int, stage_metrics: MetricsRegistry, think_time: float, timeout: float) -> bool:
+    """
+    Run one candidate through a complete interview
+
+    Returns:
+        True if the interview completed without exceptions
+    """
+    from streamlit.testing.v1 import AppTest
+
+    interview_started = time.perf_counter()
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+
+    def timed(stage: str):
+        started = time.perf_counter()
+        at.run()
+        stage_metrics.observe(stage, time.perf_counter() - started)
+        if at.exception:
+            raise RuntimeError(f"{stage}: {at.exception[0].value}")
+
+    def text_input(label: str):
+        return next(widget for widget in at.text_input if label in widget.label)
+
+    try:
+        timed('form')
+        text_input('Full Name').input(f"Candidate {number}")
+        text_input('Email').input(f"candidate{number}@example.com")
+        text_input('Phone').input(f"+1555{number:07d}")
+        at.number_input[0].set_value(2 + number % 8)
+        text_input('Location').input("Remote")
+        text_input('Target').input("Software Engineer")
+        at.text_area[0].input(TECH_STACKS[number % len(TECH_STACKS)])
+        timed('form')
+
+        next(button for button in at.button if 'Start' in button.label).click()
+        timed('questions')
+
+        for answer_number in range(10):
+            if not at.session_state.interview.conversation_active:
+                break
+            if think_time:
+                time.sleep(think_time)
+            index = at.session_state.interview.question_index
+            at.text_area(key=f'answer_input_{index}').input(ANSWERS[(number + answer_number) % len(ANSWERS)])
+            at.button(key=f'submit_{index}').click()
+            last = index + 1 >= len(at.session_state.interview.technical_questions)
+            timed('conclusion' if last else 'answer')
+
+        if at.session_state.interview.conversation_active:
+            raise RuntimeError("interview did not finish")
+    except Exception as e:
+        print(f"  candidate {number} failed: {str(e)}")
+        stage_metrics.increment('failed')
+        return False
+
+    stage_metrics.observe('interview', time.perf_counter() - interview_started)
+    stage_metrics.increment('completed')
+    return True
+
+
+def peak_rss_mb() -> float:
+    """Peak resident memory of this process in MB"""
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage / 1024 / 1024 if sys.platform == 'darwin' else usage / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--candidates', type=int, default=20, help='interviews to run')
+    parser.add_argument('--concurrency', type=int, default=5, help='interviews running at the same time')
+    parser.add_argument('--provider', choices=['ollama', 'openai'], default='ollama', help='API the mock serves')
+    parser.add_argument('--latency', type=float, default=0.5, help='mock time to first token in seconds')
+    parser.add_argument('--tokens-per-second', type=float, default=50.0, help='mock generation speed')
+    parser.add_argument('--jitter', type=float, default=0.2, help='random fraction added to mock delays')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of mock requests failing')
+    parser.add_argument('--evaluation', choices=['async', 'inline', 'batch'], default='async',
+                        help='async: background workers, inline: streamed, batch: one request at the end')
+    parser.add_argument('--think-time', type=float, default=0.0, help='seconds a candidate takes per answer')
+    parser.add_argument('--timeout', type=float, default=120.0, help='maximum seconds per app rerun')
+    parser.add_argument('--warmup', type=int, default=1, help='unmeasured interviews run first')
+    args = parser.parse_args()
+
+    config = MockConfig(args.latency, args.jitter, args.tokens_per_second, args.error_rate)
+    server = start_server(0, config)
+    data_dir = tempfile.mkdtemp(prefix='talentscout-load-')
+    configure_environment(args, f"http://127.0.0.1:{server.server_port}", data_dir)
+
+    print(f"Load test: {args.candidates} candidates, {args.concurrency} concurrent, {args.provider} mock "
+          f"(latency {args.latency}s, {args.tokens_per_second:g} tokens/s), {args.evaluation} evaluation")
+    print(f"  data directory: {data_dir}")
+
+    share_test_runtime()
+    warmup_metrics = MetricsRegistry()
+    for number in range(args.warmup):
+        run_interview(-1 - number, warmup_metrics, 0.0, args.timeout)
+    baseline_rss = peak_rss_mb()
+
+    from utils.metrics import metrics as app_metrics
+    app_metrics.reset()
+    requests_before = config.requests
+    stage_metrics = MetricsRegistry(window=max(1000, args.candidates * 10))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency, thread_name_prefix='candidate') as executor:
+        list(executor.map(
+            lambda number: run_interview(number, stage_metrics, args.think_time, args.timeout),
+            range(args.candidates)
+        ))
+    elapsed = time.perf_counter() - started
+    snapshot = stage_metrics.snapshot()
+    completed = snapshot['counters'].get('completed', 0)
+
+    print("\nStage latency in seconds (per app rerun; 'interview' is end to end)")
+    print(f"  {'stage':<12} {'count':>6} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for stage in STAGES:
+        summary = stage_metrics.summary(stage)
+        if summary['count']:
+            print(f"  {stage:<12} {summary['count']:>6} {summary['p50']:>8.3f} "
+                  f"{summary['p95']:>8.3f} {summary['p99']:>8.3f}")
+
+    print("\nThroughput")
+    print(f"  completed {completed}/{args.candidates} interviews in {elapsed:.1f}s "
+          f"({completed / elapsed * 60 if elapsed else 0:.1f} interviews/min)")
+    llm_requests = config.requests - requests_before
+    print(f"  {llm_requests} LLM requests ({llm_requests / elapsed if elapsed else 0:.1f}/s, "
+          f"{llm_requests / completed if completed else 0:.1f} per interview)")
+
+    print("\nLLM client (as seen by the app)")
+    for name, summary in sorted(app_metrics.snapshot()['observations'].items()):
+        if name.startswith('llm.') and summary['count']:
+            print(f"  {name:<40} n={summary['count']:<5} p50={summary['p50']:.3f} p95={summary['p95']:.3f}")
+
+    print("\nMemory")
+    print(f"  peak RSS {peak_rss_mb():.0f} MB (after warm-up {baseline_rss:.0f} MB), "
+          f"{threading.active_count()} threads alive")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Mock LLM Server
+Local stand-in for the OpenAI and Ollama HTTP APIs with configurable latency,
+for load tests and offline development without spending API credits.
+
+Serves:
+  POST /v1/chat/completions   OpenAI chat completions (JSON or server-sent events)
+  POST /api/generate          Ollama generate (JSON or NDJSON stream)
+  POST /api/chat              Ollama chat (JSON or NDJSON stream)
+  GET  /api/tags, /v1/models  Health checks
+
+Responses are canned but shaped like the app expects (numbered or JSON
+questions, three-bullet feedback, batch evaluations).
+
+Usage: python benchmarks/mock_llm_server.py [--port 11434] [--latency 0.5] [--tokens-per-second 50]
+Point the app at it with OLLAMA_BASE_URL=http://127.0.0.1:<port>, or
+OPENAI_BASE_URL=http://127.0.0.1:<port>/v1 and any OPENAI_API_KEY.
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional
+
+QUESTIONS = [
+    "What is a Python decorator and when would you use one?",
+    "Explain the difference between select_related and prefetch_related in the Django ORM.",
+    "How do PostgreSQL indexes speed up queries, and when can they slow writes down?",
+    "How would you structure a REST API so it can be versioned safely?",
+    "Describe how you would find and fix a memory leak in a long-running service.",
+]
+FEEDBACK = (
+    "• Assessment: The answer shows a solid grasp of the core idea.\n"
+    "• Experience Match: This is appropriate for the candidate's experience level.\n"
+    "• Suggestion: Add a concrete example from a project to make the answer stronger."
+)
+
+
+class MockConfig:
+    """Latency model shared by all request handlers"""
+
+    def __init__(self, latency: float = 0.5, jitter: float = 0.2, tokens_per_second: float = 50.0,
+                 error_rate: float = 0.0):
+        """
+        Initialize Mock Config
+
+        Args:
+            latency: Seconds before the first token (prompt processing)
+            jitter: Random fraction added to or removed from every delay
+            tokens_per_second: Generation speed after the first token (0 for instant)
+            error_rate: Fraction of requests answered with HTTP 500
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def delay(self, seconds: float) -> float:
+        return max(0.0, seconds * (1 + random.uniform(-self.jitter, self.jitter)))
+
+    def count(self):
+        with self._lock:
+            self.requests += 1
+
+
+def pick_response(prompt: str, json_mode: bool) -> str:
+    """Canned response matching the kind of request the app sent"""
+    if 'evaluations' in prompt:
+        count = max(1, len(re.findall(r'^Answer \d+:', prompt, re.MULTILINE)))
+        return json.dumps({"evaluations": [
+            {"question_number": n, "assessment": "Solid understanding of the topic.",
+             "experience_match": "Appropriate for the level.", "suggestion": "Add a concrete example."}
+            for n in range(1, count + 1)
+        ]})
+    if 'generate exactly' in prompt.lower() and 'questions' in prompt.lower():
+        if json_mode or 'JSON' in prompt:
+            return json.dumps({"questions": QUESTIONS})
+        return "\n\n".join(f"{n}. {question}" for n, question in enumerate(QUESTIONS, 1))
+    if 'summar' in prompt.lower():
+        return "The candidate described their experience and answered the questions so far."
+    return FEEDBACK
+
+
+def tokens(text: str) -> List[str]:
+    """Split a response into word-sized stream chunks"""
+    words = text.split(' ')
+    return [word + ' ' for word in words[:-1]] + words[-1:]
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    config = MockConfig()
+
+    def log_message(self, *args):
+        pass
+
+    def handle(self):
+        try:
+            super().handle()
+        except ConnectionResetError:
+            # Client closed an idle pooled keep-alive connection
+            pass
+
+    def do_GET(self):
+        if self.path.startswith('/api/tags'):
+            self._send_json({"models": [{"name": "mock"}]})
+        elif self.path.startswith('/v1/models'):
+            self._send_json({"object": "list", "data": [{"id": "mock", "object": "model"}]})
+        else:
+            self._send_json({"error": "not found"}, 404)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        try:
+            body = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            self._send_json({"error": "invalid JSON"}, 400)
+            return
+
+        self.config.count()
+        if random.random() < self.config.error_rate:
+            self._send_json({"error": "mock failure"}, 500)
+            return
+
+        if self.path.startswith('/v1/chat/completions'):
+            self._openai(body)
+        elif self.path.startswith('/api/generate'):
+            self._ollama(body, chat=False)
+        elif self.path.startswith('/api/chat'):
+            self._ollama(body, chat=True)
+        else:
+            self._send_json({"error": "not found"}, 404)
+
+    def _openai(self, body: Dict):
+        prompt = "\n".join(message.get('content', '') for message in body.get('messages', []))
+        json_mode = (body.get('response_format') or {}).get('type') == 'json_object'
+        text = pick_response(prompt, json_mode)
+        created = int(time.time())
+
+        if not body.get('stream'):
+            self._generate_delay(text)
+            self._send_json({
+                "id": "chatcmpl-mock", "object": "chat.completion", "created": created, "model": body.get('model'),
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(text) // 4,
+                          "total_tokens": (len(prompt) + len(text)) // 4},
+            })
+            return
+
+        def events() -> Iterator[bytes]:
+            for chunk in self._paced(tokens(text)):
+                yield self._sse({"id": "chatcmpl-mock", "object": "chat.completion.chunk", "created": created,
+                                 "model": body.get('model'),
+                                 "choices": [{"index": 0, "delta": {"content": chunk}, "finish_reason": None}]})
+            yield self._sse({"id": "chatcmpl-mock", "object": "chat.completion.chunk", "created": created,
+                             "model": body.get('model'),
+                             "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]})
+            yield b"data: [DONE]\n\n"
+
+        self._send_stream(events(), 'text/event-stream')
+
+    def _ollama(self, body: Dict, chat: bool):
+        if chat:
+            prompt = "\n".join(message.get('content', '') for message in body.get('messages', []))
+        else:
+            prompt = f"{body.get('system', '')}\n{body.get('prompt', '')}"
+        if not prompt.strip():
+            # Model load / keep-alive request
+            self._send_json({"model": body.get('model'), "response": "", "done": True, "load_duration": 0})
+            return
+
+        text = pick_response(prompt, body.get('format') == 'json')
+        stats = {"prompt_eval_count": len(prompt) // 4, "eval_count": len(text) // 4,
+                 "prompt_eval_duration": int(self.config.latency * 1e9), "load_duration": 0}
+
+        def message(content: str, done: bool) -> Dict:
+            data = {"model": body.get('model'), "done": done}
+            if chat:
+                data["message"] = {"role": "assistant", "content": content}
+            else:
+                data["response"] = content
+            return data
+
+        if not body.get('stream', True):
+            self._generate_delay(text)
+            self._send_json({**message(text, True), **stats})
+            return
+
+        def lines() -> Iterator[bytes]:
+            for chunk in self._paced(tokens(text)):
+                yield (json.dumps(message(chunk, False)) + "\n").encode()
+            yield (json.dumps({**message("", True), **stats}) + "\n").encode()
+
+        self._send_stream(lines(), 'application/x-ndjson')
+
+    def _generate_delay(self, text: str):
+        """Sleep for prompt processing plus generating the whole response"""
+        generation = len(tokens(text)) / self.config.tokens_per_second if self.config.tokens_per_second else 0
+        time.sleep(self.config.delay(self.config.latency + generation))
+
+    def _paced(self, chunks: List[str]) -> Iterator[str]:
+        """Yield chunks at the configured time-to-first-token and generation speed"""
+        time.sleep(self.config.delay(self.config.latency))
+        for chunk in chunks:
+            yield chunk
+            if self.config.tokens_per_second:
+                time.sleep(self.config.delay(1 / self.config.tokens_per_second))
+
+    @staticmethod
+    def _sse(data: Dict) -> bytes:
+        return f"data: {json.dumps(data)}\n\n".encode()
+
+    def _send_json(self, data: Dict, status: int = 200):
+        payload = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_stream(self, chunks: Iterator[bytes], content_type: str):
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        try:
+            for chunk in chunks:
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+                self.wfile.flush()
+            self.wfile.write(b'0\r\n\r\n')
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def start_server(port: int = 0, config: Optional[MockConfig] = None) -> ThreadingHTTPServer:
+    """
+    Start the mock server on a background thread
+
+    Args:
+        port: Port to listen on (0 picks a free port; see server.server_port)
+        config: Latency model (default: MockConfig())
+
+    Returns:
+        Running server; call shutdown() to stop it
+    """
+    handler = type('ConfiguredMockHandler', (MockHandler,), {'config': config or MockConfig()})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='mock-llm-server', daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--port', type=int, default=11434)
+    parser.add_argument('--latency', type=float, default=0.5, help='seconds before the first token')
+    parser.add_argument('--jitter', type=float, default=0.2, help='random fraction added to delays')
+    parser.add_argument('--tokens-per-second', type=float, default=50.0, help='generation speed (0 for instant)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests failing with HTTP 500')
+    args = parser.parse_args()
+
+    config = MockConfig(args.latency, args.jitter, args.tokens_per_second, args.error_rate)
+    server = start_server(args.port, config)
+    print(f"Mock LLM server on http://127.0.0.1:{server.server_port} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(60)
+            print(f"  {config.requests} requests served")
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Prompt Prefix Benchmark
+Measures Ollama prompt processing for answer evaluations with the previous prompt
+layout (answer in the middle of the instructions) and the prefix-stable layout
+(per-interview instructions as system message, answer last).
+
+Ollama keeps the KV cache of the previous request and only processes the tokens
+after the longest common prefix, so the prefix-stable layout should show far
+fewer processed prompt tokens from the second evaluation of an interview on.
+
+Usage: python benchmarks/prompt_prefix_benchmark.py [--answers 10] [--max-tokens 1]
+Requires a running Ollama server (OLLAMA_BASE_URL, OLLAMA_MODEL).
+"""
+
+import argparse
+import statistics
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from prompts.prompt_templates import PromptTemplates
+from utils.llm_providers import OllamaProvider
+
+TECH = "Python"
+YEARS = 4
+QUESTIONS = [
+    "What is a Python decorator and when would you use one?",
+    "Explain the difference between a list and a tuple.",
+    "How does the GIL affect multithreaded Python programs?",
+    "What are generators and why are they memory efficient?",
+    "How do you manage dependencies in a Python project?",
+]
+ANSWERS = [
+    "A decorator wraps a function to add behaviour, for example logging or caching.",
+    "Lists are mutable and tuples are immutable, so tuples can be dictionary keys.",
+    "Only one thread runs Python bytecode at a time, so CPU-bound threads do not speed up.",
+    "They yield values lazily one at a time instead of building the whole list in memory.",
+    "I use virtual environments with pinned requirements or a lock file from Poetry.",
+]
+
+
+def previous_layout(question: str, answer: str) -> dict:
+    """Evaluation request as sent before: one prompt with the answer between the instructions"""
+    prompt = f"""Evaluate this technical response in BULLET format only.
+
+Q: {question}
+A: {answer}
+
+Respond ONLY with these 3 bullets, nothing else:
+• Assessment: [1-2 sentences on their understanding]
+• Experience Match: [Is this appropriate for {YEARS} years experience?]
+• Suggestion: [One improvement tip]
+
+DO NOT add any other text, conclusions, or messages."""
+    system = "You are a technical interviewer. Respond ONLY with the 3 bullet points. No other text."
+    return {'prompt': f"{system}\n\n{prompt}"}
+
+
+def prefix_layout(question: str, answer: str) -> dict:
+    """Evaluation request as sent now: stable system message, answer last"""
+    return {
+        'system': PromptTemplates.create_evaluation_system_prompt(TECH, YEARS),
+        'prompt': PromptTemplates.create_answer_prompt(question, answer),
+    }
+
+
+def run_layout(provider: OllamaProvider, build, answers: int, max_tokens: int):
+    """Send `answers` evaluations and return (prompt_eval_count, prompt_eval seconds) per request"""
+    samples = []
+    for i in range(answers):
+        payload = {
+            'model': provider.model,
+            'stream': False,
+            'keep_alive': provider.keep_alive,
+            'options': {'temperature': 0, 'num_predict': max_tokens},
+            **build(QUESTIONS[i % len(QUESTIONS)], ANSWERS[(i * 3 + 1) % len(ANSWERS)]),
+        }
+        data = provider._post(payload).json()
+        samples.append((data.get('prompt_eval_count', 0), data.get('prompt_eval_duration', 0) / 1e9))
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--answers', type=int, default=10, help='evaluations per layout')
+    parser.add_argument('--max-tokens', type=int, default=1, help='tokens to generate (small to isolate prompt processing)')
+    args = parser.parse_args()
+
+    provider = OllamaProvider()
+    provider.use_chat = False
+    if not provider.warm_up():
+        sys.exit(f"Ollama is not reachable at {provider.base_url}")
+
+    print(f"Prompt processing per evaluation ({provider.model}, {args.answers} answers, first request excluded)\n")
+    for name, build in (('previous layout', previous_layout), ('prefix-stable layout', prefix_layout)):
+        samples = run_layout(provider, build, args.answers, args.max_tokens)[1:] or [(0, 0.0)]
+        tokens = statistics.mean(count for count, _ in samples)
+        seconds = statistics.mean(duration for _, duration in samples)
+        print(f"  {name:<22} prompt tokens processed {tokens:7.1f}   prompt eval {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
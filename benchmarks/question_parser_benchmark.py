@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Question Parser Benchmark
+Checks the question parser against a corpus of model outputs, fuzzes it with
+formatting variations and compares speed with the previous line-scanning parser.
+
+Usage: python benchmarks/question_parser_benchmark.py [--fuzz 2000] [--seed 0]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.question_parser import parse_questions, QUESTION_START_PATTERN
+
+CORPUS_PATH = Path(__file__).resolve().parent / "question_parser_corpus.json"
+
+
+def legacy_parse_questions(response: str):
+    """The parser previously inlined in app.py, kept for comparison"""
+    questions = []
+    lines = response.split('\n')
+    for i, line in enumerate(lines):
+        line_stripped = line.strip()
+        if line_stripped and line_stripped[0].isdigit():
+            if '.' in line_stripped[:3] or ')' in line_stripped[:3]:
+                question = line_stripped
+            else:
+                continue
+            j = i + 1
+            while j < len(lines):
+                next_line = lines[j].strip()
+                if next_line and next_line[0].isdigit() and ('.' in next_line[:3] or ')' in next_line[:3]):
+                    break
+                if next_line:
+                    question += " " + next_line
+                j += 1
+            if len(question) > 10:
+                questions.append(question)
+    return questions
+
+
+def strip_number(question: str) -> str:
+    match = QUESTION_START_PATTERN.match(question)
+    return match.group('text').strip() if match else question.strip()
+
+
+def is_correct(parsed, expected) -> bool:
+    return [strip_number(q) for q in parsed] == expected
+
+
+# Formatting variations seen in model output: (prefix format, separator)
+NUMBER_FORMATS = ["{n}. ", "{n}) ", "**{n}.** ", "Question {n}: ", "Q{n}. ", "### {n}. ", "- {n}. ", "{n}: ", "{n} - "]
+SEPARATORS = ["\n", "\n\n", "\r\n", "\n\n\n"]
+PREAMBLES = ["", "Here are 5 questions:\n\n", "Sure! Here are the questions for the candidate:\n\n",
+             "**Interview Questions**\n\n"]
+TRAILERS = ["", "\n\nGood luck with the interview!", "\n\nThese questions cover intermediate topics.",
+            "\n\nNote: adjust as needed."]
+
+
+def fuzz_case(rng: random.Random, questions):
+    """Build one randomly formatted response and the questions it should yield"""
+    number_format = rng.choice(NUMBER_FORMATS)
+    separator = rng.choice(SEPARATORS)
+    lines = []
+    for n, question in enumerate(questions, 1):
+        text = question
+        if rng.random() < 0.3 and ', ' in text:
+            # Wrap a long question over two lines
+            text = text.replace(', ', ',' + separator.rstrip('\n') + '\n   ', 1)
+        lines.append(number_format.format(n=n) + text)
+    response = rng.choice(PREAMBLES) + separator.join(lines) + rng.choice(TRAILERS)
+    return response
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fuzz', type=int, default=2000, help='number of fuzzed responses')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    corpus = json.loads(CORPUS_PATH.read_text())
+    questions = corpus['questions']
+
+    print(f"Corpus ({len(corpus['cases'])} model outputs)")
+    correct = {'new': 0, 'legacy': 0}
+    for case in corpus['cases']:
+        expected = case.get('expected', questions)
+        new_ok = is_correct(parse_questions(case['output']), expected)
+        legacy_ok = is_correct(legacy_parse_questions(case['output']), expected)
+        correct['new'] += new_ok
+        correct['legacy'] += legacy_ok
+        if not new_ok:
+            print(f"  FAIL {case['name']}: {parse_questions(case['output'])}")
+    total = len(corpus['cases'])
+    print(f"  parser: {correct['new']}/{total} correct, previous parser: {correct['legacy']}/{total}")
+
+    rng = random.Random(args.seed)
+    cases = [fuzz_case(rng, questions) for _ in range(args.fuzz)]
+    new_ok = sum(is_correct(parse_questions(case), questions) for case in cases)
+    legacy_ok = sum(is_correct(legacy_parse_questions(case), questions) for case in cases)
+    print(f"\nFuzz ({args.fuzz} formatting variations)")
+    print(f"  parser: {new_ok}/{args.fuzz} correct, previous parser: {legacy_ok}/{args.fuzz}")
+
+    print("\nSpeed (ms per response)")
+    for size in (5, 50, 500):
+        response = "Preamble\n\n" + "\n\n".join(
+            f"{n}. {questions[n % len(questions)]}\n   continued detail line" for n in range(1, size + 1)
+        )
+        timings = []
+        for parse in (parse_questions, legacy_parse_questions):
+            runs = max(1, 2000 // size)
+            started = time.perf_counter()
+            for _ in range(runs):
+                parse(response)
+            timings.append((time.perf_counter() - started) / runs * 1000)
+        print(f"  {size:4d} questions: parser {timings[0]:.3f}, previous parser {timings[1]:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Render Benchmark
+Measures what one rerun of the Streamlit UI sends to the browser as the
+interview chat grows: bytes and messages on the websocket per rerun.
+
+Prepares interviews with 0 to 4 answered questions in a SQLite session store,
+starts `streamlit run app.py` against the local mock LLM server, and connects
+to it like a browser does: it resumes each interview through the ?session=
+URL parameter, reruns the script several times and reports the elements the
+browser already has as cached (so Streamlit can send references to them
+instead of the elements themselves).
+
+Usage: python benchmarks/render_benchmark.py [--reruns 5] [--port 8599]
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from mock_llm_server import MockConfig, start_server
+
+APP_PATH = str(project_root / "app.py")
+PROFILE = {
+    'name': "Render Benchmark",
+    'email': "render@example.com",
+    'phone': "+15550000000",
+    'years_of_experience': 4,
+    'location': "Remote",
+    'desired_positions': "Software Engineer",
+    'tech_stack': "Python, Django, PostgreSQL",
+}
+ANSWER = ("I would start by profiling the slow endpoint, look at the query plan for the "
+          "queries it runs, add the missing index and cache the result if it is read often.")
+
+
+def configure_environment(server_url: str, data_dir: str):
+    """Point the app at the mock server, a throwaway data directory and a shared session store"""
+    os.environ.update({
+        'LLM_PROVIDER': 'ollama',
+        'LLM_FALLBACK_PROVIDERS': '',
+        'OLLAMA_BASE_URL': server_url,
+        'LLM_WARMUP': 'false',
+        'NLP_WARMUP': 'false',
+        'ASYNC_EVALUATION': 'false',
+        'SESSION_STORE': 'sqlite',
+        'SESSION_STORE_PATH': os.path.join(data_dir, 'sessions.db'),
+        'QUESTION_CACHE_PATH': os.path.join(data_dir, 'question_cache.db'),
+        'TRANSCRIPT_LOG_DIR': os.path.join(data_dir, 'transcripts'),
+    })
+    # The app stores candidates under ./data and reads ./.streamlit/config.toml
+    shutil.copytree(project_root / '.streamlit', os.path.join(data_dir, '.streamlit'))
+    os.chdir(data_dir)
+
+
+def prepare_interviews(max_answers: int) -> dict:
+    """
+    Store one interview per chat length
+
+    Returns:
+        Session token by number of answered questions
+    """
+    from utils.interview_engine import create_interview_engine
+    from utils.session_store import create_session_store
+
+    engine = create_interview_engine()
+    store = create_session_store(engine.restore_session, backend='sqlite')
+    tokens = {}
+    for answers in range(max_answers + 1):
+        session = engine.new_session()
+        store.add(session)
+        engine.start_interview(session, PROFILE)
+        for _ in range(answers):
+            engine.submit_answer(session, ANSWER)
+        store.save(session)
+        tokens[answers] = (session.interview_id, len(session.chat_history))
+    store.close()
+    return tokens
+
+
+def start_app(port: int) -> subprocess.Popen:
+    """Start the Streamlit server and wait until it answers health checks"""
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', APP_PATH, '--server.port', str(port),
+         '--server.headless', 'true', '--server.runOnSave', 'false',
+         '--server.fileWatcherType', 'none', '--browser.gatherUsageStats', 'false'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+            return process
+        except OSError:
+            if process.poll() is not None:
+                raise RuntimeError("streamlit exited during startup")
+            time.sleep(0.5)
+    process.kill()
+    raise RuntimeError("streamlit did not start within 60s")
+
+
+async def measure(port: int, token: str, reruns: int) -> list:
+    """
+    Rerun the app for one interview like a browser tab
+
+    Returns:
+        (bytes, messages, references) sent by the server for each rerun
+    """
+    import websockets
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+    cached = set()
+    results = []
+    async with websockets.connect(f"ws://127.0.0.1:{port}/_stcore/stream", subprotocols=['streamlit'],
+                                  compression=None, max_size=None) as websocket:
+        for _ in range(reruns):
+            back = BackMsg()
+            back.rerun_script.query_string = f"session={token}"
+            back.rerun_script.cached_message_hashes.extend(sorted(cached))
+            await websocket.send(back.SerializeToString())
+
+            sent = messages = references = 0
+            while True:
+                frame = await asyncio.wait_for(websocket.recv(), timeout=60)
+                message = ForwardMsg()
+                message.ParseFromString(frame)
+                sent += len(frame)
+                messages += 1
+                if message.HasField('ref_hash'):
+                    references += 1
+                elif message.metadata.cacheable:
+                    # The browser keeps cacheable elements and reports them on the next rerun
+                    cached.add(message.hash)
+                if message.HasField('script_finished'):
+                    break
+            results.append((sent, messages, references))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--reruns', type=int, default=5, help='reruns per interview (the first one is cold)')
+    parser.add_argument('--answers', type=int, default=4, help='longest interview, in answered questions')
+    parser.add_argument('--port', type=int, default=8599, help='port for the streamlit server')
+    args = parser.parse_args()
+
+    server = start_server(0, MockConfig(latency=0.0, jitter=0.0, tokens_per_second=0))
+    data_dir = tempfile.mkdtemp(prefix='talentscout-render-')
+    configure_environment(f"http://127.0.0.1:{server.server_port}", data_dir)
+    tokens = prepare_interviews(args.answers)
+
+    print(f"Render benchmark: {args.reruns} reruns per interview (bytes are serialized protobuf, uncompressed)")
+    print(f"  data directory: {data_dir}")
+    app = start_app(args.port)
+    try:
+        print(f"\n  {'answers':>7} {'chat msgs':>9} {'cold bytes':>11} {'bytes/rerun':>12} "
+              f"{'msgs/rerun':>11} {'cached refs':>12}")
+        for answers, (token, chat_messages) in tokens.items():
+            results = asyncio.run(measure(args.port, token, args.reruns))
+            warm = results[1:] or results
+            print(f"  {answers:>7} {chat_messages:>9} {results[0][0]:>11,} "
+                  f"{statistics.median(r[0] for r in warm):>12,.0f} "
+                  f"{statistics.median(r[1] for r in warm):>11.0f} "
+                  f"{statistics.median(r[2] for r in warm):>12.0f}")
+    finally:
+        app.terminate()
+        app.wait(timeout=10)
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
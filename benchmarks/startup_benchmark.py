@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+Measures import time of the app's modules and first-call latency of the NLP helpers.
+Each measurement runs in a fresh interpreter so nothing is cached between runs.
+
+Usage: python benchmarks/startup_benchmark.py [--runs 5]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+
+# Each snippet prints a JSON dict of timings in seconds
+SCENARIOS = {
+    'app modules import': """
+import time
+t = time.perf_counter()
+import utils.llm_client, utils.candidate_data, utils.sentiment_analyzer, utils.language_detector
+import prompts.prompt_templates
+print(json.dumps({'import': time.perf_counter() - t}))
+""",
+    'eager textblob + langdetect import (previous behaviour)': """
+import time
+t = time.perf_counter()
+import textblob, langdetect
+print(json.dumps({'import': time.perf_counter() - t}))
+""",
+    'first detect_language / analyze_sentiment (cold)': """
+import time
+from utils.language_detector import LanguageHandler
+from utils.sentiment_analyzer import SentimentAnalyzer
+t = time.perf_counter()
+LanguageHandler.detect_language('I have five years of experience with Python')
+detect = time.perf_counter() - t
+t = time.perf_counter()
+SentimentAnalyzer.analyze_sentiment('I really enjoyed working on that project')
+print(json.dumps({'detect_language': detect, 'analyze_sentiment': time.perf_counter() - t}))
+""",
+    'first detect_language / analyze_sentiment (after warm-up)': """
+import time
+from utils.warmup import warm_up
+from utils.language_detector import LanguageHandler
+from utils.sentiment_analyzer import SentimentAnalyzer
+t = time.perf_counter()
+warm_up(background=False)
+warm = time.perf_counter() - t
+t = time.perf_counter()
+LanguageHandler.detect_language('I have five years of experience with Python')
+detect = time.perf_counter() - t
+t = time.perf_counter()
+SentimentAnalyzer.analyze_sentiment('I really enjoyed working on that project')
+print(json.dumps({'warm_up': warm, 'detect_language': detect, 'analyze_sentiment': time.perf_counter() - t}))
+""",
+}
+
+
+def run_scenario(code: str) -> dict:
+    """Run one snippet in a fresh interpreter and return its timings"""
+    prelude = f"import sys, json; sys.path.insert(0, {str(project_root)!r})\n"
+    result = subprocess.run(
+        [sys.executable, '-c', prelude + code],
+        capture_output=True, text=True, cwd=project_root, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help='fresh interpreters per scenario')
+    args = parser.parse_args()
+
+    print(f"Startup benchmark ({args.runs} runs each, median in ms)\n")
+    for name, code in SCENARIOS.items():
+        samples = [run_scenario(code) for _ in range(args.runs)]
+        timings = ', '.join(
+            f"{key}={statistics.median(s[key] for s in samples) * 1000:.1f}"
+            for key in samples[0]
+        )
+        print(f"  {name:<58} {timings}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,8 @@ Prompt Engineering Module
 Contains all system prompts and dynamic prompt generation
 """
 
-from typing import Dict, List
+from typing import Dict, List, Tuple
+import json
 import re
 
 
@@ -42,6 +43,16 @@ I'm your Hiring Assistant, and I'm here to conduct an initial screening to under
 
 Let's get started! Could you please tell me your **full name**?"""
 
+    # Shown instead of model output when every LLM provider is busy or down
+    QUESTIONS_UNAVAILABLE = (
+        "We're experiencing very high demand right now, so your technical questions are taking longer "
+        "than usual. Please use the Retry button in a moment - your details have been saved."
+    )
+    FEEDBACK_UNAVAILABLE = (
+        "⏳ Feedback on this answer isn't available right now due to high demand. "
+        "Your answer has been recorded and will be reviewed by our team."
+    )
+
     INFORMATION_GATHERING_PROMPTS = {
         'email': "Great! Now, what's your **email address**? (We'll use this to contact you about next steps)",
         'phone': "Perfect! And your **phone number**? (We'll keep this for interview scheduling)",
@@ -60,21 +71,62 @@ You can list them separated by commas (e.g., "Python, Django, PostgreSQL, Docker
     }
 
     @staticmethod
-    def create_tech_question_prompt(tech_stack: List[str], years_exp: int) -> str:
+    def get_difficulty_level(years_exp: float) -> str:
+        """
+        Map years of experience to a question difficulty level
+        
+        Args:
+            years_exp: Years of experience
+            
+        Returns:
+            'beginner', 'intermediate' or 'advanced'
+        """
+        return "beginner" if years_exp < 2 else "intermediate" if years_exp < 5 else "advanced"
+
+    QUESTIONS_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "questions": {
+                "type": "array",
+                "items": {"type": "string"},
+                "minItems": 5,
+                "maxItems": 5
+            }
+        },
+        "required": ["questions"]
+    }
+
+    @staticmethod
+    def create_tech_question_prompt(tech_stack: List[str], years_exp: int, structured: bool = False) -> str:
         """
         Create dynamic prompt for generating technical questions
         
         Args:
             tech_stack: List of technologies
             years_exp: Years of experience
+            structured: Ask for a JSON object (QUESTIONS_SCHEMA) instead of a numbered list
             
         Returns:
             Prompt for generating technical questions
         """
-        difficulty = "beginner" if years_exp < 2 else "intermediate" if years_exp < 5 else "advanced"
+        difficulty = PromptTemplates.get_difficulty_level(years_exp)
         
         tech_list = ", ".join(tech_stack[:5])  # Limit to first 5 for clarity
         
+        if structured:
+            return f"""You are a technical interviewer. Generate exactly 5 technical interview questions for a candidate with the following profile:
+- Technical Stack: {tech_list}
+- Experience Level: {years_exp} years ({difficulty} level)
+
+Respond ONLY with a JSON object matching this JSON schema:
+{json.dumps(PromptTemplates.QUESTIONS_SCHEMA)}
+
+Rules:
+- Each array item is one full question, without numbering
+- Questions should be appropriate for {difficulty} level
+- Questions should test practical knowledge
+- Keep questions concise but complete (1-3 sentences each)"""
+        
         return f"""You are a technical interviewer. Generate exactly 5 technical interview questions for a candidate with the following profile:
 - Technical Stack: {tech_list}
 - Experience Level: {years_exp} years ({difficulty} level)
@@ -98,6 +150,47 @@ Rules:
 - No extra text, explanations, or formatting - just the numbered questions
 - Keep questions concise but complete (1-3 sentences each)"""
 
+    @staticmethod
+    def create_evaluation_system_prompt(tech: str, years_exp: int) -> str:
+        """
+        Create the instructions for evaluating a candidate's answers
+        
+        Only depends on the interview (technology and experience), not on the
+        answer, so every evaluation in an interview starts with the same text
+        and a local model can reuse its processed prompt prefix.
+        
+        Args:
+            tech: The technology being tested
+            years_exp: Years of experience
+            
+        Returns:
+            Evaluation instructions (system message)
+        """
+        return f"""You are a technical interviewer evaluating {tech} answers from a candidate with {years_exp} years of experience.
+
+Evaluate each technical response in BULLET format only.
+Respond ONLY with these 3 bullets, nothing else:
+• Assessment: [1-2 sentences on their understanding]
+• Experience Match: [Is this appropriate for {years_exp} years experience?]
+• Suggestion: [One improvement tip]
+
+DO NOT add any other text, conclusions, or messages."""
+
+    @staticmethod
+    def create_answer_prompt(question: str, answer: str) -> str:
+        """
+        Create the per-answer part of an evaluation (see create_evaluation_system_prompt)
+        
+        Args:
+            question: The question asked
+            answer: The candidate's answer
+            
+        Returns:
+            Question and answer to evaluate
+        """
+        return f"""Q: {question}
+A: {answer}"""
+
     @staticmethod
     def create_response_evaluation_prompt(question: str, answer: str, tech: str, years_exp: int) -> str:
         """
@@ -112,17 +205,61 @@ Rules:
         Returns:
             Evaluation prompt
         """
-        return f"""Evaluate this technical response in BULLET format only.
+        return (PromptTemplates.create_evaluation_system_prompt(tech, years_exp) + "\n\n" +
+                PromptTemplates.create_answer_prompt(question, answer))
+
+    # JSON schema of a batch evaluation response (one entry per answered question)
+    BATCH_EVALUATION_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "evaluations": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "question_number": {"type": "integer"},
+                        "assessment": {"type": "string"},
+                        "experience_match": {"type": "string"},
+                        "suggestion": {"type": "string"}
+                    },
+                    "required": ["question_number", "assessment", "experience_match", "suggestion"]
+                }
+            }
+        },
+        "required": ["evaluations"]
+    }
+
+    @staticmethod
+    def create_batch_evaluation_prompt(qa_pairs: List[Tuple[str, str]], tech: str, years_exp: int) -> str:
+        """
+        Create prompt for evaluating all of a candidate's answers in one request
+        
+        Args:
+            qa_pairs: List of (question, answer) tuples in interview order
+            tech: The main technology being tested
+            years_exp: Years of experience
+            
+        Returns:
+            Batch evaluation prompt
+        """
+        answers = "\n\n".join(
+            f"Question {i}: {question}\nAnswer {i}: {answer}"
+            for i, (question, answer) in enumerate(qa_pairs, 1)
+        )
+        
+        return f"""Evaluate each of these technical interview answers from a candidate with {years_exp} years of experience in {tech}.
 
-Q: {question}
-A: {answer}
+{answers}
 
-Respond ONLY with these 3 bullets, nothing else:
-• Assessment: [1-2 sentences on their understanding]
-• Experience Match: [Is this appropriate for {years_exp} years experience?]
-• Suggestion: [One improvement tip]
+Respond ONLY with a JSON object matching this JSON schema, with exactly one entry per question:
+{json.dumps(PromptTemplates.BATCH_EVALUATION_SCHEMA)}
 
-DO NOT add any other text, conclusions, or messages."""
+For each entry:
+- assessment: 1-2 sentences on their understanding
+- experience_match: Is this appropriate for {years_exp} years experience?
+- suggestion: One improvement tip
+
+DO NOT add any other text."""
 
     @staticmethod
     def create_conclusion_prompt(candidate_data: Dict, transcript: List[str]) -> str:
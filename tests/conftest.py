@@ -0,0 +1,15 @@
+"""
+Shared test setup
+Makes the project importable and keeps tests off the network and the data directory
+"""
+
+import os
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+# No model warm-up or NLP downloads when modules are imported
+os.environ.setdefault('LLM_WARMUP', 'false')
+os.environ.setdefault('NLP_WARMUP', 'false')
@@ -0,0 +1,80 @@
+"""
+Tests for CircuitBreaker in utils/llm_router.py
+"""
+
+from utils.llm_router import CircuitBreaker
+
+
+def open_breaker(reset_timeout):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=reset_timeout)
+    for _ in range(3):
+        breaker.record_failure()
+    return breaker
+
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+
+    assert breaker.record_failure() is False
+    assert breaker.record_failure() is False
+    assert breaker.allow_request()
+    assert breaker.record_failure() is True
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.is_closed
+    assert not breaker.allow_request()
+
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    breaker.record_failure()
+    breaker.record_failure()
+
+    assert breaker.record_success() is False
+    assert breaker.record_failure() is False
+    assert breaker.is_closed
+
+
+def test_lets_one_probe_through_after_the_reset_timeout():
+    breaker = open_breaker(reset_timeout=0)
+
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    # Only the one probe while half-open
+    assert not breaker.allow_request()
+
+
+def test_successful_probe_closes_the_circuit():
+    breaker = open_breaker(reset_timeout=0)
+    breaker.allow_request()
+
+    assert breaker.record_success() is True
+    assert breaker.is_closed
+    assert breaker.failures == 0
+    assert breaker.allow_request()
+
+
+def test_failed_probe_reopens_the_circuit():
+    breaker = open_breaker(reset_timeout=0)
+    breaker.allow_request()
+
+    assert breaker.record_failure() is True
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_released_probe_returns_to_open():
+    breaker = open_breaker(reset_timeout=0)
+    breaker.allow_request()
+    breaker.release()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    # The next request may probe again
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+
+def test_health_check_closes_an_open_circuit():
+    breaker = open_breaker(reset_timeout=60)
+
+    assert breaker.record_success() is True
+    assert breaker.is_closed
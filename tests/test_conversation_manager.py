@@ -0,0 +1,48 @@
+"""
+Tests for ConversationManager in utils/llm_client.py
+"""
+
+from utils.llm_client import ConversationManager
+from utils.message_log import MessageLog, View
+
+
+class StubLLMClient:
+    """Answers every request with a fixed summary"""
+
+    def generate_response(self, prompt, **kwargs):
+        return "The candidate has four years of Python."
+
+
+def make_manager(message_log=None):
+    return ConversationManager(StubLLMClient(), "You are an interviewer.", token_budget=200,
+                               summarize_evicted=True, message_log=message_log)
+
+
+def test_rebuild_context_drops_the_old_summary():
+    manager = make_manager()
+    for number in range(20):
+        manager.add_message('user', f"Answer number {number} about Python generators and decorators.")
+    manager._summarize_evicted()
+    assert manager.summary
+
+    # Everything fits again once the older turns are out of the context
+    manager.message_log.hide(View.CONTEXT, list(manager.message_log)[:-2])
+    manager.rebuild_context()
+
+    assert manager.summary == ""
+    assert manager._evicted == []
+    assert not any('Summary of the earlier conversation' in m['content'] for m in manager.build_messages())
+
+
+def test_rebuild_context_after_restore_matches_the_original_window():
+    manager = make_manager()
+    for number in range(20):
+        manager.add_message('user', f"Answer number {number} about Python generators and decorators.")
+
+    log = MessageLog()
+    log.load_state(manager.message_log.to_state())
+    restored = make_manager(log)
+    restored.rebuild_context()
+
+    assert [m.text for m, _ in restored._window] == [m.text for m, _ in manager._window]
+    assert len(restored._evicted) == len(manager._evicted)
@@ -0,0 +1,57 @@
+"""
+Tests for utils/evaluation.py
+"""
+
+from utils.evaluation import AnswerEvaluator
+from utils.cache import LRUCache
+
+QUESTION = "1. How many bits are in a byte?"
+
+
+class StubLLMClient:
+    """Records prompts and answers every one with the same feedback"""
+
+    def __init__(self):
+        self.prompts = []
+
+    def generate_response(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        return "• Assessment: Correct.\n• Experience Match: Fine.\n• Suggestion: None."
+
+
+def test_numeric_answer_gets_a_real_evaluation():
+    client = StubLLMClient()
+    evaluator = AnswerEvaluator(client)
+
+    assert AnswerEvaluator.short_circuit(QUESTION, "8.") is None
+    feedback = evaluator.evaluate(QUESTION, "8.", "Python", 3)
+
+    assert len(client.prompts) == 1
+    assert feedback != AnswerEvaluator.NO_ANSWER_FEEDBACK
+
+
+def test_answer_numbering_is_part_of_the_answer():
+    first = AnswerEvaluator.make_key(QUESTION, "1. because of GIL", "Python", 3)
+    second = AnswerEvaluator.make_key(QUESTION, "2. because of GIL", "Python", 3)
+    assert first != second
+    assert AnswerEvaluator.normalize("3: O(n log n)").startswith("3")
+
+
+def test_question_numbering_does_not_change_the_key():
+    numbered = AnswerEvaluator.make_key(QUESTION, "Eight", "Python", 3)
+    plain = AnswerEvaluator.make_key("How many bits are in a byte?", "  eight ", "python", 3)
+    assert numbered == plain
+
+
+def test_cached_evaluation_is_not_shared_between_different_answers():
+    client = StubLLMClient()
+    evaluator = AnswerEvaluator(client, cache=LRUCache(16))
+    evaluator.evaluate(QUESTION, "1. because of GIL", "Python", 3)
+    evaluator.evaluate(QUESTION, "2. because of GIL", "Python", 3)
+    assert len(client.prompts) == 2
+
+
+def test_explicit_non_answers_short_circuit():
+    assert AnswerEvaluator.short_circuit(QUESTION, "I don't know.") == AnswerEvaluator.NOT_KNOWN_FEEDBACK
+    assert AnswerEvaluator.short_circuit(QUESTION, "   ") == AnswerEvaluator.NO_ANSWER_FEEDBACK
+    assert AnswerEvaluator.short_circuit(QUESTION, "no") is None
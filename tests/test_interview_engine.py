@@ -0,0 +1,161 @@
+"""
+Tests for the interview steps of InterviewEngine in utils/interview_engine.py
+
+Runs the engine against the mock LLM server from benchmarks/.
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from utils.interview_engine import InterviewStateError, create_interview_engine
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'benchmarks'))
+from mock_llm_server import MockConfig, start_server  # noqa: E402
+
+PROFILE = {
+    'name': 'Ada Lovelace',
+    'email': 'ada@example.com',
+    'phone': '+44 20 7946 0000',
+    'years_of_experience': 4,
+    'location': 'London',
+    'desired_positions': 'Backend Developer',
+    'tech_stack': 'Python, Django, PostgreSQL',
+}
+ANSWER = "I would use a decorator to wrap the function and add caching around it."
+
+
+@pytest.fixture(scope='module')
+def engine(tmp_path_factory):
+    data_dir = tmp_path_factory.mktemp('engine')
+    server = start_server(0, MockConfig(latency=0, jitter=0, tokens_per_second=0))
+    with pytest.MonkeyPatch.context() as env:
+        env.setenv('LLM_PROVIDER', 'ollama')
+        env.setenv('LLM_FALLBACK_PROVIDERS', '')
+        env.setenv('OLLAMA_BASE_URL', f"http://127.0.0.1:{server.server_port}")
+        env.setenv('ASYNC_EVALUATION', 'false')
+        env.setenv('QUESTION_CACHE_PATH', str(data_dir / 'question_cache.db'))
+        env.setenv('TRANSCRIPT_LOG_DIR', str(data_dir / 'transcripts'))
+        # Candidates and transcripts are saved under ./data
+        env.chdir(data_dir)
+        interview_engine = create_interview_engine()
+        yield interview_engine
+        interview_engine.transcript_log.close()
+    server.shutdown()
+
+
+def started(engine):
+    session = engine.new_session()
+    engine.start_interview(session, PROFILE)
+    assert session.technical_questions
+    return session
+
+
+def answers(session):
+    return [m for m in session.interview_transcript if m.role.value == 'user']
+
+
+def conclusions(session):
+    return [m for m in session.chat_history if 'Interview Summary' in m.text]
+
+
+def test_start_twice_is_refused(engine):
+    session = started(engine)
+
+    with pytest.raises(InterviewStateError):
+        engine.start_interview(session, PROFILE)
+    assert session.question_index == 0
+
+
+def test_answering_every_question_ends_the_interview_once(engine):
+    session = started(engine)
+
+    for index in range(len(session.technical_questions)):
+        assert session.conversation_active
+        assert engine.submit_answer(session, ANSWER, question_index=index)
+
+    assert not session.conversation_active
+    assert session.conversation_stage == 'conclusion'
+    assert len(conclusions(session)) == 1
+
+
+def test_steps_after_the_end_are_refused(engine):
+    session = started(engine)
+    engine.end_interview(session)
+    messages = len(session.messages)
+
+    with pytest.raises(InterviewStateError):
+        engine.submit_answer(session, ANSWER)
+    assert engine.end_interview(session) == []
+    assert len(session.messages) == messages
+    assert len(conclusions(session)) == 1
+
+
+def test_concurrent_final_answers_conclude_once(engine):
+    session = started(engine)
+    last = len(session.technical_questions) - 1
+    for index in range(last):
+        engine.submit_answer(session, ANSWER, question_index=index)
+
+    barrier = threading.Barrier(2)
+    outcomes = []
+
+    def submit():
+        barrier.wait()
+        try:
+            engine.submit_answer(session, ANSWER)
+            outcomes.append('answered')
+        except InterviewStateError:
+            outcomes.append('refused')
+
+    threads = [threading.Thread(target=submit) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    assert sorted(outcomes) == ['answered', 'refused']
+    assert len(conclusions(session)) == 1
+    assert len(answers(session)) == len(session.technical_questions)
+
+
+def test_answer_for_an_earlier_question_is_refused(engine):
+    session = started(engine)
+    engine.submit_answer(session, ANSWER, question_index=0)
+
+    with pytest.raises(InterviewStateError, match="Question 1"):
+        engine.submit_answer(session, ANSWER, question_index=0)
+    assert session.question_index == 1
+    assert len(answers(session)) == 1
+
+
+def test_answer_before_the_questions_is_refused(engine):
+    session = engine.new_session()
+
+    with pytest.raises(InterviewStateError):
+        engine.submit_answer(session, ANSWER)
+    assert engine.submit_answer(session, "   ") == []
+
+
+def test_exit_keyword_ends_the_interview(engine):
+    session = started(engine)
+
+    engine.submit_answer(session, "goodbye")
+
+    assert not session.conversation_active
+    assert len(conclusions(session)) == 1
+
+
+def test_restored_session_keeps_numbering_turns(engine):
+    session = started(engine)
+    engine.submit_answer(session, ANSWER, question_index=0)
+
+    restored = engine.restore_session(session.to_state())
+
+    assert restored.turn == session.turn
+    assert restored.question_index == session.question_index
+    assert restored.technical_questions == session.technical_questions
+    engine.submit_answer(restored, ANSWER, question_index=1)
+    assert restored.turn > session.turn
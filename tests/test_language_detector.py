@@ -0,0 +1,39 @@
+"""
+Tests for utils/language_detector.py
+"""
+
+from utils.language_detector import LanguageHandler, SessionLanguageDetector
+
+
+def test_short_chinese_answer_is_detected():
+    assert LanguageHandler.is_linguistic("我不知道")
+    assert LanguageHandler.detect_language("我不知道") == 'zh-cn'
+
+
+def test_short_japanese_answer_is_detected():
+    assert LanguageHandler.detect_language("私はPythonを使います") == 'ja'
+
+
+def test_short_hindi_answer_reaches_detection():
+    # Vowel signs are combining marks, not letters
+    assert LanguageHandler.is_linguistic("मुझे नहीं पता")
+
+
+def test_inputs_without_language_are_skipped():
+    for text in ("知", "jane@example.com", "+1 555 123 4567", "https://example.com", "hi"):
+        assert not LanguageHandler.is_linguistic(text)
+
+
+def test_session_locks_on_a_short_cjk_language():
+    detector = SessionLanguageDetector()
+    detector.observe("我不知道")
+    detector.observe("我用过它")
+    assert detector.locked and detector.language == 'zh-cn'
+
+
+def test_session_detector_state_round_trip():
+    detector = SessionLanguageDetector()
+    detector.observe("我不知道")
+    restored = SessionLanguageDetector()
+    restored.restore(detector.state())
+    assert restored.state() == detector.state()
@@ -0,0 +1,77 @@
+"""
+Tests for MessageLog and MessageView in utils/message_log.py
+"""
+
+from utils.message_log import MessageLog, View
+
+
+def make_log():
+    log = MessageLog()
+    for number in range(6):
+        views = View.CHAT | View.TRANSCRIPT if number % 2 else View.CHAT | View.CONTEXT
+        log.append('user' if number % 2 else 'assistant', f"message {number}", views)
+    return log
+
+
+def naive(log, view):
+    return [message for message in log if message.views & view]
+
+
+def test_view_follows_hide_and_show():
+    log = make_log()
+    chat = log.view(View.CHAT)
+    assert len(chat) == 6
+
+    log.hide(View.CHAT, [log[1], log[4]])
+    assert len(chat) == 4
+    assert list(chat) == naive(log, View.CHAT)
+    assert [message.text for message in chat] == ["message 0", "message 2", "message 3", "message 5"]
+    assert chat[0] is log[0]
+    assert chat[-1] is log[5]
+    assert chat[1:3] == [log[2], log[3]]
+
+    log.show(View.CHAT, [log[4]])
+    assert [message.text for message in chat] == ["message 0", "message 2", "message 3",
+                                                  "message 4", "message 5"]
+    assert chat[3] is log[4]
+
+
+def test_hide_without_messages_empties_the_view():
+    log = make_log()
+    log.hide(View.CONTEXT)
+
+    assert len(log.view(View.CONTEXT)) == 0
+    assert len(log.view(View.CHAT)) == 6
+    assert len(log) == 6
+
+
+def test_combined_views():
+    log = make_log()
+    log.hide(View.TRANSCRIPT, [log[1]])
+    combined = log.view(View.TRANSCRIPT | View.CONTEXT)
+
+    assert list(combined) == naive(log, View.TRANSCRIPT | View.CONTEXT)
+    assert log[1] not in list(combined)
+
+
+def test_since_matches_a_filter_of_the_log():
+    log = make_log()
+    log.hide(View.CHAT, [log[2], log[3]])
+
+    for position in range(len(log) + 1):
+        expected = [message for message in log[position:] if message.views & View.CHAT]
+        assert log.since(position, View.CHAT) == expected
+
+
+def test_state_round_trip_keeps_views():
+    log = make_log()
+    log.append('assistant', "feedback", View.CHAT, question=2, pending=True)
+    log.hide(View.CHAT, [log[0]])
+
+    restored = MessageLog()
+    restored.load_state(log.to_state())
+
+    assert [m.text for m in restored.view(View.CHAT)] == [m.text for m in log.view(View.CHAT)]
+    assert [m.text for m in restored.view(View.CONTEXT)] == [m.text for m in log.view(View.CONTEXT)]
+    assert restored[-1].question == 2
+    assert restored[-1].pending
@@ -0,0 +1,116 @@
+"""
+Tests for RateLimiter in utils/rate_limiter.py
+"""
+
+import threading
+import time
+
+import pytest
+
+from utils.rate_limiter import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, RateLimiter, RateLimitExceeded
+
+
+def wait_for_queue(limiter, depth, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while limiter.queue_depth() < depth:
+        assert time.monotonic() < deadline, "requests did not queue"
+        time.sleep(0.005)
+
+
+def test_unlimited_limiter_admits_immediately():
+    limiter = RateLimiter('test')
+
+    assert not limiter.enabled
+    for _ in range(100):
+        assert limiter.acquire(tokens=1000) == 0.0
+
+
+def test_exhausted_bucket_delays_the_next_request():
+    # 10 requests per second, a burst of one request
+    limiter = RateLimiter('test', requests_per_minute=600, burst_seconds=0.1)
+
+    assert limiter.acquire() < 0.05
+    waited = limiter.acquire()
+    assert 0.05 <= waited < 0.5
+
+
+def test_token_bucket_limits_large_requests():
+    # 1000 tokens per second, a burst of 100
+    limiter = RateLimiter('test', tokens_per_minute=60000, burst_seconds=0.1)
+
+    limiter.acquire(tokens=100)
+    waited = limiter.acquire(tokens=100)
+    assert 0.05 <= waited < 0.5
+
+
+def test_interactive_requests_overtake_queued_background_work():
+    limiter = RateLimiter('test', requests_per_minute=600, burst_seconds=0.1)
+    limiter.acquire()
+    limiter.pause(0.3)
+
+    admitted = []
+
+    def request(label, priority):
+        limiter.acquire(priority=priority)
+        admitted.append(label)
+
+    background = threading.Thread(target=request, args=('background', PRIORITY_BACKGROUND))
+    background.start()
+    wait_for_queue(limiter, 1)
+    interactive = threading.Thread(target=request, args=('interactive', PRIORITY_INTERACTIVE))
+    interactive.start()
+    background.join(timeout=5)
+    interactive.join(timeout=5)
+
+    assert admitted == ['interactive', 'background']
+    assert limiter.queue_depth() == 0
+
+
+def test_full_queue_is_refused():
+    limiter = RateLimiter('test', requests_per_minute=600, max_queued=1, burst_seconds=0.1)
+    limiter.acquire()
+    limiter.pause(0.3)
+
+    waiting = threading.Thread(target=limiter.acquire)
+    waiting.start()
+    wait_for_queue(limiter, 1)
+    with pytest.raises(RateLimitExceeded, match="queue is full") as raised:
+        limiter.acquire()
+    waiting.join(timeout=5)
+
+    assert raised.value.retry_after > 0
+    assert limiter.queue_depth() == 0
+
+
+def test_request_that_would_wait_too_long_is_refused():
+    # One request per minute: the second would wait about a minute
+    limiter = RateLimiter('test', requests_per_minute=1, burst_seconds=1)
+    limiter.acquire()
+
+    started = time.monotonic()
+    with pytest.raises(RateLimitExceeded) as raised:
+        limiter.acquire(timeout=1.0)
+
+    assert time.monotonic() - started < 0.5
+    assert raised.value.retry_after > 1.0
+    assert limiter.queue_depth() == 0
+
+
+def test_pause_delays_admission():
+    limiter = RateLimiter('test', requests_per_minute=6000)
+    limiter.pause(0.2)
+
+    waited = limiter.acquire()
+    assert 0.15 <= waited < 1.0
+
+
+def test_pause_applies_to_an_unlimited_limiter():
+    limiter = RateLimiter('test')
+    limiter.pause(0.2)
+
+    with pytest.raises(RateLimitExceeded) as raised:
+        limiter.acquire(timeout=0.05)
+    assert raised.value.retry_after > 0.05
+
+    assert limiter.acquire() >= 0.1
+    assert limiter.acquire() == 0.0
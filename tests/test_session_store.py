@@ -0,0 +1,128 @@
+"""
+Tests for SQLiteSessionStore in utils/session_store.py
+"""
+
+import sqlite3
+
+import pytest
+
+from utils.interview_engine import InterviewSession
+from utils.llm_client import ConversationManager
+from utils.session_store import SQLiteSessionStore, decode_state
+
+
+def restore(state):
+    return InterviewSession.from_state(state, ConversationManager(None, "You are an interviewer."))
+
+
+def new_session():
+    session = InterviewSession(ConversationManager(None, "You are an interviewer."))
+    session.conversation_stage = 'questions'
+    session.technical_questions = ["What is a decorator?", "What is the GIL?"]
+    return session
+
+
+@pytest.fixture
+def open_store(tmp_path):
+    stores = []
+
+    def open_store(flush_interval=0.01):
+        store = SQLiteSessionStore(restore, str(tmp_path / 'sessions.db'), flush_interval=flush_interval)
+        stores.append(store)
+        return store
+
+    yield open_store
+    for store in stores:
+        store.close()
+
+
+def stored_row(store, session_id):
+    with sqlite3.connect(store.db_path) as conn:
+        version, state = conn.execute(
+            "SELECT version, state FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+    return version, decode_state(state)
+
+
+def test_saved_session_is_resumed_by_another_store(open_store):
+    first, second = open_store(), open_store()
+    session = new_session()
+    first.add(session)
+    session.question_index = 1
+    first.save(session)
+    assert first.flush(timeout=5)
+
+    resumed = second.get(session.interview_id)
+
+    assert resumed is not session
+    assert resumed.version == session.version == 2
+    assert resumed.question_index == 1
+    assert resumed.technical_questions == session.technical_questions
+    assert second.get('unknown') is None
+
+
+def test_newer_version_from_another_store_is_reloaded(open_store):
+    first, second = open_store(), open_store()
+    session = new_session()
+    first.add(session)
+    assert first.flush(timeout=5)
+
+    elsewhere = second.get(session.interview_id)
+    elsewhere.question_index = 1
+    second.save(elsewhere)
+    assert second.flush(timeout=5)
+
+    reloaded = first.get(session.interview_id)
+    assert reloaded is not session
+    assert reloaded.version == elsewhere.version
+    assert reloaded.question_index == 1
+    # Unchanged since: the copy in memory is kept
+    assert first.get(session.interview_id) is reloaded
+
+
+def test_stale_write_does_not_overwrite_a_newer_version(open_store):
+    first, second = open_store(), open_store()
+    session = new_session()
+    first.add(session)
+    assert first.flush(timeout=5)
+
+    elsewhere = second.get(session.interview_id)
+    elsewhere.question_index = 1
+    second.save(elsewhere)
+    assert second.flush(timeout=5)
+
+    # The first store's outdated copy reaches the same version number
+    session.conversation_stage = 'conclusion'
+    first.save(session)
+    assert first.flush(timeout=5)
+
+    version, state = stored_row(first, session.interview_id)
+    assert version == elsewhere.version
+    assert state['question_index'] == 1
+    assert state['stage'] == 'questions'
+
+
+def test_close_writes_pending_saves(open_store):
+    store = open_store(flush_interval=0.5)
+    session = new_session()
+    store.add(session)
+    session.question_index = 1
+    store.save(session)
+    store.close()
+
+    with pytest.raises(ValueError):
+        store.save(session)
+    resumed = open_store().get(session.interview_id)
+    assert resumed.question_index == 1
+
+
+def test_deleted_session_is_not_resumed(open_store):
+    first, second = open_store(), open_store()
+    session = new_session()
+    first.add(session)
+    assert first.flush(timeout=5)
+
+    first.delete(session.interview_id)
+
+    assert first.get(session.interview_id) is None
+    assert second.get(session.interview_id) is None
@@ -3,54 +3,49 @@ Candidate Data Management Module
 Handles storage, retrieval, and privacy of candidate information
 """
 
-import json
 import os
 from datetime import datetime
 from typing import Dict, Optional, List
 import hashlib
 
+from utils.storage import CandidateStore, create_store
+
 
 class CandidateDataManager:
     """Manages candidate data storage and privacy"""
 
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", store: Optional[CandidateStore] = None):
         """
         Initialize Candidate Data Manager
         
         Args:
             data_dir: Directory for storing candidate data
+            store: Storage backend (defaults to the one selected by STORAGE_BACKEND)
         """
         self.data_dir = data_dir
         os.makedirs(data_dir, exist_ok=True)
+        self.store = store or create_store(data_dir=data_dir)
 
-    def save_candidate(self, candidate_data: Dict) -> str:
+    def save_candidate(self, candidate_data: Dict, candidate_id: Optional[str] = None) -> str:
         """
         Save candidate information securely
         
         Args:
             candidate_data: Dictionary containing candidate information
+            candidate_id: Known candidate ID (derived from the email otherwise)
             
         Returns:
             Candidate ID (anonymized hash)
         """
         # Generate anonymized ID
-        candidate_id = self._generate_candidate_id(candidate_data.get('email', ''))
+        candidate_id = candidate_id or self.candidate_id_for(candidate_data.get('email', ''))
         
         # Anonymize sensitive data
         anonymized_data = self._anonymize_data(candidate_data, candidate_id)
         
-        # Save to file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"candidates_{timestamp}.json"
-        filepath = os.path.join(self.data_dir, filename)
-        
-        try:
-            with open(filepath, 'w') as f:
-                json.dump(anonymized_data, f, indent=2)
+        if self.store.save_candidate(anonymized_data):
             return candidate_id
-        except Exception as e:
-            print(f"Error saving candidate data: {str(e)}")
-            return None
+        return None
 
     def save_interview_transcript(self, candidate_id: str, transcript: List[Dict]) -> bool:
         """
@@ -63,19 +58,9 @@ class CandidateDataManager:
         Returns:
             Success status
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"interview_{candidate_id}_{timestamp}.json"
-        filepath = os.path.join(self.data_dir, filename)
-        
-        try:
-            with open(filepath, 'w') as f:
-                json.dump(transcript, f, indent=2)
-            return True
-        except Exception as e:
-            print(f"Error saving interview transcript: {str(e)}")
-            return False
-
-    def _generate_candidate_id(self, email: str) -> str:
+        return self.store.save_transcript(candidate_id, transcript)
+
+    def candidate_id_for(self, email: str) -> str:
         """
         Generate anonymized candidate ID using hashing
         
@@ -106,6 +91,7 @@ class CandidateDataManager:
             "desired_positions": candidate_data.get('desired_positions', []),
             "tech_stack": candidate_data.get('tech_stack', []),
             "location": candidate_data.get('location'),
+            "sentiment": candidate_data.get('sentiment'),
             # Note: Email, phone, and full name are NOT stored for privacy
         }
         return anonymized
@@ -154,6 +140,18 @@ class SensitiveDataHandler:
         
         return f"***-***-{phone[-4:]}"
 
+    @staticmethod
+    def mask_candidate_data(candidate_data: Dict) -> Dict:
+        """Copy of candidate data without contact details: first name only, masked email and phone"""
+        masked = dict(candidate_data)
+        if masked.get('name'):
+            masked['name'] = masked['name'].split()[0]
+        if 'email' in masked:
+            masked['email'] = SensitiveDataHandler.mask_email(masked['email'])
+        if 'phone' in masked:
+            masked['phone'] = SensitiveDataHandler.mask_phone(masked['phone'])
+        return masked
+
     @staticmethod
     def sanitize_input(user_input: str) -> str:
         """Sanitize user input to prevent injection attacks"""
@@ -0,0 +1,463 @@
+"""
+Answer Evaluation Module
+Evaluates candidate answers and runs evaluations off the interview's critical path
+"""
+
+import hashlib
+import json
+import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from prompts.prompt_templates import ConversationFlow, PromptTemplates
+from utils.cache import LRUCache
+from utils.llm_client import LLMClient, LLMUnavailableError
+from utils.metrics import metrics
+from utils.question_parser import QUESTION_START_PATTERN
+from utils.rate_limiter import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE
+
+# Answers that say the candidate does not know, after normalization. One-word
+# answers such as "no" or "none" are left to the model: they can be correct
+# answers ("Is a tuple mutable?")
+NON_ANSWER_PATTERN = re.compile(
+    r"^(?:i )?(?:(?:really |honestly )?(?:do not|dont|don't) know|dunno|idk|no idea|not sure|no clue|"
+    r"(?:have )?never (?:used|heard of) (?:it|this|that)|skip(?: this(?: one| question)?)?)$"
+)
+NORMALIZE_PATTERN = re.compile(r"[^\w\s'/]")
+
+
+class AnswerEvaluator:
+    """Produces short bullet-point feedback for technical answers"""
+
+    BATCH_SYSTEM_MESSAGE = "You are a technical interviewer. Respond ONLY with a JSON object. No other text."
+
+    # Feedback for answers that are not worth a model call
+    NO_ANSWER_FEEDBACK = (
+        "• Assessment: No answer was given to this question.\n"
+        "• Experience Match: Cannot be assessed without an answer.\n"
+        "• Suggestion: Even a partial answer helps - explain how you would approach the problem."
+    )
+    NOT_KNOWN_FEEDBACK = (
+        "• Assessment: The candidate did not attempt an answer.\n"
+        "• Experience Match: Cannot be assessed without an answer.\n"
+        "• Suggestion: Share what you do know or how you would find out - reasoning counts too."
+    )
+    REPEATED_QUESTION_FEEDBACK = (
+        "• Assessment: The answer repeats the question without answering it.\n"
+        "• Experience Match: Cannot be assessed without an answer.\n"
+        "• Suggestion: Answer in your own words, with an example from your experience."
+    )
+
+    def __init__(self, llm_client: LLMClient, cache: Optional[LRUCache] = None):
+        """
+        Initialize Answer Evaluator
+
+        Args:
+            llm_client: Initialized LLM client
+            cache: Cache of feedback by normalized question, answer and level
+                (shared across sessions; None disables caching)
+        """
+        self.llm_client = llm_client
+        self.cache = cache
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """
+        Lowercase and collapse whitespace
+
+        Used as is for answers: numbers and punctuation can be the answer
+        ("8.", "3: O(n log n)").
+        """
+        return ' '.join(text.lower().replace('’', "'").split())
+
+    @staticmethod
+    def normalize_question(text: str) -> str:
+        """Normalize a question, dropping its numbering and punctuation"""
+        match = QUESTION_START_PATTERN.match(text)
+        if match:
+            text = match.group('text')
+        return AnswerEvaluator._words(text)
+
+    @staticmethod
+    def _words(text: str) -> str:
+        """Normalized words only, for matching phrases"""
+        return ' '.join(NORMALIZE_PATTERN.sub(' ', AnswerEvaluator.normalize(text)).split())
+
+    @staticmethod
+    def make_key(question: str, answer: str, tech: str, years_exp: int) -> str:
+        """
+        Build the cache key of an evaluation
+
+        Years of experience are bucketed into the difficulty level, since the
+        evaluation prompt is only meaningfully different per level.
+        """
+        raw = '|'.join((
+            AnswerEvaluator.normalize_question(question),
+            AnswerEvaluator.normalize(answer),
+            tech.strip().lower(),
+            PromptTemplates.get_difficulty_level(years_exp),
+        ))
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    @staticmethod
+    def short_circuit(question: str, answer: str) -> Optional[str]:
+        """
+        Feedback for empty or non-answers, which never need the model
+
+        Args:
+            question: The question asked
+            answer: The candidate's answer
+
+        Returns:
+            Canned feedback, or None if the answer needs a real evaluation
+        """
+        if not any(ch.isalnum() for ch in answer):
+            return AnswerEvaluator.NOT_KNOWN_FEEDBACK if '?' in answer else AnswerEvaluator.NO_ANSWER_FEEDBACK
+        words = AnswerEvaluator._words(answer)
+        if ConversationFlow.should_exit(answer) or NON_ANSWER_PATTERN.match(words):
+            return AnswerEvaluator.NOT_KNOWN_FEEDBACK
+        if words == AnswerEvaluator.normalize_question(question):
+            return AnswerEvaluator.REPEATED_QUESTION_FEEDBACK
+        return None
+
+    def lookup(self, question: str, answer: str, tech: str, years_exp: int) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Find feedback that does not need a model call
+
+        Returns:
+            Tuple of (feedback or None, cache key or None)
+        """
+        feedback = self.short_circuit(question, answer)
+        if feedback is not None:
+            metrics.increment('evaluation.short_circuit')
+            return feedback, None
+        if self.cache is None:
+            return None, None
+
+        key = self.make_key(question, answer, tech, years_exp)
+        feedback = self.cache.get(key)
+        metrics.increment('evaluation.cache_hit' if feedback is not None else 'evaluation.cache_miss')
+        return feedback, key
+
+    def _remember(self, key: Optional[str], feedback: str):
+        """Cache feedback, unless it is too short to be useful"""
+        if key is not None and self.cache is not None and len(feedback) > 10:
+            self.cache.set(key, feedback)
+
+    def evaluate(self, question: str, answer: str, tech: str, years_exp: int,
+                 priority: int = PRIORITY_BACKGROUND) -> str:
+        """
+        Evaluate an answer
+
+        Args:
+            question: The question asked
+            answer: The candidate's answer
+            tech: The technology being tested
+            years_exp: Years of experience
+            priority: LLM admission priority (background by default, as this runs on the worker pool)
+
+        Returns:
+            Cleaned-up feedback text
+
+        Raises:
+            LLMUnavailableError: If no LLM provider could answer
+        """
+        feedback, key = self.lookup(question, answer, tech, years_exp)
+        if feedback is not None:
+            return feedback
+
+        evaluation = self.llm_client.generate_response(
+            PromptTemplates.create_answer_prompt(question, answer),
+            system_message=PromptTemplates.create_evaluation_system_prompt(tech, years_exp),
+            temperature=0.6,
+            max_tokens=250,
+            priority=priority
+        )
+        feedback = self.extract_feedback(evaluation)
+        self._remember(key, feedback)
+        return feedback
+
+    def evaluate_stream(self, question: str, answer: str, tech: str, years_exp: int) -> Iterator[str]:
+        """
+        Evaluate an answer, yielding the raw evaluation as it is generated
+
+        Raises:
+            LLMUnavailableError: If no LLM provider could answer (before the first chunk)
+        """
+        feedback, key = self.lookup(question, answer, tech, years_exp)
+        if feedback is not None:
+            yield feedback
+            return
+
+        chunks = []
+        for chunk in self.llm_client.generate_response_stream(
+            PromptTemplates.create_answer_prompt(question, answer),
+            system_message=PromptTemplates.create_evaluation_system_prompt(tech, years_exp),
+            temperature=0.6,
+            max_tokens=250
+        ):
+            chunks.append(chunk)
+            yield chunk
+        self._remember(key, self.extract_feedback(''.join(chunks)))
+
+    def evaluate_batch(self, qa_pairs: List[Tuple[str, str]], tech: str, years_exp: int) -> List[Optional[str]]:
+        """
+        Evaluate all answers of an interview in a single request
+        
+        Answers with canned or cached feedback are left out of the request.
+        Answers the model skipped or that could not be parsed are evaluated
+        individually, so the result always has one entry per answer.
+        That entry is None if the individual evaluation failed as well.
+
+        Args:
+            qa_pairs: List of (question, answer) tuples in interview order
+            tech: The main technology being tested
+            years_exp: Years of experience
+
+        Returns:
+            Feedback text per answer, in the same order
+
+        Raises:
+            LLMUnavailableError: If no LLM provider could answer the batch request
+        """
+        feedback: List[Optional[str]] = []
+        keys: List[Optional[str]] = []
+        for question, answer in qa_pairs:
+            known, key = self.lookup(question, answer, tech, years_exp)
+            feedback.append(known)
+            keys.append(key)
+
+        # Only answers without cached or canned feedback go to the model
+        remaining = [i for i, known in enumerate(feedback) if known is None]
+        if not remaining:
+            return feedback
+
+        pending_pairs = [qa_pairs[i] for i in remaining]
+        response = self.llm_client.generate_response(
+            PromptTemplates.create_batch_evaluation_prompt(pending_pairs, tech, years_exp),
+            system_message=self.BATCH_SYSTEM_MESSAGE,
+            temperature=0.6,
+            max_tokens=min(150 * len(pending_pairs) + 100, 1500),
+            json_mode=True,
+            priority=PRIORITY_INTERACTIVE
+        )
+        entries = self.parse_batch_evaluation(response, len(pending_pairs))
+        metrics.increment('evaluation.batch_requests')
+
+        for i, entry in zip(remaining, entries):
+            if entry is not None:
+                feedback[i] = self.format_feedback(entry)
+                self._remember(keys[i], feedback[i])
+            else:
+                metrics.increment('evaluation.batch_fallbacks')
+                question, answer = qa_pairs[i]
+                try:
+                    feedback[i] = self.evaluate(question, answer, tech, years_exp, PRIORITY_INTERACTIVE)
+                except LLMUnavailableError as e:
+                    print(f"[Evaluation] Could not evaluate answer {i + 1}: {str(e)}")
+        return feedback
+
+    @staticmethod
+    def parse_batch_evaluation(response: str, count: int) -> List[Optional[Dict[str, str]]]:
+        """
+        Parse a batch evaluation response (see PromptTemplates.BATCH_EVALUATION_SCHEMA)
+
+        Args:
+            response: Raw LLM response
+            count: Number of answers that were evaluated
+
+        Returns:
+            One evaluation dict per answer, or None where it is missing or invalid
+        """
+        entries: List[Optional[Dict[str, str]]] = [None] * count
+        start, end = response.find('{'), response.rfind('}')
+        if start == -1 or end <= start:
+            return entries
+        try:
+            evaluations = json.loads(response[start:end + 1]).get('evaluations', [])
+        except (ValueError, AttributeError):
+            return entries
+        if not isinstance(evaluations, list):
+            return entries
+
+        for position, item in enumerate(evaluations):
+            if not isinstance(item, dict):
+                continue
+            if not all(isinstance(item.get(field), str) and item[field].strip()
+                       for field in ('assessment', 'experience_match', 'suggestion')):
+                continue
+            number = item.get('question_number')
+            index = number - 1 if isinstance(number, int) else position
+            if 0 <= index < count and entries[index] is None:
+                entries[index] = item
+        return entries
+
+    @staticmethod
+    def format_feedback(entry: Dict[str, str]) -> str:
+        """Format a structured evaluation as the usual three feedback bullets"""
+        return (
+            f"• Assessment: {entry['assessment'].strip()}\n"
+            f"• Experience Match: {entry['experience_match'].strip()}\n"
+            f"• Suggestion: {entry['suggestion'].strip()}"
+        )
+
+    @staticmethod
+    def extract_feedback(evaluation: str) -> str:
+        """
+        Extract only the feedback bullet points from a raw evaluation
+
+        Args:
+            evaluation: Raw LLM evaluation
+
+        Returns:
+            Feedback text
+        """
+        # Extract only the bullet points - remove everything before first bullet
+        lines = evaluation.split('\n')
+        feedback_lines = []
+
+        for line in lines:
+            line_stripped = line.strip()
+            # Look for lines starting with bullet point or containing "Assessment", "Experience", "Suggestion"
+            if line_stripped.startswith('•') or line_stripped.startswith('-') or line_stripped.startswith('*'):
+                feedback_lines.append(line_stripped)
+            elif any(keyword in line_stripped for keyword in ['Assessment:', 'Experience:', 'Suggestion:', 'Experience Match:', 'Improvement:']):
+                feedback_lines.append(line_stripped)
+            # Stop if we hit unwanted content
+            elif any(keyword in line_stripped for keyword in ['Thank you', 'Interview Summary', 'Good luck', 'Next Steps', 'Name:', 'Years']):
+                break
+
+        # Reconstruct feedback
+        if feedback_lines:
+            evaluation = '\n'.join(feedback_lines)
+        else:
+            # Fallback: take first 3-4 lines
+            evaluation = '\n'.join(lines[:min(4, len(lines))])
+
+        return evaluation.strip()
+
+
+class EvaluationQueue:
+    """Per-session queue of evaluation jobs and their completed results"""
+
+    def __init__(self):
+        self._waiting: Deque[Tuple[Hashable, Callable, tuple]] = deque()
+        self._results: List[Tuple[Hashable, Any]] = []
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    def pending_count(self) -> int:
+        """Number of jobs queued or running"""
+        with self._condition:
+            return len(self._waiting) + self._in_flight
+
+    def has_completed(self) -> bool:
+        """Whether any results are ready to be collected"""
+        with self._condition:
+            return bool(self._results)
+
+    def drain(self) -> List[Tuple[Hashable, Any]]:
+        """Collect (and remove) all completed (job_id, result) pairs in completion order"""
+        with self._condition:
+            results, self._results = self._results, []
+            return results
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued job has finished
+
+        Args:
+            timeout: Maximum seconds to wait (None to wait indefinitely)
+
+        Returns:
+            True if the queue is idle, False on timeout
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._waiting and self._in_flight == 0, timeout=timeout
+            )
+
+
+class EvaluationExecutor:
+    """
+    Bounded worker pool shared by all sessions
+
+    Each session may only have ``per_session_concurrency`` jobs running at a
+    time; its other jobs wait in its own queue. A session with a backlog
+    therefore cannot occupy every worker and starve other candidates. When
+    the number of queued jobs across all sessions reaches ``max_queued``,
+    new submissions are refused so callers can fall back to evaluating inline.
+    """
+
+    def __init__(self, max_workers: int = 4, per_session_concurrency: int = 1, max_queued: int = 200):
+        """
+        Initialize Evaluation Executor
+
+        Args:
+            max_workers: Maximum number of evaluations running at the same time
+            per_session_concurrency: Maximum running evaluations per session
+            max_queued: Maximum queued or running evaluations across all sessions
+        """
+        self.per_session_concurrency = per_session_concurrency
+        self.max_queued = max_queued
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='evaluation')
+        self._lock = threading.Lock()
+        self._queued = 0
+
+    def submit(self, queue: EvaluationQueue, job_id: Hashable, fn: Callable, *args) -> bool:
+        """
+        Queue an evaluation for a session
+
+        Args:
+            queue: The session's evaluation queue
+            job_id: Identifier returned with the result
+            fn: Function producing the result
+            *args: Arguments for fn
+
+        Returns:
+            True if queued, False if the executor is saturated
+        """
+        with self._lock:
+            if self._queued >= self.max_queued:
+                metrics.increment('evaluation.rejected')
+                return False
+            self._queued += 1
+            metrics.set_gauge('evaluation.queued', self._queued)
+
+        with queue._condition:
+            queue._waiting.append((job_id, fn, args))
+        self._dispatch(queue)
+        return True
+
+    def _dispatch(self, queue: EvaluationQueue):
+        """Start the session's waiting jobs up to its concurrency limit"""
+        with queue._condition:
+            while queue._waiting and queue._in_flight < self.per_session_concurrency:
+                job_id, fn, args = queue._waiting.popleft()
+                queue._in_flight += 1
+                self._executor.submit(self._run, queue, job_id, fn, args)
+
+    def _run(self, queue: EvaluationQueue, job_id: Hashable, fn: Callable, args: tuple):
+        """Run one job on a worker and hand its result back to the session"""
+        try:
+            result = fn(*args)
+        except Exception as e:
+            print(f"[Evaluation] Background evaluation failed: {str(e)}")
+            metrics.increment('evaluation.error')
+            result = None
+
+        with self._lock:
+            self._queued -= 1
+            metrics.set_gauge('evaluation.queued', self._queued)
+
+        with queue._condition:
+            queue._in_flight -= 1
+            queue._results.append((job_id, result))
+            queue._condition.notify_all()
+        self._dispatch(queue)
+
+    def shutdown(self):
+        """Stop accepting jobs and release worker threads"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
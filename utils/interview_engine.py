@@ -0,0 +1,911 @@
+"""
+Interview Engine Module
+Interview flow and per-session state, independent of the user interface
+"""
+
+import os
+import threading
+import uuid
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from prompts.prompt_templates import ConversationFlow, PromptTemplates
+from utils.cache import LRUCache
+from utils.candidate_data import CandidateDataManager, SensitiveDataHandler
+from utils.evaluation import AnswerEvaluator, EvaluationExecutor, EvaluationQueue
+from utils.language_detector import SessionLanguageDetector
+from utils.llm_client import ConversationManager, LLMClient, LLMUnavailableError, get_shared_client
+from utils.message_log import Message, MessageLog, Role, View
+from utils.metrics import metrics
+from utils.prefetch import Prefetcher, PrefetchHandle
+from utils.question_cache import QuestionCache
+from utils.question_parser import fallback_questions, parse_questions
+from utils.sentiment_analyzer import SentimentAnalyzer, SentimentStats
+from utils.transcript_log import TranscriptLog
+
+# Receives the chunks of an inline evaluation as they are generated and returns the full text
+FeedbackStream = Callable[[Iterator[str]], object]
+
+
+class InterviewStateError(Exception):
+    """Raised when a step does not apply to the interview's current stage"""
+
+
+class InterviewSession:
+    """All state of one candidate's interview"""
+
+    def __init__(self, conversation_manager: ConversationManager, interview_id: Optional[str] = None):
+        """
+        Initialize Interview Session
+
+        Args:
+            conversation_manager: Conversation context for the chat-based flow; its
+                message log becomes the session's
+            interview_id: Identifier of the interview (a new random one by default);
+                also the session token of the API server
+        """
+        self.interview_id = interview_id or uuid.uuid4().hex
+        self.conversation_stage = 'greeting'
+        self.conversation_manager = conversation_manager
+        self.candidate_data: Dict = {}
+        # Every message is stored once; the chat, the transcript and the
+        # conversation context are views over the same log
+        self.messages: MessageLog = conversation_manager.message_log
+        self.chat_history = self.messages.view(View.CHAT)
+        self.interview_transcript = self.messages.view(View.TRANSCRIPT)
+        self.conversation_active = True
+        self.technical_questions: List[str] = []
+        self.question_index = 0
+        self.detected_language = 'en'
+        self.language_detector = SessionLanguageDetector()
+        self.sentiment_stats = SentimentStats()
+        self.question_prefetch = PrefetchHandle()
+        self.evaluation_queue = EvaluationQueue()
+        self.pending_feedback: Dict[int, Tuple[Message, int]] = {}
+        self.answers: List[Tuple[str, str]] = []
+        self.candidate_id: Optional[str] = None
+        # Number of the next turn in the transcript log; never reused, even
+        # when a message is hidden from the transcript later
+        self.turn = 0
+        # Incremented on every save to a session store
+        self.version = 0
+        # Serializes steps when several requests for the same session arrive at once
+        self.lock = threading.RLock()
+
+    def to_state(self) -> Dict:
+        """
+        Snapshot of the session as plain JSON-serializable data (see from_state)
+
+        The message log is stored once (see MessageLog.to_state); pending
+        evaluations refer to their placeholder by position in the log.
+        Worker-pool state (prefetches, queued evaluations) is not included,
+        and contact details are masked: a restored session keeps the first
+        name and masked email and phone only.
+        """
+        with self.lock:
+            return {
+                'id': self.interview_id,
+                'stage': self.conversation_stage,
+                'active': self.conversation_active,
+                # Snapshots are written to disk: no contact details
+                'candidate': SensitiveDataHandler.mask_candidate_data(self.candidate_data),
+                'candidate_id': self.candidate_id,
+                'messages': self.messages.to_state(),
+                'questions': self.technical_questions,
+                'question_index': self.question_index,
+                'turn': self.turn,
+                'answers': self.answers,
+                'pending': [
+                    [job_id, self.messages.index(message), turn]
+                    for job_id, (message, turn) in self.pending_feedback.items()
+                ],
+                'language': [self.detected_language, *self.language_detector.state()],
+                'sentiment': self.sentiment_stats.to_dict(),
+            }
+
+    @classmethod
+    def from_state(cls, state: Dict, conversation_manager: ConversationManager) -> 'InterviewSession':
+        """
+        Rebuild a session saved with to_state
+
+        Args:
+            state: Snapshot from to_state
+            conversation_manager: Fresh conversation manager; the saved messages are loaded into its log
+
+        Returns:
+            Restored session (pending evaluations are not queued; see InterviewEngine.restore_session)
+        """
+        session = cls(conversation_manager, state['id'])
+        session.conversation_stage = state['stage']
+        session.conversation_active = state['active']
+        session.candidate_data = state['candidate']
+        session.candidate_id = state['candidate_id']
+        session.messages.load_state(state['messages'])
+        conversation_manager.rebuild_context()
+        session.technical_questions = state['questions']
+        session.question_index = state['question_index']
+        # Snapshots written before the counter was saved: no turn number beyond the log
+        session.turn = state.get('turn', len(session.messages))
+        session.answers = [tuple(pair) for pair in state['answers']]
+        session.pending_feedback = {
+            job_id: (session.messages[position], turn) for job_id, position, turn in state['pending']
+        }
+        session.detected_language, *detector_state = state['language']
+        session.language_detector.restore(detector_state)
+        session.sentiment_stats = SentimentStats.from_dict(state['sentiment'])
+        return session
+
+    @property
+    def current_question(self) -> Optional[str]:
+        """The question waiting for an answer, if any"""
+        if self.conversation_active and self.question_index < len(self.technical_questions):
+            return self.technical_questions[self.question_index]
+        return None
+
+    def message_views(self, messages: Optional[List[Message]] = None) -> List[Dict]:
+        """
+        Messages as plain dicts with their position in the chat
+
+        Args:
+            messages: Messages of this session to include (default: all)
+
+        Returns:
+            List of {'turn', 'role', 'content', 'pending'} dicts
+        """
+        positions = {id(message): turn for turn, message in enumerate(self.chat_history)}
+        return [
+            {'turn': positions.get(id(message)), 'role': message.role.value, 'content': message.text,
+             'pending': message.pending}
+            for message in (self.chat_history if messages is None else messages)
+        ]
+
+    def to_dict(self, include_messages: bool = True) -> Dict:
+        """
+        Public view of the session for API clients (contact details masked)
+
+        Args:
+            include_messages: Include the whole chat
+        """
+        candidate = {k: v for k, v in self.candidate_data.items() if k not in ('email', 'phone', 'sentiment')}
+        if 'email' in self.candidate_data:
+            candidate['email'] = SensitiveDataHandler.mask_email(self.candidate_data['email'])
+        if 'phone' in self.candidate_data:
+            candidate['phone'] = SensitiveDataHandler.mask_phone(self.candidate_data['phone'])
+        view = {
+            'session_id': self.interview_id,
+            'stage': self.conversation_stage,
+            'active': self.conversation_active,
+            'candidate': candidate,
+            'question_index': self.question_index,
+            'total_questions': len(self.technical_questions),
+            'current_question': self.current_question,
+            'pending_evaluations': self.evaluation_queue.pending_count(),
+            'language': self.detected_language,
+            'sentiment': self.sentiment_stats.to_dict() if self.sentiment_stats.count else None,
+        }
+        if include_messages:
+            view['messages'] = self.message_views()
+        return view
+
+
+class InterviewEngine:
+    """
+    Runs interviews as explicit steps on InterviewSession objects
+
+    The engine holds only process-wide resources (LLM client, caches, worker
+    pools, storage) and is shared by every session. Each step takes the
+    session it applies to and returns the messages it added, so the same
+    flow can be driven by the Streamlit UI, the HTTP/WebSocket API or a
+    script. Steps never touch any UI; inline evaluation streaming is passed
+    in as a callback.
+    """
+
+    # Form fields in display order, with their labels
+    REQUIRED_FIELDS = (
+        ('name', "Full Name"),
+        ('email', "Email"),
+        ('phone', "Phone"),
+        ('years_of_experience', "Experience"),
+        ('location', "Location"),
+        ('desired_positions', "Target Position"),
+        ('tech_stack', "Tech Stack"),
+    )
+
+    def __init__(self, llm_client: LLMClient, data_manager: CandidateDataManager,
+                 question_cache: QuestionCache, prefetcher: Prefetcher, evaluator: AnswerEvaluator,
+                 evaluation_executor: EvaluationExecutor, transcript_log: TranscriptLog,
+                 sentiment_analyzer: Optional[SentimentAnalyzer] = None, async_evaluation: bool = True,
+                 evaluation_mode: str = 'per_answer', question_format: str = 'json',
+                 evaluation_wait_timeout: float = 60.0):
+        """
+        Initialize Interview Engine
+
+        Args:
+            llm_client: Shared LLM client
+            data_manager: Candidate and transcript storage
+            question_cache: Shared pool of generated questions
+            prefetcher: Worker pool for speculative question generation
+            evaluator: Answer evaluator
+            evaluation_executor: Worker pool for background evaluations
+            transcript_log: Append-only log of interview turns
+            sentiment_analyzer: Sentiment analyzer for the chat-based flow
+            async_evaluation: Evaluate answers in the background instead of inline
+            evaluation_mode: 'per_answer' (feedback after every answer) or 'batch' (all answers at the end)
+            question_format: 'json' (structured output) or 'text' (numbered list)
+            evaluation_wait_timeout: Seconds to wait for background evaluations when the interview ends
+        """
+        self.llm_client = llm_client
+        self.data_manager = data_manager
+        self.question_cache = question_cache
+        self.prefetcher = prefetcher
+        self.evaluator = evaluator
+        self.evaluation_executor = evaluation_executor
+        self.transcript_log = transcript_log
+        self.sentiment_analyzer = sentiment_analyzer or SentimentAnalyzer()
+        self.async_evaluation = async_evaluation
+        self.evaluation_mode = evaluation_mode
+        self.question_format = question_format
+        self.evaluation_wait_timeout = evaluation_wait_timeout
+
+    def new_session(self, interview_id: Optional[str] = None) -> InterviewSession:
+        """Create the state of a new interview"""
+        return InterviewSession(ConversationManager(self.llm_client, PromptTemplates.SYSTEM_PROMPT), interview_id)
+
+    def restore_session(self, state: Dict) -> InterviewSession:
+        """
+        Rebuild a saved session and queue its unfinished evaluations again
+
+        Background evaluations belong to the process that queued them, so
+        after a restart (or on another replica) they are run once more.
+
+        Args:
+            state: Snapshot from InterviewSession.to_state
+
+        Returns:
+            Restored session
+        """
+        session = InterviewSession.from_state(
+            state, ConversationManager(self.llm_client, PromptTemplates.SYSTEM_PROMPT)
+        )
+        tech = session.candidate_data.get('tech_stack', ['Technology'])[0]
+        years = int(session.candidate_data.get('years_of_experience', 0))
+        for job_id, (message, turn) in list(session.pending_feedback.items()):
+            # The answer is the candidate's last message before the placeholder
+            position = session.messages.index(message)
+            answer = next((m for m in reversed(session.messages[:position]) if m.role == Role.USER), None)
+            queued = (
+                answer is not None and job_id < len(session.technical_questions) and
+                self.evaluation_executor.submit(
+                    session.evaluation_queue, job_id, self.evaluator.evaluate,
+                    session.technical_questions[job_id], answer.text, tech, years
+                )
+            )
+            if not queued:
+                del session.pending_feedback[job_id]
+                message.text = PromptTemplates.FEEDBACK_UNAVAILABLE
+                message.pending = False
+                self._log_turn(session, turn, 'assistant', message.text)
+        metrics.increment('session.restored')
+        return session
+
+    def greet(self, session: InterviewSession) -> List[Message]:
+        """Open the chat-based flow with the greeting and the first question"""
+        with session.lock:
+            start = self._mark(session)
+            if not session.chat_history:
+                greeting = session.conversation_manager.add_message('assistant', PromptTemplates.INITIAL_GREETING)
+                session.messages.show(View.CHAT, [greeting])
+                session.conversation_stage = 'name'
+                self._get_next_input(session, 'name')
+            return self._added(session, start)
+
+    @classmethod
+    def validate_profile(cls, profile: Dict) -> List[str]:
+        """
+        Check the candidate information form
+
+        Args:
+            profile: Form fields; desired_positions and tech_stack may be
+                comma-separated strings or lists
+
+        Returns:
+            Error messages (empty if the profile is complete)
+        """
+        errors = []
+        for field, label in cls.REQUIRED_FIELDS:
+            value = profile.get(field)
+            if field == 'years_of_experience':
+                try:
+                    missing = float(value or 0) <= 0
+                except (TypeError, ValueError):
+                    missing = True
+            else:
+                if isinstance(value, (list, tuple)):
+                    value = ','.join(value)
+                missing = not (value or '').strip()
+            if missing:
+                errors.append(f"• {label} is required")
+        return errors
+
+    def start_interview(self, session: InterviewSession, profile: Dict) -> List[Message]:
+        """
+        Start the interview from a completed information form
+
+        Args:
+            session: Interview session
+            profile: Validated form fields (see validate_profile)
+
+        Returns:
+            Messages added (greeting and the technical questions)
+
+        Raises:
+            InterviewStateError: The interview has already started
+        """
+        with session.lock:
+            # Checked under the lock: two concurrent submissions must not both start it
+            if session.conversation_stage != 'greeting':
+                raise InterviewStateError("The interview has already started")
+
+            session.candidate_data = {
+                'name': profile['name'].strip(),
+                'email': profile['email'].strip(),
+                'phone': profile['phone'].strip(),
+                'years_of_experience': profile['years_of_experience'],
+                'location': profile['location'].strip(),
+                'desired_positions': self._split(profile['desired_positions']),
+                'tech_stack': self._split(profile['tech_stack'])
+            }
+            session.candidate_id = self.data_manager.candidate_id_for(session.candidate_data['email'])
+
+            session.conversation_stage = 'questions'
+            session.messages.hide(View.CHAT | View.TRANSCRIPT)
+
+            name = session.candidate_data['name']
+            greeting = f"Hello {name.split()[0]}! 👋 Welcome to TalentScout Interview!\n\nThank you for completing the information form. We're excited to learn more about your experience with {', '.join(session.candidate_data['tech_stack'][:3])}.\n\nLet's proceed with the technical interview questions."
+            self._append_message(session, 'assistant', greeting)
+
+            self.generate_questions(session)
+            return list(session.chat_history)
+
+    def prefetch_questions(self, session: InterviewSession, tech_stack: List[str], years_of_experience: float):
+        """
+        Start generating questions in the background for the current form inputs
+
+        Any earlier prefetch for different inputs is cancelled. Prefetched
+        questions are only added to the shared question cache once the
+        candidate submits the same tech stack (see generate_questions), so
+        half-typed stacks don't leave pools behind.
+
+        Args:
+            session: Interview session
+            tech_stack: List of technologies entered so far
+            years_of_experience: Years of experience entered so far
+        """
+        handle = session.question_prefetch
+        if years_of_experience <= 0 or not any(tech_stack):
+            self.prefetcher.cancel(handle)
+            return
+
+        self.prefetcher.prefetch(
+            handle,
+            QuestionCache.make_key(tech_stack, years_of_experience),
+            self._generate_questions,
+            tech_stack,
+            years_of_experience
+        )
+
+    def generate_questions(self, session: InterviewSession) -> List[Message]:
+        """
+        Get the technical questions for the candidate's tech stack
+
+        Also used to retry after the questions were unavailable.
+
+        Returns:
+            Messages added (the questions, or a notice that they are unavailable)
+        """
+        with session.lock:
+            start = self._mark(session)
+            session.conversation_stage = 'questions'
+
+            tech_stack = session.candidate_data.get('tech_stack', [])
+            years_of_experience = session.candidate_data.get('years_of_experience', 0)
+
+            # Pick up questions generated while the form was being filled in
+            prefetched = self.prefetcher.result(
+                session.question_prefetch,
+                QuestionCache.make_key(tech_stack, years_of_experience)
+            )
+            if prefetched is not None:
+                questions, generated = prefetched
+                if generated:
+                    self.question_cache.add(tech_stack, years_of_experience, questions)
+            else:
+                try:
+                    questions = self.fetch_questions(tech_stack, years_of_experience)
+                except LLMUnavailableError as e:
+                    print(f"[Engine] Technical questions unavailable: {str(e)}")
+                    questions = None
+
+            session.technical_questions = (questions or [])[:5]  # Limit to 5 questions
+            session.question_index = 0
+
+            # Format the message with the questions
+            if questions is None:
+                message = PromptTemplates.QUESTIONS_UNAVAILABLE
+            elif session.technical_questions:
+                questions_text = "\n\n".join(session.technical_questions)
+                message = f"Great! Based on your tech stack ({', '.join(tech_stack)}), here are your technical questions:\n\n{questions_text}\n\nLet's start with question 1:"
+            else:
+                message = "Let me generate some technical questions for you based on your experience with " + ", ".join(tech_stack) + "."
+
+            self._append_message(session, 'assistant', message)
+            return self._added(session, start)
+
+    def fetch_questions(self, tech_stack: List[str], years_of_experience: float) -> List[str]:
+        """
+        Get technical questions for a profile, from the question cache when possible
+
+        Args:
+            tech_stack: List of technologies
+            years_of_experience: Years of experience
+
+        Returns:
+            List of numbered questions
+
+        Raises:
+            LLMUnavailableError: If no LLM provider could answer
+        """
+        questions, generated = self._generate_questions(tech_stack, years_of_experience)
+        if generated:
+            self.question_cache.add(tech_stack, years_of_experience, questions)
+        return questions
+
+    def _generate_questions(self, tech_stack: List[str], years_of_experience: float) -> Tuple[List[str], bool]:
+        """
+        Sample questions from the question cache, or generate them
+
+        Runs on background threads too, so it must not touch any session.
+        Leaves caching to the caller (see fetch_questions).
+
+        Returns:
+            Tuple of (numbered questions, whether they were newly generated and parsed)
+
+        Raises:
+            LLMUnavailableError: If no LLM provider could answer
+        """
+        questions = self.question_cache.sample(tech_stack, years_of_experience)
+        if questions is not None:
+            return questions, False
+
+        structured = self.question_format == 'json'
+        prompt = PromptTemplates.create_tech_question_prompt(tech_stack, int(years_of_experience), structured=structured)
+
+        # Use LLM client directly without conversation history to avoid confusion
+        response = self.llm_client.generate_response(
+            prompt,
+            system_message=(
+                "You are a technical interviewer. Respond ONLY with a JSON object. No other text."
+                if structured else
+                "You are a technical interviewer. Generate ONLY the numbered questions, nothing else."
+            ),
+            temperature=0.7,
+            max_tokens=800,
+            json_mode=structured
+        )
+
+        questions = parse_questions(response, max_questions=5)
+        if questions:
+            return questions, True
+
+        # Fallback: if no questions extracted, split by newline and clean
+        metrics.increment('questions.parse_fallback')
+        return fallback_questions(response)[:5], False
+
+    def process_user_input(self, session: InterviewSession, user_input: str,
+                           stream_feedback: Optional[FeedbackStream] = None) -> List[Message]:
+        """
+        Process a chat message based on the conversation stage
+
+        Args:
+            session: Interview session
+            user_input: Candidate message
+            stream_feedback: Receives inline answer evaluations as they stream
+
+        Returns:
+            Messages added
+        """
+        if not user_input:
+            return []
+
+        with session.lock:
+            start = self._mark(session)
+
+            # Sanitize input
+            user_input = SensitiveDataHandler.sanitize_input(user_input)
+
+            # Check for exit keywords
+            if ConversationFlow.should_exit(user_input):
+                self.end_interview(session)
+                return self._added(session, start)
+
+            # Add to history
+            self._append_message(session, 'user', user_input)
+
+            # Detect language
+            session.detected_language = session.language_detector.observe(user_input)
+
+            # Analyze sentiment
+            sentiment = self.sentiment_analyzer.analyze_sentiment(user_input)
+            if 'polarity' in sentiment:
+                session.sentiment_stats.update(sentiment['polarity'])
+
+            # Process based on stage
+            current_stage = session.conversation_stage
+            data = session.candidate_data
+
+            if current_stage == 'name':
+                data['name'] = user_input
+                self._get_next_input(session, "email")
+
+            elif current_stage == 'email':
+                data['email'] = user_input
+                self._identify_candidate(session)
+                self._get_next_input(session, "phone")
+
+            elif current_stage == 'phone':
+                data['phone'] = user_input
+                self._get_next_input(session, "experience")
+
+            elif current_stage == 'experience':
+                try:
+                    data['years_of_experience'] = float(user_input.split()[0])
+                    self._get_next_input(session, "position")
+                except (ValueError, IndexError):
+                    self._ask_for_clarification(session, "years of experience", "experience")
+
+            elif current_stage == 'position':
+                data['desired_positions'] = self._split(user_input)
+                self._get_next_input(session, "location")
+
+            elif current_stage == 'location':
+                data['location'] = user_input
+                self._get_next_input(session, "tech_stack")
+
+            elif current_stage == 'tech_stack':
+                data['tech_stack'] = self._split(user_input)
+                self.generate_questions(session)
+
+            elif current_stage == 'questions':
+                self._process_question_answer(session, user_input, stream_feedback)
+
+            return self._added(session, start)
+
+    def submit_answer(self, session: InterviewSession, answer: str,
+                      stream_feedback: Optional[FeedbackStream] = None,
+                      question_index: Optional[int] = None) -> List[Message]:
+        """
+        Answer the current technical question
+
+        Exit keywords end the interview instead.
+
+        Args:
+            session: Interview session
+            answer: Candidate's answer (empty answers are ignored)
+            stream_feedback: Receives inline answer evaluations as they stream
+            question_index: Index of the question the answer is for; a resubmitted
+                answer to an earlier question is rejected instead of being taken
+                as the answer to the next one
+
+        Returns:
+            Messages added
+
+        Raises:
+            InterviewStateError: The interview has ended, no question is waiting
+                for an answer, or the answer is for another question
+        """
+        answer = (answer or "").strip()
+        if not answer:
+            return []
+
+        with session.lock:
+            # Checked under the lock: a concurrent submission may have just answered
+            if not session.conversation_active:
+                raise InterviewStateError("The interview has ended")
+            exiting = ConversationFlow.should_exit(answer)
+            if session.current_question is None and not exiting:
+                raise InterviewStateError("No question is waiting for an answer")
+            if question_index is not None and question_index != session.question_index:
+                raise InterviewStateError(f"Question {question_index + 1} is not the current question")
+
+            start = self._mark(session)
+            self._append_message(session, 'user', answer)
+
+            if exiting:
+                self.end_interview(session)
+            else:
+                self._process_question_answer(session, answer, stream_feedback)
+            return self._added(session, start)
+
+    def collect_evaluations(self, session: InterviewSession, wait: bool = False) -> List[Message]:
+        """
+        Attach finished background evaluations to their placeholder messages
+
+        Args:
+            session: Interview session
+            wait: Block until all queued evaluations have finished
+
+        Returns:
+            Placeholder messages that now hold their feedback
+        """
+        with session.lock:
+            queue = session.evaluation_queue
+            if wait and queue.pending_count():
+                queue.wait(timeout=self.evaluation_wait_timeout)
+
+            updated = []
+            for job_id, evaluation in queue.drain():
+                pending = session.pending_feedback.pop(job_id, None)
+                if pending is None:
+                    continue
+                message, turn = pending
+                if evaluation is None:
+                    # The evaluation failed, e.g. because every LLM provider was busy
+                    evaluation = PromptTemplates.FEEDBACK_UNAVAILABLE
+                if evaluation and len(evaluation) > 10:
+                    message.text = evaluation
+                    message.pending = False
+                    self._log_turn(session, turn, 'assistant', evaluation)
+                    updated.append(message)
+                else:
+                    # No meaningful feedback - drop the placeholder
+                    session.messages.hide(View.CHAT | View.TRANSCRIPT, [message])
+            return updated
+
+    def end_interview(self, session: InterviewSession) -> List[Message]:
+        """
+        End the interview with a summary and save the candidate and transcript
+
+        Waits for outstanding evaluations (and grades batch-mode answers) first,
+        so the saved transcript includes all feedback.
+
+        Returns:
+            Messages added (none if the interview has already ended)
+        """
+        with session.lock:
+            if not session.conversation_active:
+                return []
+            start = self._mark(session)
+            session.conversation_active = False
+            session.conversation_stage = 'conclusion'
+
+            self.collect_evaluations(session, wait=True)
+            if self.evaluation_mode == 'batch':
+                self._evaluate_answers_batch(session)
+
+            data = session.candidate_data
+            conclusion_message = f"""
+Thank you for your interest in TalentScout! 🎉
+
+**Interview Summary:**
+- Name: {data.get('name', 'N/A')}
+- Years of Experience: {data.get('years_of_experience', 'N/A')}
+- Desired Positions: {', '.join(data.get('desired_positions', []))}
+- Tech Stack: {', '.join(data.get('tech_stack', []))}
+
+**Next Steps:**
+Our team will review your responses and contact you within 48 hours with feedback and information about the next interview round.
+
+Good luck! 🚀
+"""
+
+            self._append_message(session, 'assistant', conclusion_message)
+
+            # Save candidate data
+            data['sentiment'] = session.sentiment_stats.to_dict()
+            self.data_manager.save_candidate(data, session.candidate_id)
+            self.data_manager.save_interview_transcript(
+                session.candidate_id or self.data_manager.candidate_id_for(data.get('email', '')),
+                session.interview_transcript.to_list()
+            )
+            return self._added(session, start)
+
+    def export_transcript(self, session: InterviewSession) -> Dict:
+        """Interview transcript for download (without contact details)"""
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'candidate_data': {k: v for k, v in session.candidate_data.items() if k not in ['email', 'phone']},
+            'conversation': session.interview_transcript.to_list()
+        }
+
+    def _process_question_answer(self, session: InterviewSession, answer: str,
+                                 stream_feedback: Optional[FeedbackStream]):
+        """Evaluate the answer to the current question and ask the next one"""
+        # Make sure we have valid questions
+        if not session.technical_questions or session.question_index >= len(session.technical_questions):
+            self.end_interview(session)
+            return
+
+        current_question = session.technical_questions[session.question_index]
+        tech = session.candidate_data.get('tech_stack', ['Technology'])[0]
+        years = int(session.candidate_data.get('years_of_experience', 0))
+
+        # Evaluate in the background so the next question shows up immediately;
+        # fall back to evaluating inline if disabled or saturated.
+        # In batch mode answers are only recorded here and graded at the end.
+        queued = False
+        if self.evaluation_mode == 'batch':
+            session.answers.append((current_question, answer))
+            queued = True
+        elif self.async_evaluation:
+            queued = self.evaluation_executor.submit(
+                session.evaluation_queue,
+                session.question_index,
+                self.evaluator.evaluate,
+                current_question, answer, tech, years
+            )
+            if queued:
+                # The placeholder is logged once the evaluation has finished
+                turn = self._next_turn(session)
+                feedback_message = session.messages.append(
+                    Role.ASSISTANT, "⏳ Evaluating your answer...", View.CHAT | View.TRANSCRIPT,
+                    question=session.question_index, pending=True
+                )
+                session.pending_feedback[session.question_index] = (feedback_message, turn)
+
+        if not queued:
+            evaluation = self._evaluate_inline(current_question, answer, tech, years, stream_feedback)
+            # Only add if we have meaningful feedback
+            if evaluation and len(evaluation) > 10:
+                self._append_message(session, 'assistant', evaluation, question=session.question_index)
+
+        session.question_index += 1
+
+        # Move to next question or end
+        if session.question_index < len(session.technical_questions):
+            next_q = session.technical_questions[session.question_index]
+            next_msg = f"Let's move on to question {session.question_index + 1}:\n\n{next_q}"
+            self._append_message(session, 'assistant', next_msg)
+        else:
+            # All questions answered
+            self.end_interview(session)
+
+    def _evaluate_inline(self, question: str, answer: str, tech: str, years: int,
+                         stream_feedback: Optional[FeedbackStream]) -> str:
+        """Evaluate an answer while the candidate waits, streaming it if a callback is given"""
+        try:
+            chunks = self.evaluator.evaluate_stream(question, answer, tech, years)
+            evaluation = stream_feedback(chunks) if stream_feedback else ''.join(chunks)
+            if not isinstance(evaluation, str):
+                evaluation = ''.join(str(chunk) for chunk in evaluation)
+            return AnswerEvaluator.extract_feedback(evaluation)
+        except LLMUnavailableError as e:
+            print(f"[Engine] Evaluation unavailable: {str(e)}")
+            return PromptTemplates.FEEDBACK_UNAVAILABLE
+
+    def _evaluate_answers_batch(self, session: InterviewSession):
+        """Grade all recorded answers in one request and add the feedback to the chat"""
+        if not session.answers:
+            return
+
+        try:
+            feedback = self.evaluator.evaluate_batch(
+                session.answers,
+                session.candidate_data.get('tech_stack', ['Technology'])[0],
+                int(session.candidate_data.get('years_of_experience', 0))
+            )
+        except LLMUnavailableError as e:
+            print(f"[Engine] Batch evaluation unavailable: {str(e)}")
+            self._append_message(session, 'assistant', PromptTemplates.FEEDBACK_UNAVAILABLE)
+            session.answers = []
+            return
+
+        for number, evaluation in enumerate(feedback, 1):
+            if evaluation and len(evaluation) > 10:
+                message = f"**Feedback on question {number}:**\n{evaluation}"
+                self._append_message(session, 'assistant', message, question=number - 1)
+        session.answers = []
+
+    def _append_message(self, session: InterviewSession, role: str, content: str, question: Optional[int] = None):
+        """Add a message to the chat and the interview transcript, and log it durably"""
+        turn = self._next_turn(session)
+        session.messages.append(role, content, View.CHAT | View.TRANSCRIPT, question=question)
+        self._log_turn(session, turn, role, content)
+
+    def _identify_candidate(self, session: InterviewSession):
+        """Derive the candidate ID from the email and log the turns exchanged before it was known"""
+        session.candidate_id = self.data_manager.candidate_id_for(session.candidate_data['email'])
+        # Numbered from 0: the turn counter has counted every one of them already
+        for turn, message in enumerate(session.interview_transcript):
+            self._log_turn(session, turn, message.role.value, message.text)
+
+    @staticmethod
+    def _next_turn(session: InterviewSession) -> int:
+        """Take the next turn number of the session"""
+        turn = session.turn
+        session.turn += 1
+        return turn
+
+    def _log_turn(self, session: InterviewSession, turn: int, role: str, content: str):
+        """Append a turn to the transcript log once the candidate is known"""
+        if session.candidate_id:
+            self.transcript_log.append(session.candidate_id, session.interview_id, turn, role, content)
+
+    def _get_next_input(self, session: InterviewSession, field: str):
+        """Ask the candidate for the next field"""
+        prompts = PromptTemplates.INFORMATION_GATHERING_PROMPTS
+        if field in prompts:
+            self._append_message(session, 'assistant', prompts[field])
+            session.conversation_stage = field
+
+    def _ask_for_clarification(self, session: InterviewSession, field: str, stage: str):
+        """Ask for clarification on invalid input"""
+        clarification = f"I didn't quite understand. Could you please provide your {field}? (e.g., for experience: '5 years' or just '5')"
+        self._append_message(session, 'assistant', clarification)
+        session.conversation_stage = stage
+
+    @staticmethod
+    def _split(value) -> List[str]:
+        """Comma-separated string (or list) to a list of stripped items"""
+        if isinstance(value, (list, tuple)):
+            return [str(item).strip() for item in value]
+        return [item.strip() for item in value.split(',')]
+
+    @staticmethod
+    def _mark(session: InterviewSession) -> int:
+        """Remember where the message log ended before a step"""
+        return len(session.messages)
+
+    @staticmethod
+    def _added(session: InterviewSession, start: int) -> List[Message]:
+        """Chat messages added since _mark"""
+        return session.messages.since(start, View.CHAT)
+
+
+def create_interview_engine() -> InterviewEngine:
+    """
+    Build an interview engine from the environment
+
+    Creates the process-wide resources (shared LLM client with warm-up and
+    keep-warm pings, question cache, worker pools, transcript log, storage).
+    Call once per process and share the engine between sessions.
+
+    Returns:
+        Configured InterviewEngine
+    """
+    llm_client = get_shared_client()
+    if os.getenv('LLM_WARMUP', 'true').lower() == 'true':
+        llm_client.warm_up(background=True)
+    llm_client.start_keep_warm(
+        interval=float(os.getenv('OLLAMA_KEEP_WARM_SECONDS', '240')),
+        active_window=float(os.getenv('OLLAMA_ACTIVE_WINDOW_SECONDS', '900'))
+    )
+
+    evaluation_cache = LRUCache(
+        max_entries=int(os.getenv('EVALUATION_CACHE_SIZE', '2048')),
+        ttl_seconds=float(os.getenv('EVALUATION_CACHE_TTL_HOURS', '24')) * 3600
+    )
+    return InterviewEngine(
+        llm_client=llm_client,
+        data_manager=CandidateDataManager(),
+        question_cache=QuestionCache(
+            db_path=os.getenv('QUESTION_CACHE_PATH', os.path.join('data', 'question_cache.db'))
+        ),
+        prefetcher=Prefetcher(max_workers=int(os.getenv('PREFETCH_WORKERS', '4'))),
+        evaluator=AnswerEvaluator(llm_client, cache=evaluation_cache),
+        evaluation_executor=EvaluationExecutor(
+            max_workers=int(os.getenv('EVALUATION_WORKERS', '4')),
+            max_queued=int(os.getenv('EVALUATION_MAX_QUEUED', '200'))
+        ),
+        transcript_log=TranscriptLog(
+            log_dir=os.getenv('TRANSCRIPT_LOG_DIR', os.path.join('data', 'transcripts')),
+            max_segment_bytes=int(float(os.getenv('TRANSCRIPT_SEGMENT_MB', '64')) * 1024 * 1024),
+            flush_interval=float(os.getenv('TRANSCRIPT_FLUSH_MS', '200')) / 1000
+        ),
+        # Evaluate answers in the background instead of blocking the next question
+        async_evaluation=os.getenv('ASYNC_EVALUATION', 'true').lower() == 'true',
+        # 'per_answer' gives feedback after every answer; 'batch' grades all answers in one request at the end
+        evaluation_mode=os.getenv('EVALUATION_MODE', 'per_answer').lower(),
+        # 'json' requests technical questions as structured output; 'text' as a numbered list
+        question_format=os.getenv('QUESTION_FORMAT', 'json').lower(),
+        evaluation_wait_timeout=float(os.getenv('EVALUATION_WAIT_TIMEOUT', '60'))
+    )
@@ -3,11 +3,40 @@ Language Detection and Translation Module (Optional Enhancement)
 Supports multilingual interactions
 """
 
-from typing import Optional, Dict
-from langdetect import detect, DetectorFactory
+import re
+import threading
+import time
+import unicodedata
+from typing import Optional, Dict, List, Tuple
 
-# Set seed for consistent results
-DetectorFactory.seed = 0
+from utils.cache import LRUCache
+from utils.metrics import metrics
+
+# langdetect is only imported on first use; its language profiles load on the first detect
+_detect_langs = None
+_detect_lock = threading.Lock()
+
+# Inputs that carry no language signal: e-mail addresses, URLs, numbers, phone numbers
+_EMAIL_PATTERN = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+_URL_PATTERN = re.compile(r'^(?:https?://|www\.)\S+$', re.IGNORECASE)
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+# Scripts written without spaces, where a character carries about as much as a word
+_KANA_PATTERN = re.compile(r'[\u3040-\u30ff]')
+_HAN_PATTERN = re.compile(r'[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]')
+_HANGUL_PATTERN = re.compile(r'[\uac00-\ud7af]')
+
+
+def _load_langdetect():
+    """Import langdetect on first use and return its detect_langs function"""
+    global _detect_langs
+    if _detect_langs is None:
+        with _detect_lock:
+            if _detect_langs is None:
+                from langdetect import detect_langs, DetectorFactory
+                # Set seed for consistent results
+                DetectorFactory.seed = 0
+                _detect_langs = detect_langs
+    return _detect_langs
 
 
 class LanguageHandler:
@@ -25,22 +54,119 @@ class LanguageHandler:
         'hi': 'Hindi'
     }
 
+    # Fewer letters than this are too little evidence for langdetect
+    MIN_LETTERS = 8
+    # Han, kana and Hangul characters are words or syllables: fewer are needed
+    MIN_CJK_CHARS = 2
+    # Only the start of long messages is scored; it is plenty to tell languages apart
+    MAX_DETECT_CHARS = 500
+
+    _memo = LRUCache(max_entries=2048)
+
+    @staticmethod
+    def warm_up():
+        """Load langdetect and its language profiles ahead of the first request"""
+        LanguageHandler.detect_langs("Warming up the language detector.")
+
     @staticmethod
-    def detect_language(text: str) -> Optional[str]:
+    def is_linguistic(text: str) -> bool:
         """
-        Detect language of given text
+        Check whether text carries enough natural language to be worth detecting
+        
+        Args:
+            text: Text to check
+            
+        Returns:
+            False for e-mail addresses, URLs, numbers and very short inputs
+        """
+        stripped = text.strip()
+        if not stripped or _EMAIL_PATTERN.match(stripped) or _URL_PATTERN.match(stripped):
+            return False
+        # Combining marks count as letters: Devanagari vowel signs are not alphabetic
+        letters = sum(1 for ch in stripped if ch.isalpha() or unicodedata.category(ch).startswith('M'))
+        cjk = len(_KANA_PATTERN.findall(stripped)) + len(_HAN_PATTERN.findall(stripped)) + \
+            len(_HANGUL_PATTERN.findall(stripped))
+        if letters < LanguageHandler.MIN_LETTERS and cjk < LanguageHandler.MIN_CJK_CHARS:
+            return False
+        # Mostly digits and punctuation, e.g. phone numbers or "5 years, 3 months"
+        visible = len(stripped) - stripped.count(' ')
+        return letters * 2 >= visible
+
+    @staticmethod
+    def detect_langs(text: str) -> List[Tuple[str, float]]:
+        """
+        Detect candidate languages of given text with their probabilities
+        
+        Results are memoized, so repeated inputs do not rerun langdetect.
         
         Args:
             text: Text to analyze
             
         Returns:
-            Language code (e.g., 'en', 'es')
+            (language code, probability) pairs, most likely first; empty if the
+            text is not linguistic or detection failed
         """
+        if not LanguageHandler.is_linguistic(text):
+            metrics.increment('language.skipped')
+            return []
+
+        key = _WHITESPACE_PATTERN.sub(' ', text.strip())[:LanguageHandler.MAX_DETECT_CHARS]
+        script_language = LanguageHandler._script_language(key)
+        if script_language is not None:
+            metrics.increment('language.script')
+            return [(script_language, 1.0)]
+
+        cached = LanguageHandler._memo.get(key)
+        if cached is not None:
+            metrics.increment('language.memo_hit')
+            return cached
+
+        started = time.perf_counter()
         try:
-            lang = detect(text)
-            return lang if lang in LanguageHandler.SUPPORTED_LANGUAGES else 'en'
+            result = [(lang.lang, lang.prob) for lang in _load_langdetect()(key)]
         except Exception:
-            return 'en'  # Default to English on error
+            result = []
+        metrics.observe('language.detect_latency', time.perf_counter() - started)
+        LanguageHandler._memo.set(key, result)
+        return result
+
+    @staticmethod
+    def _script_language(text: str) -> Optional[str]:
+        """
+        Language identified by its script alone, for text written mostly in Han or kana
+
+        langdetect needs long inputs for these: it takes short Chinese
+        sentences for Korean, so they are counted per script instead.
+        """
+        kana = len(_KANA_PATTERN.findall(text))
+        han = len(_HAN_PATTERN.findall(text))
+        if kana + han < LanguageHandler.MIN_CJK_CHARS:
+            return None
+        letters = sum(1 for ch in text if ch.isalpha())
+        if (kana + han) * 2 < letters:
+            return None
+        # Japanese mixes kana into Han text; Chinese has none
+        return 'ja' if kana else 'zh-cn'
+
+    @staticmethod
+    def detect_language(text: str, min_confidence: float = 0.0) -> Optional[str]:
+        """
+        Detect language of given text
+        
+        Args:
+            text: Text to analyze
+            min_confidence: Minimum probability required to trust the detection
+            
+        Returns:
+            Language code (e.g., 'en', 'es')
+        """
+        langs = LanguageHandler.detect_langs(text)
+        if not langs:
+            return 'en'  # Default to English when there is nothing to detect
+        lang, prob = langs[0]
+        if prob < min_confidence:
+            return 'en'
+        return lang if lang in LanguageHandler.SUPPORTED_LANGUAGES else 'en'
 
     @staticmethod
     def get_language_name(lang_code: str) -> str:
@@ -67,3 +193,65 @@ class LanguageHandler:
             'hi': 'नमस्ते! TalentScout में आपका स्वागत है।'
         }
         return greetings.get(language, greetings['en'])
+
+
+class SessionLanguageDetector:
+    """
+    Tracks the language of one conversation
+
+    Each message is detected until the same supported language has been seen
+    with high confidence a few times in a row. From then on the language is
+    locked and later messages skip detection entirely.
+    """
+
+    def __init__(self, default: str = 'en', confidence: float = 0.9, lock_after: int = 2):
+        """
+        Initialize Session Language Detector
+        
+        Args:
+            default: Language reported until one has been detected
+            confidence: Probability a detection needs to count towards the lock
+            lock_after: Consecutive confident detections needed to lock the language
+        """
+        self.language = default
+        self.confidence = confidence
+        self.lock_after = lock_after
+        self.locked = False
+        self._streak = 0
+
+    def observe(self, text: str) -> str:
+        """
+        Update the session language with a new message
+        
+        Args:
+            text: Candidate message
+            
+        Returns:
+            Current language code of the session
+        """
+        if self.locked:
+            metrics.increment('language.session_locked')
+            return self.language
+
+        langs = LanguageHandler.detect_langs(text)
+        if not langs:
+            return self.language
+
+        lang, prob = langs[0]
+        if prob < self.confidence or lang not in LanguageHandler.SUPPORTED_LANGUAGES:
+            self._streak = 0
+            return self.language
+
+        self._streak = self._streak + 1 if lang == self.language else 1
+        self.language = lang
+        if self._streak >= self.lock_after:
+            self.locked = True
+        return self.language
+
+    def state(self) -> List:
+        """Detection state as a JSON-serializable list (see restore)"""
+        return [self.language, self.locked, self._streak]
+
+    def restore(self, state: List):
+        """Resume detection from a state saved with state()"""
+        self.language, self.locked, self._streak = state
@@ -4,10 +4,20 @@ Handles interactions with various LLM providers (OpenAI, Ollama, etc.)
 """
 
 import os
-import json
-from typing import Optional, List, Dict
+import time
+import threading
+from collections import deque
+from typing import Optional, List, Dict, Iterator, Deque, Tuple
 from dotenv import load_dotenv
 
+from utils.llm_providers import (
+    PROVIDERS, LLMProvider, LLMProviderError, LLMUnavailableError, create_provider, estimate_tokens
+)
+from utils.llm_router import ProviderRouter
+from utils.message_log import Message, MessageLog, MessageView, Role, View
+from utils.metrics import metrics
+from utils.rate_limiter import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE
+
 load_dotenv()
 
 
@@ -18,6 +28,11 @@ class LLMClient:
         """
         Initialize LLM Client
         
+        Requests go to the configured provider first and fail over to the
+        providers in LLM_FALLBACK_PROVIDERS (see ProviderRouter). When none
+        of them can answer, the generate methods raise LLMUnavailableError
+        rather than returning error text, so callers can degrade gracefully.
+        
         Args:
             provider: LLM provider type ('openai', 'ollama', or None for default)
         """
@@ -27,34 +42,90 @@ class LLMClient:
         # Log provider being used (for debugging)
         # print(f"[LLM] Using provider: {self.provider}")
         
-        self.model = self._get_model()
-        self.client = self._initialize_client()
-
-    def _get_model(self) -> str:
-        """Get the model name based on provider"""
-        if self.provider == 'openai':
-            return 'gpt-3.5-turbo'
-        elif self.provider == 'ollama':
-            return os.getenv('OLLAMA_MODEL', 'mistral')
-        return 'gpt-3.5-turbo'
-
-    def _initialize_client(self):
-        """Initialize the appropriate LLM client"""
-        if self.provider == 'openai':
-            try:
-                from openai import OpenAI
-                api_key = os.getenv('OPENAI_API_KEY')
-                if not api_key:
-                    raise ValueError("OPENAI_API_KEY not set in environment")
-                return OpenAI(api_key=api_key)
-            except ImportError:
-                raise ImportError("OpenAI package not installed. Install with: pip install openai")
-        elif self.provider == 'ollama':
-            return None  # Ollama uses HTTP API
-        return None
+        self.providers = self._initialize_providers()
+        self.model = self.providers[0].model if self.providers else 'gpt-3.5-turbo'
+        self.router = ProviderRouter(
+            self.providers,
+            hedge=os.getenv('LLM_HEDGE_REQUESTS', 'false').lower() == 'true',
+            hedge_delay=float(os.getenv('LLM_HEDGE_DELAY', '5')),
+            failure_threshold=int(os.getenv('LLM_CIRCUIT_FAILURES', '3')),
+            reset_timeout=float(os.getenv('LLM_CIRCUIT_RESET_SECONDS', '30')),
+            health_check_interval=float(os.getenv('LLM_HEALTH_CHECK_SECONDS', '10'))
+        ) if self.providers else None
+        # Per-thread call state, so one client can serve every Streamlit session
+        self._local = threading.local()
+
+    @property
+    def last_time_to_first_token(self) -> Optional[float]:
+        """Time-to-first-token of the last stream consumed on this thread"""
+        return getattr(self._local, 'time_to_first_token', None)
+
+    def warm_up(self, background: bool = True) -> Optional[threading.Thread]:
+        """
+        Prepare every provider for its first request (e.g. load the Ollama model)
+        
+        Args:
+            background: Warm up on a daemon thread instead of blocking
+            
+        Returns:
+            The warm-up thread when running in the background
+        """
+        def run():
+            for provider in self.providers:
+                provider.warm_up()
+
+        if not background:
+            run()
+            return None
+        thread = threading.Thread(target=run, name='llm-warm-up', daemon=True)
+        thread.start()
+        return thread
+
+    def start_keep_warm(self, interval: float, active_window: float):
+        """
+        Keep providers warm while the app is in use (see mark_active)
+        
+        Args:
+            interval: Seconds between keep-warm pings (0 disables)
+            active_window: Seconds after the last mark_active during which pings are sent
+        """
+        for provider in self.providers:
+            provider.start_keep_warm(interval, active_window)
+
+    def mark_active(self):
+        """Record that a session is in use, so keep-warm pings continue"""
+        for provider in self.providers:
+            provider.mark_active()
+
+    def _initialize_providers(self) -> List[LLMProvider]:
+        """Create the provider backends in priority order: the configured provider, then fallbacks"""
+        if self.provider not in PROVIDERS:
+            return []
+
+        default_fallbacks = 'openai' if self.provider == 'ollama' else ''
+        names = [self.provider] + [
+            name.strip().lower()
+            for name in os.getenv('LLM_FALLBACK_PROVIDERS', default_fallbacks).split(',')
+            if name.strip()
+        ]
+
+        providers = []
+        for name in dict.fromkeys(names):
+            provider = create_provider(name)
+            if provider is None:
+                print(f"[LLM] Unknown fallback provider '{name}' ignored")
+                continue
+            if getattr(provider, 'init_error', None):
+                if name == self.provider:
+                    raise ValueError(provider.init_error)
+                # An unconfigured fallback would only add a failing hop
+                continue
+            providers.append(provider)
+        return providers
 
     def generate_response(self, prompt: str, system_message: Optional[str] = None, 
-                         temperature: float = 0.7, max_tokens: int = 500) -> str:
+                         temperature: float = 0.7, max_tokens: int = 500,
+                         json_mode: bool = False, priority: int = PRIORITY_INTERACTIVE) -> str:
         """
         Generate response from LLM
         
@@ -63,95 +134,202 @@ class LLMClient:
             system_message: System context message
             temperature: Response creativity (0.0-1.0)
             max_tokens: Maximum response length
+            json_mode: Ask the provider to constrain output to a JSON object
+            priority: PRIORITY_INTERACTIVE if a candidate is waiting, else PRIORITY_BACKGROUND
             
         Returns:
             Generated response text
+            
+        Raises:
+            LLMUnavailableError: If no provider could answer
         """
-        if self.provider == 'openai':
-            return self._openai_response(prompt, system_message, temperature, max_tokens)
-        elif self.provider == 'ollama':
-            return self._ollama_response(prompt, system_message, temperature, max_tokens)
-        else:
+        if self.router is None:
             return self._fallback_response(prompt)
+        return self._complete(self._build_messages(prompt, system_message), temperature, max_tokens,
+                              json_mode, priority)
 
-    def _openai_response(self, prompt: str, system_message: Optional[str] = None,
-                        temperature: float = 0.7, max_tokens: int = 500) -> str:
-        """Generate response using OpenAI API"""
-        try:
-            messages = []
-            if system_message:
-                messages.append({"role": "system", "content": system_message})
-            messages.append({"role": "user", "content": prompt})
-
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            return f"Error generating response: {str(e)}"
-
-    def _ollama_response(self, prompt: str, system_message: Optional[str] = None,
-                        temperature: float = 0.7, max_tokens: int = 500) -> str:
-        """Generate response using Ollama API"""
-        import requests
+    def generate_chat_response(self, messages: List[Dict[str, str]], temperature: float = 0.7,
+                               max_tokens: int = 500, priority: int = PRIORITY_INTERACTIVE) -> str:
+        """
+        Generate response from LLM for a list of chat messages
         
-        try:
-            full_prompt = prompt
-            if system_message:
-                full_prompt = f"{system_message}\n\n{prompt}"
-
-            response = requests.post(
-                'http://localhost:11434/api/generate',
-                json={
-                    'model': self.model,
-                    'prompt': full_prompt,
-                    'temperature': temperature,
-                    'num_predict': max_tokens,
-                    'stream': False
-                },
-                timeout=30
-            )
+        Args:
+            messages: Chat messages ({'role': ..., 'content': ...}) in order
+            temperature: Response creativity (0.0-1.0)
+            max_tokens: Maximum response length
+            priority: PRIORITY_INTERACTIVE if a candidate is waiting, else PRIORITY_BACKGROUND
+            
+        Returns:
+            Generated response text
             
-            if response.status_code == 200:
-                return response.json().get('response', '').strip()
-            else:
-                raise ConnectionError("Unable to connect to Ollama")
-        except (requests.exceptions.ConnectionError, ConnectionError):
-            # Fallback to OpenAI if Ollama is not available
-            print("[LLM] Ollama not available. Attempting to use OpenAI as fallback...")
-            self.provider = 'openai'
-            self.client = self._initialize_client()
-            return self._openai_response(prompt, system_message, temperature, max_tokens)
-        except Exception as e:
-            print(f"[LLM] Error with Ollama: {str(e)}")
-            return f"Error: Cannot connect to Ollama. Please ensure Ollama is running on localhost:11434. Fallback to OpenAI."
+        Raises:
+            LLMUnavailableError: If no provider could answer
+        """
+        if self.router is None:
+            return self._fallback_response(messages[-1]['content'] if messages else '')
+        return self._complete(messages, temperature, max_tokens, priority=priority)
+
+    def generate_response_stream(self, prompt: str, system_message: Optional[str] = None,
+                                 temperature: float = 0.7, max_tokens: int = 500,
+                                 priority: int = PRIORITY_INTERACTIVE) -> Iterator[str]:
+        """
+        Generate response from LLM, yielding text chunks as they arrive
+        
+        Args:
+            prompt: User prompt
+            system_message: System context message
+            temperature: Response creativity (0.0-1.0)
+            max_tokens: Maximum response length
+            priority: PRIORITY_INTERACTIVE if a candidate is waiting, else PRIORITY_BACKGROUND
+            
+        Yields:
+            Response text chunks
+            
+        Raises:
+            LLMUnavailableError: If no provider could start a response (before the first chunk)
+        """
+        started = time.perf_counter()
+        self._local.time_to_first_token = None
+        if self.router is None:
+            yield self._fallback_response(prompt)
+            return
+
+        try:
+            provider, chunks = self.router.stream(self._build_messages(prompt, system_message),
+                                                  temperature, max_tokens, priority)
+        except LLMProviderError as e:
+            raise LLMUnavailableError(str(e)) from e
+
+        for chunk in chunks:
+            if chunk and self._local.time_to_first_token is None:
+                self._local.time_to_first_token = time.perf_counter() - started
+            yield chunk
+        metrics.observe(f'llm.{provider}.stream_duration', time.perf_counter() - started)
+
+    def _complete(self, messages: List[Dict[str, str]], temperature: float, max_tokens: int,
+                  json_mode: bool = False, priority: int = PRIORITY_INTERACTIVE) -> str:
+        """Route a completion request"""
+        try:
+            _, response = self.router.complete(messages, temperature, max_tokens, json_mode, priority)
+            return response
+        except LLMProviderError as e:
+            raise LLMUnavailableError(str(e)) from e
+
+    def _build_messages(self, prompt: str, system_message: Optional[str] = None) -> List[Dict[str, str]]:
+        """Build chat messages for providers with a chat API"""
+        messages = []
+        if system_message:
+            messages.append({"role": "system", "content": system_message})
+        messages.append({"role": "user", "content": prompt})
+        return messages
 
     def _fallback_response(self, prompt: str) -> str:
         """Fallback response when LLM provider is unavailable"""
         return f"I'm currently unable to process your request. Please ensure the LLM provider is configured correctly."
 
 
+_shared_clients: Dict[str, LLMClient] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_shared_client(provider: Optional[str] = None) -> LLMClient:
+    """
+    Get the process-wide LLM client for a provider
+    
+    Clients are created once per provider and shared by every session
+    in the process, so the environment is read and the HTTP stack is
+    built only once. Per-conversation state belongs in ConversationManager.
+    
+    Args:
+        provider: LLM provider type ('openai', 'ollama', or None for default)
+        
+    Returns:
+        Shared LLMClient instance
+    """
+    key = (provider or os.getenv('LLM_PROVIDER', 'openai')).lower()
+    client = _shared_clients.get(key)
+    if client is None:
+        with _shared_clients_lock:
+            client = _shared_clients.get(key)
+            if client is None:
+                client = LLMClient(key)
+                _shared_clients[key] = client
+    return client
+
+
 class ConversationManager:
-    """Manages multi-turn conversations with context"""
+    """Manages multi-turn conversations with a token-budgeted context window"""
+
+    # Approximate per-message overhead of the chat format
+    MESSAGE_OVERHEAD_TOKENS = 4
 
-    def __init__(self, llm_client: LLMClient, system_prompt: str):
+    def __init__(self, llm_client: LLMClient, system_prompt: str,
+                 token_budget: Optional[int] = None, summarize_evicted: Optional[bool] = None,
+                 low_watermark: float = 0.75, summary_max_tokens: int = 200,
+                 message_log: Optional[MessageLog] = None):
         """
         Initialize Conversation Manager
         
         Args:
             llm_client: Initialized LLM client
-            system_prompt: System-level instructions for the conversation
+            system_prompt: System-level instructions for the conversation (always kept)
+            token_budget: Maximum prompt tokens sent per request
+            summarize_evicted: Replace turns that fall out of the window with a rolling summary
+            low_watermark: Fraction of the budget to shrink to once it is exceeded, so
+                eviction (and summarization) happens in batches rather than every turn
+            summary_max_tokens: Maximum length of the rolling summary
+            message_log: Log to record the conversation in, e.g. one shared with an
+                interview session (a private one by default)
         """
+        if token_budget is None:
+            token_budget = int(os.getenv('CONTEXT_TOKEN_BUDGET', '3000'))
+        if summarize_evicted is None:
+            summarize_evicted = os.getenv('CONTEXT_SUMMARIZE', 'false').lower() == 'true'
+
         self.llm_client = llm_client
         self.system_prompt = system_prompt
-        self.conversation_history: List[Dict[str, str]] = []
+        self.token_budget = token_budget
+        self.summarize_evicted = summarize_evicted
+        self.low_watermark = low_watermark
+        self.summary_max_tokens = summary_max_tokens
+        self.message_log = message_log if message_log is not None else MessageLog()
+        self.conversation_history: MessageView = self.message_log.view(View.CONTEXT)
+        self.summary = ""
+
+        # Messages currently in the context window, with their running token count
+        self._window: Deque[Tuple[Message, int]] = deque()
+        self._window_tokens = 0
+        self._evicted: List[Message] = []
+        self._system_tokens = self._message_tokens(system_prompt)
+        self._summary_tokens = 0
+
+    def add_message(self, role: str, content: str) -> Message:
+        """Add message to conversation history and the context window"""
+        message = self.message_log.append(role, content, View.CONTEXT)
+        self._track(message)
+        return message
+
+    def rebuild_context(self):
+        """
+        Refill the context window from the conversation history (after restoring the message log)
 
-    def add_message(self, role: str, content: str):
-        """Add message to conversation history"""
-        self.conversation_history.append({"role": role, "content": content})
+        The summary is dropped too: messages that no longer fit are evicted
+        again and summarized on the next response.
+        """
+        self._window.clear()
+        self._window_tokens = 0
+        self.summary = ""
+        self._summary_tokens = 0
+        self._evicted = []
+        for message in self.conversation_history:
+            self._track(message)
+
+    def _track(self, message: Message):
+        """Add a message to the context window"""
+        tokens = self._message_tokens(message.text)
+        self._window.append((message, tokens))
+        self._window_tokens += tokens
+        self._enforce_budget()
 
     def get_response(self, user_input: str, temperature: float = 0.7) -> str:
         """
@@ -163,36 +341,94 @@ class ConversationManager:
             
         Returns:
             LLM generated response
+            
+        Raises:
+            LLMUnavailableError: If no provider could answer (the user message stays in the history)
         """
         self.add_message("user", user_input)
-        
-        # Format conversation history as context
-        context = self._format_context()
-        response = self.llm_client.generate_response(
-            prompt=context + user_input,
-            system_message=self.system_prompt,
+
+        if self._evicted and self.summarize_evicted:
+            self._summarize_evicted()
+
+        response = self.llm_client.generate_chat_response(
+            self.build_messages(),
             temperature=temperature
         )
-        
+
         self.add_message("assistant", response)
         return response
 
-    def _format_context(self) -> str:
-        """Format conversation history for context"""
-        if not self.conversation_history:
-            return ""
-        
-        context = "Previous conversation:\n"
-        for msg in self.conversation_history[:-1]:  # Exclude the last message (current user input)
-            role = "You" if msg['role'] == "user" else "Assistant"
-            context += f"{role}: {msg['content']}\n"
+    def build_messages(self) -> List[Dict[str, str]]:
+        """
+        Build the chat messages sent to the LLM
         
-        return context
+        Returns:
+            Pinned system prompt, rolling summary (if any) and the messages
+            in the context window, oldest first
+        """
+        messages = [{"role": "system", "content": self.system_prompt}]
+        if self.summary:
+            messages.append({"role": "system", "content": f"Summary of the earlier conversation:\n{self.summary}"})
+        messages.extend({"role": message.role.value, "content": message.text} for message, _ in self._window)
+        return messages
+
+    def context_tokens(self) -> int:
+        """Approximate prompt tokens of the current context"""
+        return self._system_tokens + self._summary_tokens + self._window_tokens
+
+    def _message_tokens(self, content: str) -> int:
+        """Approximate tokens of one message including chat-format overhead"""
+        return estimate_tokens(content) + self.MESSAGE_OVERHEAD_TOKENS
+
+    def _enforce_budget(self):
+        """Evict the oldest turns once the context exceeds the token budget"""
+        if self.context_tokens() <= self.token_budget:
+            return
+
+        target = int(self.token_budget * self.low_watermark)
+        # Always keep the latest message, even if it alone exceeds the budget
+        while len(self._window) > 1 and self.context_tokens() > target:
+            message, tokens = self._window.popleft()
+            self._window_tokens -= tokens
+            if self.summarize_evicted:
+                self._evicted.append(message)
+
+    def _summarize_evicted(self):
+        """Fold evicted turns into the rolling summary"""
+        transcript = "\n".join(
+            f"{'Candidate' if msg.role == Role.USER else 'Assistant'}: {msg.text}"
+            for msg in self._evicted
+        )
+        previous = f"Current summary:\n{self.summary}\n\n" if self.summary else ""
+        try:
+            summary = self.llm_client.generate_response(
+                f"{previous}New conversation turns:\n{transcript}\n\n"
+                "Update the summary to cover all of the above in a few sentences. "
+                "Keep facts about the candidate (experience, skills, answers). Respond with the summary only.",
+                system_message="You summarize interview conversations concisely.",
+                temperature=0.3,
+                max_tokens=self.summary_max_tokens,
+                priority=PRIORITY_BACKGROUND
+            )
+        except LLMUnavailableError as e:
+            # Keep the evicted turns and fold them in on a later turn
+            print(f"[LLM] Skipping conversation summary: {str(e)}")
+            return
+        self._evicted = []
+        if summary:
+            self.summary = summary.strip()
+            self._summary_tokens = self._message_tokens(self.summary)
+            self._enforce_budget()
 
     def clear_history(self):
         """Clear conversation history"""
-        self.conversation_history = []
+        self.message_log.hide(View.CONTEXT)
+        self.summary = ""
+        self._window.clear()
+        self._window_tokens = 0
+        self._evicted = []
+        self._summary_tokens = 0
 
-    def get_history(self) -> List[Dict[str, str]]:
+    def get_history(self) -> MessageView:
         """Get conversation history"""
         return self.conversation_history
@@ -0,0 +1,493 @@
+"""
+LLM Providers Module
+Backends for the LLM providers the client can route requests to
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
+
+from utils.metrics import metrics
+from utils.rate_limiter import get_rate_limiter
+
+
+class LLMProviderError(Exception):
+    """Raised when a provider fails to produce a response"""
+
+
+class LLMRateLimitError(LLMProviderError):
+    """Raised when a provider is over its rate limit (HTTP 429 or local admission control)"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class LLMUnavailableError(LLMProviderError):
+    """Raised by LLMClient when no provider could answer a request"""
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a text
+    
+    Uses the common ~4 characters per token approximation, which is close
+    enough for budgeting context without loading a tokenizer.
+    
+    Args:
+        text: Text to measure
+        
+    Returns:
+        Approximate token count
+    """
+    return len(text) // 4 + 1
+
+
+def parse_retry_after(headers) -> Optional[float]:
+    """Seconds to wait from Retry-After / retry-after-ms response headers, if present"""
+    if not headers:
+        return None
+    try:
+        if headers.get('retry-after-ms'):
+            return float(headers['retry-after-ms']) / 1000
+        if headers.get('retry-after'):
+            return float(headers['retry-after'])
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+class LLMProvider:
+    """
+    A single LLM backend
+
+    Providers raise LLMProviderError on any failure instead of returning
+    error text, so the router can count failures and fail over.
+    """
+
+    name = 'base'
+
+    def __init__(self, model: str):
+        self.model = model
+        # Shared by every provider instance with the same name
+        self.limiter = get_rate_limiter(self.name)
+        self.last_active = 0.0
+
+    def complete(self, messages: List[Dict[str, str]], temperature: float = 0.7,
+                 max_tokens: int = 500, json_mode: bool = False) -> str:
+        """
+        Generate a complete response for chat messages
+
+        Args:
+            messages: Chat messages ({'role': ..., 'content': ...}) in order
+            temperature: Response creativity (0.0-1.0)
+            max_tokens: Maximum response length
+            json_mode: Constrain output to a JSON object
+
+        Returns:
+            Generated response text
+        """
+        raise NotImplementedError
+
+    def stream(self, messages: List[Dict[str, str]], temperature: float = 0.7,
+               max_tokens: int = 500) -> Iterator[str]:
+        """
+        Generate a response for chat messages, yielding text chunks as they arrive
+
+        Errors before the first chunk raise LLMProviderError; errors after it
+        end the stream early.
+        """
+        raise NotImplementedError
+
+    def health_check(self) -> bool:
+        """Cheap check whether the provider is reachable"""
+        raise NotImplementedError
+
+    def warm_up(self) -> bool:
+        """Prepare the provider for the first request (nothing to do by default)"""
+        return True
+
+    def start_keep_warm(self, interval: float, active_window: float):
+        """Keep the provider warm while the app is in use (nothing to do by default)"""
+
+    def mark_active(self):
+        """Record that the app is in use"""
+        self.last_active = time.monotonic()
+
+
+class OpenAIProvider(LLMProvider):
+    """OpenAI chat completions API"""
+
+    name = 'openai'
+
+    def __init__(self, model: Optional[str] = None):
+        super().__init__(model or 'gpt-3.5-turbo')
+        self.client = None
+        self.init_error = None
+        try:
+            from openai import OpenAI
+            api_key = os.getenv('OPENAI_API_KEY')
+            if not api_key:
+                raise ValueError("OPENAI_API_KEY not set in environment")
+            # 429s are retried by the router through the shared rate limiter,
+            # other failures fail over to the next provider
+            self.client = OpenAI(api_key=api_key, max_retries=0)
+        except ImportError:
+            self.init_error = "OpenAI package not installed. Install with: pip install openai"
+        except Exception as e:
+            self.init_error = str(e)
+
+    def complete(self, messages: List[Dict[str, str]], temperature: float = 0.7,
+                 max_tokens: int = 500, json_mode: bool = False) -> str:
+        self._require_client()
+        try:
+            extra_args = {'response_format': {'type': 'json_object'}} if json_mode else {}
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **extra_args
+            )
+            return response.choices[0].message.content
+        except Exception as e:
+            raise self._provider_error(e) from e
+
+    def stream(self, messages: List[Dict[str, str]], temperature: float = 0.7,
+               max_tokens: int = 500) -> Iterator[str]:
+        self._require_client()
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True
+            )
+        except Exception as e:
+            raise self._provider_error(e) from e
+        return self._iter_stream(stream)
+
+    @staticmethod
+    def _iter_stream(stream) -> Iterator[str]:
+        started = False
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    started = True
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            if not started:
+                raise LLMProviderError(str(e)) from e
+            print(f"[LLM] Error while streaming from OpenAI: {str(e)}")
+
+    def health_check(self) -> bool:
+        if self.client is None:
+            return False
+        try:
+            self.client.with_options(timeout=5.0, max_retries=0).models.list()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _provider_error(error: Exception) -> LLMProviderError:
+        """Wrap an OpenAI SDK error, keeping the Retry-After of rate limit errors"""
+        if getattr(error, 'status_code', None) == 429:
+            response = getattr(error, 'response', None)
+            return LLMRateLimitError(str(error), parse_retry_after(getattr(response, 'headers', None)))
+        return LLMProviderError(str(error))
+
+    def _require_client(self):
+        if self.client is None:
+            raise LLMProviderError(self.init_error or "OpenAI client not initialized")
+
+
+class OllamaProvider(LLMProvider):
+    """Local Ollama server over its HTTP API"""
+
+    name = 'ollama'
+
+    # Connection-pooled HTTP session shared by every provider in the process
+    _http_session = None
+    _http_session_lock = threading.Lock()
+
+    # Loading a large model from disk can take well over the normal read timeout
+    WARM_UP_TIMEOUT = 300.0
+
+    def __init__(self, model: Optional[str] = None):
+        super().__init__(model or os.getenv('OLLAMA_MODEL', 'mistral'))
+        self.base_url = os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434').rstrip('/')
+        self.timeout = (
+            float(os.getenv('OLLAMA_CONNECT_TIMEOUT', '3.05')),
+            float(os.getenv('OLLAMA_READ_TIMEOUT', '30'))
+        )
+        # How long Ollama keeps the model loaded after a request (e.g. "30m", "-1" for forever)
+        self.keep_alive = self._parse_keep_alive(os.getenv('OLLAMA_KEEP_ALIVE', '30m'))
+        # 'chat' sends messages to /api/chat; 'generate' flattens them into one prompt
+        self.use_chat = os.getenv('OLLAMA_API', 'generate').lower() == 'chat'
+        self._keep_warm_thread: Optional[threading.Thread] = None
+        self._keep_warm_lock = threading.Lock()
+
+    @staticmethod
+    def _parse_keep_alive(value: str):
+        """Ollama takes durations as strings ("30m") and plain seconds as numbers"""
+        try:
+            return int(value)
+        except ValueError:
+            return value
+
+    @classmethod
+    def get_http_session(cls):
+        """
+        Get the process-wide HTTP session used for Ollama requests
+
+        The session keeps connections alive and pooled across calls and
+        Streamlit sessions, and retries failed connections with backoff.
+        Generation requests (POST) are expensive and not idempotent, so
+        they are only retried when the connection could not be made;
+        gateway errors are retried for GET requests only. Pool size and
+        retry behaviour are read from the environment on first use.
+
+        Returns:
+            Shared requests.Session
+        """
+        if cls._http_session is not None:
+            return cls._http_session
+
+        with cls._http_session_lock:
+            if cls._http_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                pool_size = int(os.getenv('OLLAMA_POOL_SIZE', '10'))
+                max_retries = int(os.getenv('OLLAMA_MAX_RETRIES', '2'))
+                retry = Retry(
+                    total=max_retries,
+                    connect=max_retries,
+                    read=0,
+                    status=max_retries,
+                    # 503 means Ollama's queue is full: the router and rate
+                    # limiter handle it (failover, pause) without hidden retries
+                    status_forcelist=(502, 504),
+                    # Connect errors are retried for every method; read and
+                    # status retries only for these
+                    allowed_methods=frozenset({'GET'}),
+                    backoff_factor=float(os.getenv('OLLAMA_BACKOFF_FACTOR', '0.5')),
+                    raise_on_status=False
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=pool_size,
+                    pool_maxsize=pool_size,
+                    max_retries=retry,
+                    pool_block=True
+                )
+                session = requests.Session()
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                cls._http_session = session
+        return cls._http_session
+
+    @classmethod
+    def close_http_session(cls):
+        """Close the shared HTTP session and release pooled connections"""
+        with cls._http_session_lock:
+            if cls._http_session is not None:
+                cls._http_session.close()
+                cls._http_session = None
+
+    def complete(self, messages: List[Dict[str, str]], temperature: float = 0.7,
+                 max_tokens: int = 500, json_mode: bool = False) -> str:
+        payload = self._payload(messages, temperature, max_tokens, stream=False)
+        if json_mode:
+            payload['format'] = 'json'
+
+        response = self._post(payload)
+        try:
+            data = response.json()
+        except ValueError as e:
+            raise LLMProviderError(f"Invalid response from Ollama: {str(e)}") from e
+        self._record_timings(data)
+        return self._text(data).strip()
+
+    def stream(self, messages: List[Dict[str, str]], temperature: float = 0.7,
+               max_tokens: int = 500) -> Iterator[str]:
+        response = self._post(self._payload(messages, temperature, max_tokens, stream=True), stream=True)
+        return self._iter_stream(response)
+
+    def _iter_stream(self, response) -> Iterator[str]:
+        started = False
+        with response:
+            try:
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    data = json.loads(line)
+                    text = self._text(data)
+                    if text:
+                        started = True
+                        yield text
+                    if data.get('done'):
+                        self._record_timings(data)
+                        break
+            except Exception as e:
+                if not started:
+                    raise LLMProviderError(f"Ollama stream failed: {str(e)}") from e
+                print(f"[LLM] Error while streaming from Ollama: {str(e)}")
+
+    def health_check(self) -> bool:
+        try:
+            response = self.get_http_session().get(f'{self.base_url}/api/tags', timeout=self.timeout[0])
+            return response.status_code == 200
+        except Exception:
+            return False
+
+    def warm_up(self) -> bool:
+        """
+        Load the model into memory
+
+        A generate request without a prompt makes Ollama load the model and
+        reset its keep-alive timer without generating anything.
+        """
+        started = time.perf_counter()
+        try:
+            response = self.get_http_session().post(
+                f'{self.base_url}/api/generate',
+                json={'model': self.model, 'keep_alive': self.keep_alive},
+                timeout=(self.timeout[0], self.WARM_UP_TIMEOUT)
+            )
+            response.close()
+        except Exception as e:
+            print(f"[LLM] Ollama warm-up failed: {str(e)}")
+            return False
+        if response.status_code != 200:
+            print(f"[LLM] Ollama warm-up failed: HTTP {response.status_code}")
+            return False
+        metrics.observe('llm.ollama.warm_up', time.perf_counter() - started)
+        return True
+
+    def start_keep_warm(self, interval: float, active_window: float):
+        """
+        Ping the model every `interval` seconds while the app is in use
+
+        Pings only happen while mark_active was called within the last
+        `active_window` seconds, so an idle deployment lets Ollama unload
+        the model after its keep-alive.
+        """
+        with self._keep_warm_lock:
+            if self._keep_warm_thread is not None or interval <= 0:
+                return
+
+            def keep_warm():
+                while True:
+                    time.sleep(interval)
+                    if time.monotonic() - self.last_active < active_window:
+                        self.warm_up()
+
+            self._keep_warm_thread = threading.Thread(target=keep_warm, name='ollama-keep-warm', daemon=True)
+            self._keep_warm_thread.start()
+
+    def _payload(self, messages: List[Dict[str, str]], temperature: float, max_tokens: int,
+                 stream: bool) -> Dict:
+        """Request body for the chat or generate endpoint"""
+        payload = {
+            'model': self.model,
+            'stream': stream,
+            'keep_alive': self.keep_alive,
+            'options': {'temperature': temperature, 'num_predict': max_tokens}
+        }
+        if self.use_chat:
+            payload['messages'] = messages
+        elif len(messages) == 2 and messages[0]['role'] == 'system' and messages[1]['role'] == 'user':
+            # Sent separately, the system message is rendered first by the model's
+            # template, so requests sharing it share a prompt prefix Ollama can reuse
+            payload['system'] = messages[0]['content']
+            payload['prompt'] = messages[1]['content']
+        else:
+            payload['prompt'] = self._to_prompt(messages)
+        return payload
+
+    def _text(self, data: Dict) -> str:
+        """Generated text of a response (or stream chunk) from either endpoint"""
+        if self.use_chat:
+            return (data.get('message') or {}).get('content', '')
+        return data.get('response', '')
+
+    @staticmethod
+    def _record_timings(data: Dict):
+        """
+        Record Ollama's timings for a request: model load and prompt processing
+
+        prompt_eval_count only counts prompt tokens that were processed for
+        this request; tokens of a prefix reused from the previous request's
+        KV cache are not processed again.
+        """
+        load_seconds = data.get('load_duration', 0) / 1e9
+        if load_seconds:
+            metrics.observe('llm.ollama.load_duration', load_seconds)
+            if load_seconds > 1.0:
+                metrics.increment('llm.ollama.cold_load')
+        if 'prompt_eval_count' in data:
+            metrics.observe('llm.ollama.prompt_eval_tokens', data['prompt_eval_count'])
+            metrics.observe('llm.ollama.prompt_eval_duration', data.get('prompt_eval_duration', 0) / 1e9)
+
+    def _post(self, payload: Dict, stream: bool = False):
+        """POST to the chat or generate endpoint, raising LLMProviderError on failure"""
+        import requests
+
+        try:
+            response = self.get_http_session().post(
+                f"{self.base_url}/api/{'chat' if self.use_chat else 'generate'}",
+                json=payload,
+                timeout=self.timeout,
+                stream=stream
+            )
+        except requests.exceptions.RequestException as e:
+            raise LLMProviderError(f"Cannot connect to Ollama at {self.base_url}: {str(e)}") from e
+        if response.status_code != 200:
+            response.close()
+            if response.status_code in (429, 503):
+                # Ollama answers 503 when its request queue is full
+                raise LLMRateLimitError(f"Ollama is busy (HTTP {response.status_code})",
+                                        parse_retry_after(response.headers))
+            raise LLMProviderError(f"Ollama returned HTTP {response.status_code}")
+        return response
+
+    @staticmethod
+    def _to_prompt(messages: List[Dict[str, str]]) -> str:
+        """Turn chat messages into a single prompt for the generate endpoint"""
+        if len(messages) == 1 and messages[0]['role'] == 'user':
+            return messages[0]['content']
+
+        lines = []
+        for msg in messages:
+            if msg['role'] == 'system':
+                lines.append(f"{msg['content']}\n")
+            else:
+                role = "User" if msg['role'] == "user" else "Assistant"
+                lines.append(f"{role}: {msg['content']}")
+        lines.append("Assistant:")
+        return "\n".join(lines)
+
+
+PROVIDERS = {
+    'openai': OpenAIProvider,
+    'ollama': OllamaProvider,
+}
+
+
+def create_provider(name: str) -> Optional[LLMProvider]:
+    """
+    Create a provider backend by name
+
+    Args:
+        name: 'openai' or 'ollama'
+
+    Returns:
+        Provider instance, or None for unknown names
+    """
+    provider_class = PROVIDERS.get(name.strip().lower())
+    return provider_class() if provider_class else None
@@ -0,0 +1,376 @@
+"""
+LLM Router Module
+Routes LLM calls over provider backends with circuit breakers, failback and hedged requests
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from utils.llm_providers import LLMProvider, LLMProviderError, LLMRateLimitError, estimate_tokens
+from utils.metrics import metrics
+from utils.rate_limiter import PRIORITY_INTERACTIVE, RateLimitExceeded
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one provider
+
+    Closed: requests flow. After `failure_threshold` consecutive failures the
+    circuit opens and requests are refused, so callers fail over immediately
+    instead of waiting on a provider that is down. After `reset_timeout`
+    seconds one probe request is let through (half-open); its outcome closes
+    or re-opens the circuit. A successful health check also closes it.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        """
+        Initialize Circuit Breaker
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds before an open circuit lets a probe request through
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent (claims the probe when half-open)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self) -> bool:
+        """
+        Record a successful request or health check
+
+        Returns:
+            True if this closed a circuit that was not closed
+        """
+        with self._lock:
+            was_closed = self.state == self.CLOSED
+            self.state = self.CLOSED
+            self.failures = 0
+            return not was_closed
+
+    def record_failure(self) -> bool:
+        """
+        Record a failed request
+
+        Returns:
+            True if this opened the circuit
+        """
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or (
+                    self.state == self.CLOSED and self.failures >= self.failure_threshold):
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+    def release(self):
+        """Give back a probe that ended without a verdict (e.g. rate limited)"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+
+    @property
+    def is_closed(self) -> bool:
+        return self.state == self.CLOSED
+
+
+class ProviderRouter:
+    """
+    Sends each request to the first healthy provider in priority order
+
+    A failed provider is skipped in favour of the next one (failover). Once a
+    provider's circuit opens, a background thread health-checks it and closes
+    the circuit when it recovers, so traffic returns to the preferred provider
+    (failback) without spending a user request on it.
+
+    With hedging enabled, a request that has not completed within the p95
+    latency of the provider it was sent to is also sent to the next provider,
+    and whichever answers first is used. Streams are hedged on the time to
+    their first chunk.
+
+    Every request first passes the provider's process-wide rate limiter. A
+    429 pauses that limiter for the Retry-After period and the request is
+    queued again; rate limiting never counts against the circuit breaker.
+    """
+
+    # Observations needed before the p95 latency is trusted as the hedge delay
+    HEDGE_MIN_SAMPLES = 20
+    MIN_HEDGE_DELAY = 0.1
+    # Retries of a request answered with 429, and the pause when no Retry-After is given
+    RATE_LIMIT_RETRIES = 2
+    DEFAULT_RETRY_AFTER = 2.0
+
+    def __init__(self, providers: List[LLMProvider], hedge: bool = False, hedge_delay: float = 5.0,
+                 failure_threshold: int = 3, reset_timeout: float = 30.0,
+                 health_check_interval: float = 10.0, max_workers: int = 16):
+        """
+        Initialize Provider Router
+
+        Args:
+            providers: Provider backends in priority order
+            hedge: Send slow requests to the next provider as well
+            hedge_delay: Hedge delay used until enough latencies were observed
+            failure_threshold: Consecutive failures that open a provider's circuit
+            reset_timeout: Seconds before an open circuit lets a probe request through
+            health_check_interval: Seconds between health checks of providers with an open circuit
+            max_workers: Threads available for hedged requests
+        """
+        if not providers:
+            raise ValueError("ProviderRouter needs at least one provider")
+        self.providers = providers
+        self.hedge = hedge and len(providers) > 1
+        self.hedge_delay = hedge_delay
+        self.health_check_interval = health_check_interval
+        self.breakers: Dict[str, CircuitBreaker] = {
+            provider.name: CircuitBreaker(failure_threshold, reset_timeout) for provider in providers
+        }
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='llm-hedge') \
+            if self.hedge else None
+        self._monitor: Optional[threading.Thread] = None
+        self._monitor_lock = threading.Lock()
+
+    def complete(self, messages: List[Dict[str, str]], temperature: float = 0.7,
+                 max_tokens: int = 500, json_mode: bool = False,
+                 priority: int = PRIORITY_INTERACTIVE) -> Tuple[str, str]:
+        """
+        Generate a complete response
+
+        Args:
+            messages: Chat messages ({'role': ..., 'content': ...}) in order
+            temperature: Response creativity (0.0-1.0)
+            max_tokens: Maximum response length
+            json_mode: Constrain output to a JSON object
+            priority: Admission priority (PRIORITY_INTERACTIVE or PRIORITY_BACKGROUND)
+
+        Returns:
+            Tuple of (name of the provider that answered, response text)
+
+        Raises:
+            LLMProviderError: If no provider produced a response
+        """
+        def call(provider: LLMProvider) -> str:
+            return provider.complete(messages, temperature, max_tokens, json_mode)
+
+        return self._route(call, 'latency', self._cost(messages, max_tokens), priority)
+
+    def stream(self, messages: List[Dict[str, str]], temperature: float = 0.7,
+               max_tokens: int = 500, priority: int = PRIORITY_INTERACTIVE) -> Tuple[str, Iterator[str]]:
+        """
+        Generate a response, yielding text chunks as they arrive
+
+        Failover and hedging only happen before the first chunk; once a
+        provider has started answering, the stream stays with it.
+
+        Args:
+            messages: Chat messages ({'role': ..., 'content': ...}) in order
+            temperature: Response creativity (0.0-1.0)
+            max_tokens: Maximum response length
+            priority: Admission priority (PRIORITY_INTERACTIVE or PRIORITY_BACKGROUND)
+
+        Returns:
+            Tuple of (name of the provider that answered, chunk iterator)
+
+        Raises:
+            LLMProviderError: If no provider started a response
+        """
+        def call(provider: LLMProvider) -> Tuple[Optional[str], Iterator[str]]:
+            chunks = provider.stream(messages, temperature, max_tokens)
+            return next(chunks, None), chunks
+
+        def discard(opened: Tuple[Optional[str], Iterator[str]]):
+            close = getattr(opened[1], 'close', None)
+            if close:
+                close()
+
+        name, (first, chunks) = self._route(call, 'time_to_first_token', self._cost(messages, max_tokens),
+                                            priority, discard)
+        return name, self._chain(first, chunks)
+
+    def status(self) -> Dict[str, str]:
+        """Get the circuit state of every provider"""
+        return {name: breaker.state for name, breaker in self.breakers.items()}
+
+    @staticmethod
+    def _chain(first: Optional[str], chunks: Iterator[str]) -> Iterator[str]:
+        if first is not None:
+            yield first
+        yield from chunks
+
+    @staticmethod
+    def _cost(messages: List[Dict[str, str]], max_tokens: int) -> int:
+        """Estimated tokens of a request, prompt plus the completion limit"""
+        return sum(estimate_tokens(message['content']) for message in messages) + max_tokens
+
+    def _route(self, call: Callable, latency_metric: str, cost: int, priority: int,
+               discard: Optional[Callable] = None):
+        request = (call, latency_metric, cost, priority)
+        if self.hedge:
+            return self._route_hedged(request, latency_metric, discard)
+        return self._route_sequential(request)
+
+    def _route_sequential(self, request: tuple):
+        """Try providers one after another until one answers"""
+        errors = []
+        for provider in self._candidates():
+            if errors:
+                metrics.increment('llm.failover')
+            try:
+                return provider.name, self._call(provider, *request)
+            except LLMProviderError as e:
+                errors.append(f"{provider.name}: {str(e)}")
+        raise self._no_provider_error(errors)
+
+    def _route_hedged(self, request: tuple, latency_metric: str, discard: Optional[Callable]):
+        """Start with the preferred provider and add the next one when it is slow or fails"""
+        candidates = self._candidates()
+        pending: Dict[Future, LLMProvider] = {}
+        errors = []
+        exhausted = False
+
+        def launch_next() -> bool:
+            provider = next(candidates, None)
+            if provider is None:
+                return False
+            pending[self._executor.submit(self._call, provider, *request)] = provider
+            return True
+
+        if not launch_next():
+            raise self._no_provider_error(errors)
+        first_provider = next(iter(pending.values()))
+
+        while pending:
+            delay = None if exhausted else self._hedge_delay(first_provider, latency_metric)
+            done, _ = wait(pending, timeout=delay, return_when=FIRST_COMPLETED)
+            if not done:
+                # Slow: hedge with the next provider
+                if launch_next():
+                    metrics.increment('llm.hedge.fired')
+                else:
+                    exhausted = True
+                continue
+
+            for future in done:
+                provider = pending.pop(future)
+                try:
+                    result = future.result()
+                except LLMProviderError as e:
+                    errors.append(f"{provider.name}: {str(e)}")
+                    continue
+
+                if provider is not first_provider:
+                    metrics.increment('llm.hedge.won')
+                for other in pending:
+                    other.add_done_callback(lambda f: self._discard(f, discard))
+                return provider.name, result
+
+            # Failed: fail over to the next provider right away
+            if launch_next():
+                metrics.increment('llm.failover')
+            else:
+                exhausted = True
+
+        raise self._no_provider_error(errors)
+
+    @staticmethod
+    def _discard(future: Future, discard: Optional[Callable]):
+        """Release the result of a request that lost a hedge"""
+        if discard is None or future.cancelled() or future.exception() is not None:
+            return
+        discard(future.result())
+
+    def _candidates(self) -> Iterator[LLMProvider]:
+        """Providers whose circuit allows a request, in priority order (lazily, so probes are claimed only when used)"""
+        return (provider for provider in self.providers if self.breakers[provider.name].allow_request())
+
+    def _call(self, provider: LLMProvider, call: Callable, latency_metric: str, cost: int, priority: int):
+        """
+        Call one provider through its rate limiter
+
+        Records latency and the outcome on the provider's circuit breaker;
+        requests answered with 429 are retried after the Retry-After period.
+        """
+        breaker = self.breakers[provider.name]
+        for attempt in range(self.RATE_LIMIT_RETRIES + 1):
+            try:
+                provider.limiter.acquire(cost, priority)
+            except RateLimitExceeded as e:
+                breaker.release()
+                raise LLMRateLimitError(str(e), e.retry_after) from e
+
+            started = time.perf_counter()
+            try:
+                result = call(provider)
+            except LLMRateLimitError as e:
+                metrics.increment(f'llm.{provider.name}.rate_limited')
+                provider.limiter.pause(e.retry_after or self.DEFAULT_RETRY_AFTER * 2 ** attempt)
+                if attempt < self.RATE_LIMIT_RETRIES:
+                    print(f"[LLM] {provider.name} rate limited, retrying: {str(e)}")
+                    continue
+                breaker.release()
+                raise
+            except LLMProviderError as e:
+                print(f"[LLM] {provider.name} request failed: {str(e)}")
+                metrics.increment(f'llm.{provider.name}.errors')
+                if breaker.record_failure():
+                    print(f"[LLM] Circuit opened for {provider.name}")
+                    metrics.set_gauge(f'llm.{provider.name}.circuit_open', 1)
+                    self._start_health_monitor()
+                raise
+
+            metrics.observe(f'llm.{provider.name}.{latency_metric}', time.perf_counter() - started)
+            if breaker.record_success():
+                metrics.set_gauge(f'llm.{provider.name}.circuit_open', 0)
+            return result
+
+    def _hedge_delay(self, provider: LLMProvider, latency_metric: str) -> float:
+        """Seconds to wait on a provider before hedging: its p95 latency once enough samples exist"""
+        name = f'llm.{provider.name}.{latency_metric}'
+        if metrics.count(name) < self.HEDGE_MIN_SAMPLES:
+            return self.hedge_delay
+        return max(self.MIN_HEDGE_DELAY, metrics.percentile(name, 95))
+
+    @staticmethod
+    def _no_provider_error(errors: List[str]) -> LLMProviderError:
+        if not errors:
+            return LLMProviderError("No LLM provider available (all circuits open)")
+        return LLMProviderError("All LLM providers failed: " + "; ".join(errors))
+
+    def _start_health_monitor(self):
+        """Start the health-check thread unless it is already running"""
+        with self._monitor_lock:
+            if self._monitor is None:
+                self._monitor = threading.Thread(target=self._health_monitor, name='llm-health', daemon=True)
+                self._monitor.start()
+
+    def _health_monitor(self):
+        """Health-check providers with an open circuit until every circuit is closed again"""
+        while True:
+            time.sleep(self.health_check_interval)
+            for provider in self.providers:
+                breaker = self.breakers[provider.name]
+                if not breaker.is_closed and provider.health_check() and breaker.record_success():
+                    print(f"[LLM] {provider.name} is healthy again, circuit closed")
+                    metrics.set_gauge(f'llm.{provider.name}.circuit_open', 0)
+            with self._monitor_lock:
+                if all(breaker.is_closed for breaker in self.breakers.values()):
+                    self._monitor = None
+                    return
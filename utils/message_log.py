@@ -0,0 +1,221 @@
+"""
+Message Log Module
+Single append-only store of a session's messages, with the chat, transcript and LLM context as views over it
+"""
+
+import time
+from bisect import bisect_left
+from enum import Enum, IntFlag
+from typing import Dict, Iterator, List, Optional, Sequence
+
+
+class Role(str, Enum):
+    """Author of a message"""
+    USER = 'user'
+    ASSISTANT = 'assistant'
+    SYSTEM = 'system'
+
+
+class View(IntFlag):
+    """Views a message belongs to"""
+    CHAT = 1        # Shown in the chat
+    TRANSCRIPT = 2  # Part of the saved interview transcript
+    CONTEXT = 4     # Sent to the LLM as conversation context (ConversationManager)
+
+
+class Message:
+    """
+    One message of a conversation
+
+    A slotted record rather than a dict: a session keeps every message
+    exactly once, and hundreds of sessions can live in one process.
+    """
+
+    __slots__ = ('role', 'text', 'timestamp', 'views', 'question', 'pending')
+
+    def __init__(self, role: Role, text: str, views: View, timestamp: Optional[float] = None,
+                 question: Optional[int] = None, pending: bool = False):
+        """
+        Initialize Message
+
+        Args:
+            role: Author of the message
+            text: Message content
+            views: Views the message belongs to
+            timestamp: Seconds since the epoch (now by default)
+            question: For answer feedback, the index of the question it evaluates
+            pending: Placeholder for feedback that is still being generated
+        """
+        self.role = role
+        self.text = text
+        self.views = views
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.question = question
+        self.pending = pending
+
+    def __repr__(self) -> str:
+        return f"Message({self.role.value}, {self.text[:40]!r}, views={self.views!r})"
+
+    def to_dict(self) -> Dict:
+        """Plain role/content dict, as in saved and exported transcripts"""
+        message = {'role': self.role.value, 'content': self.text}
+        if self.pending:
+            message['pending'] = True
+        return message
+
+
+class MessageView(Sequence):
+    """
+    Read-only projection of a message log onto one view
+
+    Holds no messages of its own: it reads the log's positions of the
+    messages in the view, so it always reflects the current log, and
+    indexing and len() take constant time.
+    """
+
+    __slots__ = ('_log', '_view')
+
+    def __init__(self, log: 'MessageLog', view: View):
+        self._log = log
+        self._view = view
+
+    def __iter__(self) -> Iterator[Message]:
+        messages = self._log._messages
+        return (messages[position] for position in self._log._positions(self._view))
+
+    def __len__(self) -> int:
+        return len(self._log._positions(self._view))
+
+    def __getitem__(self, index):
+        messages = self._log._messages
+        positions = self._log._positions(self._view)[index]
+        if isinstance(index, slice):
+            return [messages[position] for position in positions]
+        return messages[positions]
+
+    def __repr__(self) -> str:
+        return f"MessageView({self._view!r}, {len(self)} messages)"
+
+    def to_list(self) -> List[Dict]:
+        """Messages as plain dicts (see Message.to_dict)"""
+        return [message.to_dict() for message in self]
+
+
+class MessageLog:
+    """
+    Append-only log of a session's messages
+
+    Every message is stored once. The chat, the interview transcript and the
+    LLM conversation context are views over the log (see View), so a message
+    that appears in several of them is not copied. Messages are never
+    removed; hiding one takes it out of its views.
+
+    The log keeps the positions of each view's messages, so views must be
+    changed with show() and hide() rather than on the messages themselves.
+    """
+
+    def __init__(self):
+        self._messages: List[Message] = []
+        # Log positions of the messages in each view, in order
+        self._view_positions: Dict[View, List[int]] = {view: [] for view in View}
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __iter__(self) -> Iterator[Message]:
+        return iter(self._messages)
+
+    def __getitem__(self, index):
+        return self._messages[index]
+
+    def append(self, role, text: str, views: View, **metadata) -> Message:
+        """
+        Append a message
+
+        Args:
+            role: Role or its value ('user', 'assistant', 'system')
+            text: Message content
+            views: Views the message belongs to
+            **metadata: question and pending (see Message)
+
+        Returns:
+            The new message
+        """
+        message = Message(Role(role), text, views, **metadata)
+        self._messages.append(message)
+        for view in View:
+            if views & view:
+                self._view_positions[view].append(len(self._messages) - 1)
+        return message
+
+    def view(self, view: View) -> MessageView:
+        """Projection of the log onto one view"""
+        return MessageView(self, view)
+
+    def since(self, position: int, view: View) -> List[Message]:
+        """Messages in a view appended at or after a position of the log (see len())"""
+        positions = self._positions(view)
+        messages = self._messages
+        return [messages[p] for p in positions[bisect_left(positions, position):]]
+
+    def index(self, message: Message) -> int:
+        """Position of a message in the log"""
+        return next(i for i, m in enumerate(self._messages) if m is message)
+
+    def hide(self, views: View, messages: Optional[Sequence[Message]] = None):
+        """
+        Take messages out of views
+
+        Args:
+            views: Views to remove the messages from
+            messages: Messages to hide (default: all)
+        """
+        for message in (self._messages if messages is None else messages):
+            message.views &= ~views
+        self._reindex()
+
+    def show(self, views: View, messages: Sequence[Message]):
+        """
+        Add messages to views
+
+        Args:
+            views: Views to add the messages to
+            messages: Messages to show
+        """
+        for message in messages:
+            message.views |= views
+        self._reindex()
+
+    def to_state(self) -> List[List]:
+        """
+        Messages as compact JSON-serializable lists (see from_state)
+
+        Each message is [role, text, views, timestamp], followed by
+        [question, pending] for answer feedback.
+        """
+        entries = []
+        for message in self._messages:
+            entry = [message.role.value, message.text, int(message.views), round(message.timestamp, 3)]
+            if message.question is not None or message.pending:
+                entry += [message.question, int(message.pending)]
+            entries.append(entry)
+        return entries
+
+    def load_state(self, entries: List[List]):
+        """Append messages saved with to_state"""
+        for role, text, views, timestamp, *feedback in entries:
+            question, pending = feedback or (None, 0)
+            self._messages.append(Message(Role(role), text, View(views), timestamp, question, bool(pending)))
+        self._reindex()
+
+    def _positions(self, view: View) -> List[int]:
+        """Log positions of the messages in a view (or in any of several views)"""
+        positions = self._view_positions.get(view)
+        if positions is None:
+            positions = [i for i, message in enumerate(self._messages) if message.views & view]
+        return positions
+
+    def _reindex(self):
+        """Rebuild the view positions after views changed"""
+        for view in self._view_positions:
+            self._view_positions[view] = [i for i, message in enumerate(self._messages) if message.views & view]
@@ -0,0 +1,104 @@
+"""
+Metrics Module
+Lightweight, process-wide collection of latency and counter metrics
+"""
+
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional
+
+
+class MetricsRegistry:
+    """Thread-safe registry of observed values, counters and gauges"""
+
+    def __init__(self, window: int = 1000):
+        """
+        Initialize Metrics Registry
+
+        Args:
+            window: Number of most recent observations kept per metric
+        """
+        self.window = window
+        self._lock = threading.Lock()
+        self._observations: Dict[str, Deque[float]] = {}
+        self._counters: Dict[str, int] = {}
+        self._gauges: Dict[str, float] = {}
+
+    def observe(self, name: str, value: float):
+        """Record a single observation (e.g. a latency in seconds)"""
+        with self._lock:
+            samples = self._observations.get(name)
+            if samples is None:
+                samples = deque(maxlen=self.window)
+                self._observations[name] = samples
+            samples.append(value)
+
+    def increment(self, name: str, amount: int = 1):
+        """Increment a counter"""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def set_gauge(self, name: str, value: float):
+        """Set the current value of a gauge"""
+        with self._lock:
+            self._gauges[name] = value
+
+    def count(self, name: str) -> int:
+        """Get the number of recent observations kept for a metric"""
+        with self._lock:
+            return len(self._observations.get(name, ()))
+
+    def percentile(self, name: str, pct: float) -> Optional[float]:
+        """
+        Get a percentile of the recent observations for a metric
+
+        Args:
+            name: Metric name
+            pct: Percentile between 0 and 100
+
+        Returns:
+            Percentile value, or None if nothing was observed yet
+        """
+        with self._lock:
+            samples = sorted(self._observations.get(name, ()))
+        if not samples:
+            return None
+        index = min(len(samples) - 1, max(0, int(round(pct / 100 * (len(samples) - 1)))))
+        return samples[index]
+
+    def summary(self, name: str) -> Dict[str, float]:
+        """Get count, mean and p50/p95/p99 for an observed metric"""
+        with self._lock:
+            samples = list(self._observations.get(name, ()))
+        if not samples:
+            return {'count': 0}
+        return {
+            'count': len(samples),
+            'mean': sum(samples) / len(samples),
+            'p50': self.percentile(name, 50),
+            'p95': self.percentile(name, 95),
+            'p99': self.percentile(name, 99),
+        }
+
+    def snapshot(self) -> Dict:
+        """Get a copy of all metrics for display or export"""
+        with self._lock:
+            names = list(self._observations)
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+        return {
+            'observations': {name: self.summary(name) for name in names},
+            'counters': counters,
+            'gauges': gauges,
+        }
+
+    def reset(self):
+        """Clear all metrics"""
+        with self._lock:
+            self._observations.clear()
+            self._counters.clear()
+            self._gauges.clear()
+
+
+# Shared registry for the whole process
+metrics = MetricsRegistry()
@@ -0,0 +1,114 @@
+"""
+Prefetch Module
+Speculative background work keyed on the inputs it was started with
+"""
+
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, TimeoutError
+from typing import Any, Callable, Hashable, Optional
+
+from utils.metrics import metrics
+
+
+class PrefetchHandle:
+    """Per-session slot holding the current speculative task and its input key"""
+
+    def __init__(self):
+        self.key: Optional[Hashable] = None
+        self.future: Optional[Future] = None
+        self._lock = threading.Lock()
+
+
+class Prefetcher:
+    """Runs speculative tasks on a shared thread pool"""
+
+    def __init__(self, max_workers: int = 4):
+        """
+        Initialize Prefetcher
+
+        Args:
+            max_workers: Maximum number of tasks running at the same time
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='prefetch')
+
+    def prefetch(self, handle: PrefetchHandle, key: Hashable, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Start a task for the given inputs, replacing any task started for other inputs
+
+        Calling this again with the same key keeps the existing task, so it is
+        safe to call on every Streamlit rerun.
+
+        Args:
+            handle: Session's prefetch slot
+            key: Identifies the inputs the task depends on
+            fn: Function to run in the background
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future for the task
+        """
+        with handle._lock:
+            if handle.future is not None and handle.key == key and not handle.future.cancelled():
+                return handle.future
+
+            self._cancel_locked(handle)
+            handle.key = key
+            handle.future = self._executor.submit(fn, *args, **kwargs)
+            metrics.increment('prefetch.started')
+            return handle.future
+
+    def result(self, handle: PrefetchHandle, key: Hashable, timeout: Optional[float] = None) -> Optional[Any]:
+        """
+        Collect the result of the task started for the given inputs
+
+        Waits for the task if it is still running. The slot is emptied either way.
+
+        Args:
+            handle: Session's prefetch slot
+            key: Identifies the inputs the caller needs a result for
+            timeout: Maximum seconds to wait (None to wait indefinitely)
+
+        Returns:
+            Task result, or None if no matching task exists or it failed
+        """
+        with handle._lock:
+            future = handle.future
+            matches = future is not None and handle.key == key
+            if not matches:
+                self._cancel_locked(handle)
+                metrics.increment('prefetch.miss')
+                return None
+            handle.key = None
+            handle.future = None
+
+        try:
+            value = future.result(timeout=timeout)
+            metrics.increment('prefetch.hit')
+            return value
+        except (CancelledError, TimeoutError):
+            metrics.increment('prefetch.miss')
+            return None
+        except Exception as e:
+            print(f"[Prefetch] Background task failed: {str(e)}")
+            metrics.increment('prefetch.error')
+            return None
+
+    def cancel(self, handle: PrefetchHandle):
+        """Cancel the session's task, e.g. when its inputs are no longer valid"""
+        with handle._lock:
+            self._cancel_locked(handle)
+
+    def _cancel_locked(self, handle: PrefetchHandle):
+        """Cancel a task; a task that already started runs on but its result is dropped"""
+        if handle.future is not None:
+            if handle.future.cancel():
+                metrics.increment('prefetch.cancelled')
+            else:
+                metrics.increment('prefetch.discarded')
+        handle.key = None
+        handle.future = None
+
+    def shutdown(self):
+        """Stop accepting tasks and release worker threads"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
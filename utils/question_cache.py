@@ -0,0 +1,234 @@
+"""
+Question Cache Module
+Two-tier (memory + SQLite) cache of generated technical question pools
+"""
+
+import hashlib
+import json
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+
+from prompts.prompt_templates import PromptTemplates
+from utils.cache import LRUCache
+from utils.metrics import metrics
+
+
+QUESTION_NUMBER_PATTERN = re.compile(r'^\s*\d+\s*[.)]\s*')
+
+
+class QuestionCache:
+    """
+    Caches technical questions per (tech stack, difficulty) profile
+
+    Question generation only depends on the first five tech-stack items and
+    the difficulty level, so candidates with the same profile can be served
+    from a shared pool of previously generated questions. Each pool grows
+    until it holds ``pool_target`` distinct questions; after that, every
+    candidate gets a random subset of the pool instead of a new LLM call.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, max_entries: int = 256,
+                 ttl_seconds: Optional[float] = None, pool_target: Optional[int] = None,
+                 max_pool_size: int = 50, max_disk_entries: int = 10000):
+        """
+        Initialize Question Cache
+
+        Args:
+            db_path: SQLite file for the persistent tier (None for memory only)
+            max_entries: Maximum number of pools kept in memory
+            ttl_seconds: Pool lifetime in seconds, after which it is regenerated
+            pool_target: Number of distinct questions a pool needs before it is served
+            max_pool_size: Maximum number of questions kept per pool
+            max_disk_entries: Maximum number of pools kept on disk
+        """
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv('QUESTION_CACHE_TTL_HOURS', '168')) * 3600
+        if pool_target is None:
+            pool_target = int(os.getenv('QUESTION_POOL_TARGET', '15'))
+
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.pool_target = pool_target
+        self.max_pool_size = max_pool_size
+        self.max_disk_entries = max_disk_entries
+        self._memory = LRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._lock = threading.Lock()
+
+        if self.db_path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            with self._connect() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS question_pools (
+                        cache_key TEXT PRIMARY KEY,
+                        difficulty TEXT NOT NULL,
+                        tech_stack TEXT NOT NULL,
+                        questions TEXT NOT NULL,
+                        created_at REAL NOT NULL,
+                        updated_at REAL NOT NULL
+                    )
+                """)
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_question_pools_updated ON question_pools(updated_at)"
+                )
+
+    @staticmethod
+    def normalize_profile(tech_stack: List[str], years_exp: float) -> Tuple[Tuple[str, ...], str]:
+        """
+        Normalize a candidate profile into its cache-relevant parts
+
+        Args:
+            tech_stack: List of technologies
+            years_exp: Years of experience
+
+        Returns:
+            Tuple of (normalized tech stack, difficulty level)
+        """
+        techs = []
+        for tech in tech_stack[:5]:
+            normalized = ' '.join(tech.lower().split())
+            if normalized and normalized not in techs:
+                techs.append(normalized)
+        return tuple(sorted(techs)), PromptTemplates.get_difficulty_level(years_exp)
+
+    @staticmethod
+    def make_key(tech_stack: List[str], years_exp: float) -> str:
+        """Build the content-addressed cache key for a candidate profile"""
+        techs, difficulty = QuestionCache.normalize_profile(tech_stack, years_exp)
+        raw = f"{difficulty}|{','.join(techs)}"
+        return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+    def sample(self, tech_stack: List[str], years_exp: float, count: int = 5) -> Optional[List[str]]:
+        """
+        Serve a random, numbered subset of the cached pool for a profile
+
+        Args:
+            tech_stack: List of technologies
+            years_exp: Years of experience
+            count: Number of questions to return
+
+        Returns:
+            Numbered questions, or None if the pool is missing or not full yet
+        """
+        pool = self._get_pool(self.make_key(tech_stack, years_exp))
+        if len(pool) < max(self.pool_target, count):
+            metrics.increment('question_cache.miss')
+            return None
+
+        metrics.increment('question_cache.hit')
+        chosen = random.sample(pool, count)
+        return [f"{i}. {question}" for i, question in enumerate(chosen, 1)]
+
+    def add(self, tech_stack: List[str], years_exp: float, questions: List[str]):
+        """
+        Add newly generated questions to the pool for a profile
+
+        Args:
+            tech_stack: List of technologies
+            years_exp: Years of experience
+            questions: Generated (optionally numbered) questions
+        """
+        key = self.make_key(tech_stack, years_exp)
+        techs, difficulty = self.normalize_profile(tech_stack, years_exp)
+
+        with self._lock:
+            if not self.db_path:
+                pool = self._merge(self._get_pool(key), questions)
+                if pool is not None:
+                    self._memory.set(key, pool)
+                return
+
+            with self._connect() as conn:
+                # Merge into the stored pool under the write lock, so that
+                # processes sharing the file don't overwrite each other's questions
+                conn.execute("BEGIN IMMEDIATE")
+                pool = self._merge(self._read_pool(conn, key), questions)
+                if pool is not None:
+                    self._write_pool(conn, key, techs, difficulty, pool)
+            if pool is not None:
+                self._memory.set(key, pool)
+
+    def _merge(self, pool: List[str], questions: List[str]) -> Optional[List[str]]:
+        """Pool with the new questions appended, or None if none of them is new"""
+        pool = list(pool)
+        seen = {question.lower() for question in pool}
+        added = False
+        for question in questions:
+            text = QUESTION_NUMBER_PATTERN.sub('', question).strip()
+            if text and text.lower() not in seen:
+                seen.add(text.lower())
+                pool.append(text)
+                added = True
+        return pool[-self.max_pool_size:] if added else None
+
+    def _get_pool(self, key: str) -> List[str]:
+        """Get a pool from memory, falling back to (and promoting from) disk"""
+        pool = self._memory.get(key)
+        if pool is not None:
+            return pool
+        if not self.db_path:
+            return []
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT questions, created_at FROM question_pools WHERE cache_key = ?", (key,)
+            ).fetchone()
+        if row is None or row[1] + self.ttl_seconds <= time.time():
+            return []
+
+        pool = json.loads(row[0])
+        remaining = row[1] + self.ttl_seconds - time.time()
+        self._memory.set(key, pool, ttl_seconds=remaining)
+        return pool
+
+    def _read_pool(self, conn: sqlite3.Connection, key: str) -> List[str]:
+        """Read a stored pool that has not expired (empty if there is none)"""
+        row = conn.execute(
+            "SELECT questions, created_at FROM question_pools WHERE cache_key = ?", (key,)
+        ).fetchone()
+        if row is None or row[1] + self.ttl_seconds <= time.time():
+            return []
+        return json.loads(row[0])
+
+    def _write_pool(self, conn: sqlite3.Connection, key: str, techs: Tuple[str, ...], difficulty: str,
+                    pool: List[str]):
+        """Persist a pool and evict expired or least recently updated pools"""
+        now = time.time()
+        # Expired pools first: a pool replacing an expired one starts a new lifetime
+        conn.execute("DELETE FROM question_pools WHERE created_at <= ?", (now - self.ttl_seconds,))
+        conn.execute("""
+            INSERT INTO question_pools (cache_key, difficulty, tech_stack, questions, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(cache_key) DO UPDATE SET
+                questions = excluded.questions,
+                updated_at = excluded.updated_at
+        """, (key, difficulty, ','.join(techs), json.dumps(pool), now, now))
+        conn.execute("""
+            DELETE FROM question_pools WHERE cache_key IN (
+                SELECT cache_key FROM question_pools ORDER BY updated_at DESC LIMIT -1 OFFSET ?
+            )
+        """, (self.max_disk_entries,))
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection to the persistent tier, committing on success"""
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def clear(self):
+        """Remove all cached pools from both tiers"""
+        with self._lock:
+            self._memory.clear()
+            if self.db_path:
+                with self._connect() as conn:
+                    conn.execute("DELETE FROM question_pools")
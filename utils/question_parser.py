@@ -0,0 +1,161 @@
+"""
+Question Parser Module
+Extracts numbered technical questions from LLM responses
+"""
+
+import json
+import re
+from typing import List, Optional
+
+# "1. ...", "1) ...", "1: ...", "1 - ...", "Q1. ...", "Question 1: ...", optionally inside
+# a list item ("- 1. ..."), a heading ("### 1. ...") or bold markers ("**1.** ...",
+# "**1. ...**"). A marker is only taken as bold when it opens before the number, so
+# "1. __init__ ..." or "1. **kwargs ..." keep their text.
+QUESTION_START_PATTERN = re.compile(
+    r'^(?P<indent>\s*)(?:[-*•]\s+|#{1,6}\s*)?(?P<bold>\*\*|__)?\s*'
+    r'(?:q(?:uestion)?\s*)?(?P<number>\d{1,2})(?:\s*[.):]|\s+[-–—])'
+    r'(?P<closed>(?(bold)\s*(?P=bold)))?\s*(?P<text>.*)$',
+    re.IGNORECASE
+)
+# Only lines starting with one of these can match QUESTION_START_PATTERN
+QUESTION_START_CHARS = frozenset('0123456789-*•#_qQ')
+# JSON object or array, possibly wrapped in a ```json fence
+JSON_PATTERN = re.compile(r'[\[{].*[\]}]', re.DOTALL)
+
+MIN_QUESTION_LENGTH = 10
+
+
+def parse_questions(response: str, max_questions: Optional[int] = None) -> List[str]:
+    """
+    Parse questions from an LLM response in either structured (JSON) or text format
+
+    Args:
+        response: Raw LLM response
+        max_questions: Maximum number of questions to return (None for all)
+
+    Returns:
+        Questions formatted as "1. Question text", numbered from 1
+    """
+    questions = parse_json_questions(response)
+    if not questions:
+        questions = parse_text_questions(response)
+    if max_questions is not None:
+        questions = questions[:max_questions]
+    return [f"{number}. {question}" for number, question in enumerate(questions, 1)]
+
+
+def parse_json_questions(response: str) -> List[str]:
+    """
+    Parse a structured response (see PromptTemplates.QUESTIONS_SCHEMA)
+
+    Accepts {"questions": [...]} or a bare list; items may be strings or
+    objects with a "question" or "text" field.
+
+    Args:
+        response: Raw LLM response
+
+    Returns:
+        Question texts without numbering, or an empty list if it is not JSON
+    """
+    match = JSON_PATTERN.search(response)
+    if not match:
+        return []
+    try:
+        data = json.loads(match.group(0))
+    except ValueError:
+        return []
+
+    if isinstance(data, dict):
+        data = data.get('questions')
+    if not isinstance(data, list):
+        return []
+
+    questions = []
+    for item in data:
+        if isinstance(item, dict):
+            item = item.get('question') or item.get('text')
+        if isinstance(item, str):
+            match = QUESTION_START_PATTERN.match(item)
+            text = _clean(match.group('text'), _open_bold(match)) if match else _clean(item)
+            if len(text) >= MIN_QUESTION_LENGTH:
+                questions.append(text)
+    return questions
+
+
+def parse_text_questions(response: str) -> List[str]:
+    """
+    Parse numbered questions from free text in a single pass
+
+    A numbered line starts a new question when its number continues the
+    sequence (or repeats it, for models that number every item "1.") and it
+    is not indented deeper than the first question. Other numbered lines,
+    such as sub-points, are kept as part of the current question. Unnumbered
+    lines continue the current question, except after a blank line once the
+    question is complete (ends with "?"), where they are treated as trailing
+    commentary and skipped.
+
+    Args:
+        response: Raw LLM response
+
+    Returns:
+        Question texts without numbering
+    """
+    questions: List[List[str]] = []
+    # Bold marker opened before each question's number and closed at its end
+    bold: List[Optional[str]] = []
+    last_number = 0
+    base_indent = None
+    blank_before = False
+    skipping = False
+
+    for line in response.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith('```'):
+            blank_before = True
+            continue
+
+        match = QUESTION_START_PATTERN.match(line) if stripped[0] in QUESTION_START_CHARS else None
+        if match:
+            number = int(match.group('number'))
+            indent = len(match.group('indent').expandtabs())
+            starts_question = not questions or (
+                number in (last_number, last_number + 1) and indent <= base_indent
+            )
+            if starts_question:
+                if base_indent is None:
+                    base_indent = indent
+                questions.append([match.group('text')])
+                bold.append(_open_bold(match))
+                last_number = number
+                blank_before = False
+                skipping = False
+                continue
+
+        if questions and not skipping:
+            current = questions[-1]
+            if blank_before and current[-1].rstrip('*_ ').endswith('?'):
+                skipping = True
+            else:
+                current.append(stripped)
+        blank_before = False
+
+    parsed = (_clean(' '.join(parts), marker) for parts, marker in zip(questions, bold))
+    return [text for text in parsed if len(text) >= MIN_QUESTION_LENGTH]
+
+
+def fallback_questions(response: str) -> List[str]:
+    """Last resort when no numbered questions are found: every substantial line"""
+    return [line.strip() for line in response.split('\n') if line.strip() and len(line.strip()) > 15]
+
+
+def _open_bold(match: re.Match) -> Optional[str]:
+    """Bold marker opened before the question number and not closed right after it"""
+    return None if match.group('closed') else match.group('bold')
+
+
+def _clean(text: str, bold: Optional[str] = None) -> str:
+    """Collapse whitespace and strip the bold marker closing a bold question"""
+    text = ' '.join(text.split())
+    if bold and text.endswith(bold):
+        text = text[:-len(bold)].rstrip()
+    return text
@@ -0,0 +1,200 @@
+"""
+Rate Limiter Module
+Process-wide token-bucket admission control for LLM requests
+"""
+
+import heapq
+import itertools
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from utils.metrics import metrics
+
+# Lower values are admitted first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a request cannot be admitted within the allowed wait"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class _Bucket:
+    """Token bucket refilled continuously at a fixed rate"""
+
+    __slots__ = ('rate', 'capacity', 'level', 'updated')
+
+    def __init__(self, per_minute: float, burst_seconds: float):
+        self.rate = per_minute / 60.0
+        self.capacity = max(1.0, self.rate * burst_seconds)
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def time_until(self, amount: float) -> float:
+        """Seconds until `amount` is available (after refill)"""
+        return max(0.0, (min(amount, self.capacity) - self.level) / self.rate)
+
+    def take(self, amount: float):
+        self.level -= min(amount, self.capacity)
+
+
+class RateLimiter:
+    """
+    Admission control with a requests-per-minute and a tokens-per-minute bucket
+
+    Callers wait in a bounded queue ordered by priority, then arrival. Only
+    the head of the queue is admitted, once both buckets hold enough, so
+    interactive requests overtake queued background work. When the queue
+    is full or a request would wait longer than `max_wait`, RateLimitExceeded
+    is raised instead of piling up more load. `pause` stops admission for a
+    while, e.g. for the Retry-After of a 429 response.
+    """
+
+    def __init__(self, name: str, requests_per_minute: float = 0, tokens_per_minute: float = 0,
+                 max_queued: int = 50, max_wait: float = 30.0, burst_seconds: float = 10.0):
+        """
+        Initialize Rate Limiter
+
+        Args:
+            name: Name used in metrics (llm.<name>.queue_depth etc.)
+            requests_per_minute: Request rate limit (0 for unlimited)
+            tokens_per_minute: Token rate limit (0 for unlimited)
+            max_queued: Maximum requests waiting for admission
+            max_wait: Maximum seconds a request waits for admission
+            burst_seconds: Seconds of rate that may be used at once after an idle period
+        """
+        self.name = name
+        self.max_queued = max_queued
+        self.max_wait = max_wait
+        self._requests = _Bucket(requests_per_minute, burst_seconds) if requests_per_minute > 0 else None
+        self._tokens = _Bucket(tokens_per_minute, burst_seconds) if tokens_per_minute > 0 else None
+        self._paused_until = 0.0
+        self._waiting: List[list] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+    @property
+    def enabled(self) -> bool:
+        return self._requests is not None or self._tokens is not None
+
+    def queue_depth(self) -> int:
+        """Number of requests waiting for admission"""
+        with self._condition:
+            return len(self._waiting)
+
+    def acquire(self, tokens: int = 0, priority: int = PRIORITY_INTERACTIVE,
+                timeout: Optional[float] = None) -> float:
+        """
+        Wait until a request may be sent
+
+        Args:
+            tokens: Estimated tokens of the request (prompt plus completion)
+            priority: PRIORITY_INTERACTIVE or PRIORITY_BACKGROUND
+            timeout: Maximum seconds to wait (default: max_wait)
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            RateLimitExceeded: If the queue is full or admission takes too long
+        """
+        started = time.monotonic()
+        if not self.enabled and started >= self._paused_until:
+            return 0.0
+
+        deadline = started + (self.max_wait if timeout is None else timeout)
+        with self._condition:
+            if len(self._waiting) >= self.max_queued:
+                metrics.increment(f'llm.{self.name}.rejected')
+                raise RateLimitExceeded(f"{self.name} request queue is full", self._delay(tokens, started))
+
+            entry = [priority, next(self._sequence), tokens]
+            heapq.heappush(self._waiting, entry)
+            metrics.set_gauge(f'llm.{self.name}.queue_depth', len(self._waiting))
+            try:
+                while True:
+                    now = time.monotonic()
+                    delay = self._delay(tokens, now) if self._waiting[0] is entry else None
+                    if delay == 0:
+                        break
+                    remaining = deadline - now
+                    if remaining <= 0 or (delay is not None and delay > remaining):
+                        metrics.increment(f'llm.{self.name}.rejected')
+                        raise RateLimitExceeded(f"{self.name} is over its rate limit", delay)
+                    self._condition.wait(remaining if delay is None else delay)
+
+                heapq.heappop(self._waiting)
+                if self._requests:
+                    self._requests.take(1)
+                if self._tokens:
+                    self._tokens.take(tokens)
+            except BaseException:
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+                raise
+            finally:
+                metrics.set_gauge(f'llm.{self.name}.queue_depth', len(self._waiting))
+                # The next request in line may be admissible now
+                self._condition.notify_all()
+
+        waited = time.monotonic() - started
+        metrics.observe(f'llm.{self.name}.queue_wait', waited)
+        return waited
+
+    def pause(self, seconds: float):
+        """Stop admitting requests for a while (e.g. the Retry-After of a 429)"""
+        with self._condition:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _delay(self, tokens: int, now: float) -> float:
+        """Seconds until a request of `tokens` could be admitted (lock held)"""
+        delay = max(0.0, self._paused_until - now)
+        for bucket, amount in ((self._requests, 1), (self._tokens, tokens)):
+            if bucket is not None:
+                bucket.refill(now)
+                delay = max(delay, bucket.time_until(amount))
+        return delay
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str) -> RateLimiter:
+    """
+    Get the process-wide rate limiter for an LLM provider
+
+    Limits are read from <NAME>_REQUESTS_PER_MINUTE and <NAME>_TOKENS_PER_MINUTE
+    (0 or unset for unlimited); the queue from LLM_MAX_QUEUED and LLM_MAX_QUEUE_WAIT.
+
+    Args:
+        name: Provider name, e.g. 'openai'
+
+    Returns:
+        Shared RateLimiter instance
+    """
+    limiter = _limiters.get(name)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(name)
+            if limiter is None:
+                prefix = name.upper()
+                limiter = RateLimiter(
+                    name,
+                    requests_per_minute=float(os.getenv(f'{prefix}_REQUESTS_PER_MINUTE', '0')),
+                    tokens_per_minute=float(os.getenv(f'{prefix}_TOKENS_PER_MINUTE', '0')),
+                    max_queued=int(os.getenv('LLM_MAX_QUEUED', '50')),
+                    max_wait=float(os.getenv('LLM_MAX_QUEUE_WAIT', '30'))
+                )
+                _limiters[name] = limiter
+    return limiter
@@ -3,13 +3,110 @@ Sentiment Analysis Module (Optional Enhancement)
 Gauges candidate emotions during conversation
 """
 
-from typing import Dict, Tuple
-from textblob import TextBlob
+import re
+import threading
+from typing import Dict, List, Tuple
+
+# TextBlob pulls in NLTK, so it is only imported on first use
+_textblob_class = None
+_textblob_lock = threading.Lock()
+
+# Lexicon compiled into NumPy arrays for batch scoring, built on first use
+_lexicon = None
+_lexicon_lock = threading.Lock()
+
+# TextBlob's punctuation marks; they are split off the start and end of words
+_PUNCTUATION = re.escape(".,;:!?()[]{}`@#$^&*+-|=~_")
+# Apostrophes and quotes split words into separate tokens
+_QUOTES = "'\"\u2018\u2019\u201c\u201d"
+
+
+def _load_textblob():
+    """Import TextBlob on first use and return its TextBlob class"""
+    global _textblob_class
+    if _textblob_class is None:
+        with _textblob_lock:
+            if _textblob_class is None:
+                from textblob import TextBlob
+                _textblob_class = TextBlob
+    return _textblob_class
+
+
+def _load_lexicon() -> Dict:
+    """
+    Compile TextBlob's English sentiment lexicon into sorted NumPy arrays
+
+    Returns:
+        Dictionary with the vocabulary, per-word scores and the tokenizer pattern
+    """
+    global _lexicon
+    if _lexicon is None:
+        with _lexicon_lock:
+            if _lexicon is None:
+                import numpy as np
+                from textblob.en import sentiment
+                from textblob._text import EMOTICONS
+
+                # Multi-word entries can never match a single token
+                words = sorted(w for w in sentiment.keys() if ' ' not in w)
+                scores = np.array([sentiment[w][None] for w in words], dtype=np.float64)
+                is_modifier = np.array([any(pos in sentiment.modifiers for pos in sentiment[w]) for w in words])
+
+                # Emoticons and "(!)" are scored on their own, like TextBlob does
+                specials = {'(!)': 0.0}
+                for (_, polarity), faces in EMOTICONS.items():
+                    for face in faces:
+                        if not face.lower().isalpha():
+                            specials.setdefault(face.lower(), polarity)
+                special_pattern = '|'.join(re.escape(face) for face in sorted(specials, key=len, reverse=True))
+                word = f"[^\\s{_PUNCTUATION}{_QUOTES}]+"
+
+                _lexicon = {
+                    'words': np.array(words),
+                    'polarity': scores[:, 0],
+                    'subjectivity': scores[:, 1],
+                    'intensity': scores[:, 2],
+                    'is_modifier': is_modifier,
+                    'ends_ly': np.char.endswith(np.array(words), 'ly'),
+                    'negations': set(sentiment.negations),
+                    'specials': specials,
+                    # One match per token: "(!)", emoticons, "...", "!", a single-letter
+                    # abbreviation ("a.") or a word with inner punctuation
+                    'pattern': re.compile(
+                        f"(?P<special>\\(\\s?!\\s?\\)|(?:{special_pattern})(?=\\s|$))"
+                        f"|(?P<other>\\.\\.\\.|!|(?<!\\S)[a-z]\\.(?=\\s|$)|{word}(?:[{_PUNCTUATION}]+{word})*)"
+                    ),
+                }
+    return _lexicon
+
+
+def _last_event(is_event, first_token):
+    """
+    Index of the most recent event strictly before each token of the same text (-1 if none)
+
+    Args:
+        is_event: Boolean array marking event tokens
+        first_token: Index of the first token of each token's text
+    """
+    import numpy as np
+
+    positions = np.where(is_event, np.arange(len(is_event)), -1)
+    last = np.maximum.accumulate(positions)
+    previous = np.empty_like(last)
+    previous[:1] = -1
+    previous[1:] = last[:-1]
+    previous[previous < first_token] = -1
+    return previous
 
 
 class SentimentAnalyzer:
     """Analyzes sentiment in candidate responses"""
 
+    @staticmethod
+    def warm_up():
+        """Load TextBlob and its lexicon ahead of the first request"""
+        SentimentAnalyzer.analyze_sentiment("Warming up the sentiment analyzer.")
+
     @staticmethod
     def analyze_sentiment(text: str) -> Dict:
         """
@@ -22,7 +119,7 @@ class SentimentAnalyzer:
             Dictionary with sentiment metrics
         """
         try:
-            blob = TextBlob(text)
+            blob = _load_textblob()(text)
             polarity = blob.sentiment.polarity  # -1 to 1
             subjectivity = blob.sentiment.subjectivity  # 0 to 1
             
@@ -41,6 +138,160 @@ class SentimentAnalyzer:
                 'error': str(e)
             }
 
+    @staticmethod
+    def analyze_batch(texts: List[str]) -> List[Dict]:
+        """
+        Analyze sentiment of many texts at once
+        
+        Same result format as analyze_sentiment. Polarity and subjectivity
+        match analyze_sentiment within BATCH_TOLERANCE.
+        
+        Args:
+            texts: Texts to analyze
+            
+        Returns:
+            List of dictionaries with sentiment metrics, in input order
+        """
+        polarity, subjectivity = SentimentAnalyzer.score_batch(texts)
+        return [
+            {
+                'polarity': p,
+                'subjectivity': s,
+                'sentiment': SentimentAnalyzer._classify_sentiment(p),
+                'confidence': abs(p)
+            }
+            for p, s in zip(polarity.tolist(), subjectivity.tolist())
+        ]
+
+    # Batch scores equal TextBlob's up to floating-point rounding. The only known
+    # exception comes from tokenization: a two-letter abbreviation ("Mr.", "Dr.")
+    # right after an intensifier does not cut it off from the next word, as it
+    # does in TextBlob ("very Mr. good")
+    BATCH_TOLERANCE = 1e-9
+
+    @staticmethod
+    def score_batch(texts: List[str]):
+        """
+        Score many texts with the compiled lexicon
+        
+        Reimplements TextBlob's pattern analyzer - intensifiers ("very good"),
+        negations ("not good"), exclamation marks and emoticons - as array
+        operations over the tokens of all texts, so the per-word Python work
+        is limited to tokenizing.
+        
+        Args:
+            texts: Texts to score
+            
+        Returns:
+            Tuple of NumPy arrays (polarity, subjectivity), one entry per text
+        """
+        import numpy as np
+
+        lexicon = _load_lexicon()
+        pattern = lexicon['pattern']
+        specials = lexicon['specials']
+        negations = lexicon['negations']
+
+        tokens, specials_found, text_lengths = [], [], []
+        for text in texts:
+            found = pattern.findall(text.lower().replace("n't", " n't"))
+            text_lengths.append(len(found))
+            for special, other in found:
+                tokens.append(other)
+                specials_found.append(special)
+
+        count = len(texts)
+        if not tokens:
+            return np.zeros(count), np.zeros(count)
+
+        text_id = np.repeat(np.arange(count), text_lengths)
+        text_start = np.concatenate(([0], np.cumsum(text_lengths)[:-1]))
+        first_token = text_start[text_id]
+        token_array = np.array(tokens)
+        length = np.char.str_len(token_array)
+        is_special = np.array(specials_found, dtype=object) != ''
+        length[is_special] = np.array([len(s.replace(' ', '')) for s in specials_found if s])
+
+        # Vocabulary lookup
+        words = lexicon['words']
+        index = np.minimum(np.searchsorted(words, token_array), len(words) - 1)
+        known = (words[index] == token_array) & ~is_special
+        polarity = np.where(known, lexicon['polarity'][index], 0.0)
+        subjectivity = np.where(known, lexicon['subjectivity'][index], 0.0)
+        intensity = np.where(known, lexicon['intensity'][index], 1.0)
+        modifier = known & lexicon['is_modifier'][index]
+        ends_ly = known & lexicon['ends_ly'][index]
+        if is_special.any():
+            polarity[is_special] = [specials[s.replace(' ', '')] for s in specials_found if s]
+            subjectivity[is_special] = 1.0
+        negation = np.isin(token_array, list(negations)) & ~known
+        exclamation = token_array == '!'
+        unknown = ~known & ~negation
+
+        # A preceding known adverb merges the word into its assessment ("very good");
+        # unknown words longer than two characters end that ("very big house").
+        # First find which negations follow an "-ly" adverb ("really not good"):
+        # those negate the adverb's assessment and leave the adverb active.
+        resets_modifier = (unknown | is_special) & (length > 2)
+        previous = _last_event(known | resets_modifier, first_token)
+        modifier_active = (previous >= 0) & modifier[np.maximum(previous, 0)]
+        negates_adverb = negation & modifier_active & ends_ly[np.maximum(previous, 0)]
+        resets_modifier |= negation & (length > 2) & ~negates_adverb
+        previous = _last_event(known | resets_modifier, first_token)
+        merges = known & (previous >= 0) & modifier[np.maximum(previous, 0)]
+
+        # A negation applies to the next known word unless a word longer than one
+        # character comes first ("not a good" is still negated)
+        sets_negation = negation & ~negates_adverb
+        resets_negation = known | negates_adverb | is_special | (unknown & (length > 1))
+        previous = _last_event(sets_negation | resets_negation, first_token)
+        negated = known & (previous >= 0) & sets_negation[np.maximum(previous, 0)]
+
+        # Assessments: a known word or special token, plus the words merged into it
+        member = known | is_special
+        starts = member & ~merges
+        if not starts.any():
+            return np.zeros(count), np.zeros(count)
+        assessment = np.cumsum(starts) - 1
+        members = np.flatnonzero(member)
+        member_assessment = assessment[members]
+        is_last = np.ones(len(members), dtype=bool)
+        is_last[:-1] = member_assessment[:-1] != member_assessment[1:]
+        last = members[is_last]
+        size = np.bincount(member_assessment, minlength=starts.sum())
+
+        # Merged words are scaled by the intensity of the word before them,
+        # inverted when that word was negated ("not very good")
+        effective_intensity = np.where(negated, 1.0 / intensity, intensity)
+        previous_member = np.empty_like(members)
+        previous_member[0] = members[0]
+        previous_member[1:] = members[:-1]
+        scale = np.where(size > 1, effective_intensity[previous_member[is_last]], 1.0)
+        assessment_polarity = polarity[last] * scale
+        assessment_subjectivity = subjectivity[last] * scale
+        merged = size > 1
+        assessment_polarity[merged] = np.clip(assessment_polarity[merged], -1.0, 1.0)
+        assessment_subjectivity[merged] = np.clip(assessment_subjectivity[merged], -1.0, 1.0)
+
+        # Each "!" after an assessment's last word boosts it by 25%
+        text_first_assessment = np.concatenate(([0], np.cumsum(np.bincount(text_id[starts], minlength=count))[:-1]))
+        boosted = exclamation & (assessment >= text_first_assessment[text_id])
+        boost_target = assessment[boosted]
+        boost_target = boost_target[np.flatnonzero(boosted) > last[boost_target]]
+        boosts = np.bincount(boost_target, minlength=len(last))
+        assessment_polarity = np.clip(assessment_polarity * 1.25 ** boosts, -1.0, 1.0)
+
+        # "not good" is slightly bad, "not bad" is slightly good
+        is_negated = np.bincount(assessment[negated | negates_adverb], minlength=len(last)) > 0
+        assessment_polarity[is_negated] *= -0.5
+
+        assessment_text = text_id[starts]
+        totals = np.maximum(np.bincount(assessment_text, minlength=count), 1)
+        return (
+            np.bincount(assessment_text, weights=assessment_polarity, minlength=count) / totals,
+            np.bincount(assessment_text, weights=assessment_subjectivity, minlength=count) / totals,
+        )
+
     @staticmethod
     def _classify_sentiment(polarity: float) -> str:
         """
@@ -68,3 +319,81 @@ class SentimentAnalyzer:
             'neutral': '😐'
         }
         return indicators.get(sentiment, '😐')
+
+
+class SentimentStats:
+    """
+    Running statistics of a conversation's sentiment
+
+    Updated in O(1) per message (Welford's algorithm for the variance), so
+    no per-message history has to be kept in session state.
+    """
+
+    __slots__ = ('count', 'mean', '_m2', 'ewma', 'min', 'max', 'alpha')
+
+    def __init__(self, alpha: float = 0.3):
+        """
+        Initialize Sentiment Stats
+        
+        Args:
+            alpha: Weight of the newest message in the recent-mood average (0 to 1)
+        """
+        self.alpha = alpha
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.ewma = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def update(self, polarity: float):
+        """Add the polarity of one message"""
+        self.count += 1
+        delta = polarity - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (polarity - self.mean)
+        if self.count == 1:
+            self.ewma = self.min = self.max = polarity
+        else:
+            self.ewma += self.alpha * (polarity - self.ewma)
+            self.min = min(self.min, polarity)
+            self.max = max(self.max, polarity)
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the polarity"""
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def sentiment(self) -> str:
+        """Overall sentiment classification"""
+        return SentimentAnalyzer._classify_sentiment(self.mean)
+
+    @property
+    def recent_sentiment(self) -> str:
+        """Sentiment classification of the recent mood"""
+        return SentimentAnalyzer._classify_sentiment(self.ewma)
+
+    def to_dict(self) -> Dict:
+        """Serialize for storage in the candidate record"""
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'variance': self.variance,
+            'ewma': self.ewma,
+            'min': self.min,
+            'max': self.max,
+            'alpha': self.alpha,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SentimentStats':
+        """Restore statistics saved with to_dict"""
+        stats = cls(alpha=data.get('alpha', 0.3))
+        stats.count = data.get('count', 0)
+        stats.mean = data.get('mean', 0.0)
+        stats._m2 = data.get('variance', 0.0) * stats.count
+        stats.ewma = data.get('ewma', 0.0)
+        stats.min = data.get('min', 0.0)
+        stats.max = data.get('max', 0.0)
+        return stats
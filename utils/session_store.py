@@ -0,0 +1,356 @@
+"""
+Session Store Module
+Keeps interview sessions by token, in memory or in SQLite so interviews survive restarts and rebalancing
+"""
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Callable, Dict, Optional
+
+from utils.interview_engine import InterviewSession
+from utils.metrics import metrics
+
+
+def encode_state(state: Dict) -> bytes:
+    """Compact binary form of a session snapshot (minified JSON, zlib-compressed)"""
+    return zlib.compress(json.dumps(state, separators=(',', ':'), ensure_ascii=False).encode('utf-8'))
+
+
+def decode_state(data: bytes) -> Dict:
+    """Session snapshot from encode_state"""
+    return json.loads(zlib.decompress(data).decode('utf-8'))
+
+
+class SessionStore:
+    """
+    Interview sessions by token, held in memory
+
+    Sessions idle for longer than ``idle_timeout`` are dropped from memory.
+    This is the default store: interviews only live as long as the process,
+    so a load balancer must keep each candidate on the same instance.
+    """
+
+    # Seconds between sweeps for idle sessions
+    EXPIRE_INTERVAL = 60.0
+
+    def __init__(self, idle_timeout: float = 3600.0):
+        """
+        Initialize Session Store
+
+        Args:
+            idle_timeout: Seconds without use after which a session is dropped from memory
+        """
+        self.idle_timeout = idle_timeout
+        self._sessions: Dict[str, InterviewSession] = {}
+        self._last_used: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._next_expiry = time.monotonic() + self.EXPIRE_INTERVAL
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def add(self, session: InterviewSession):
+        """Register a new session"""
+        self._remember(session)
+        self.save(session)
+        metrics.increment('session_store.created')
+        if time.monotonic() >= self._next_expiry:
+            self.expire()
+
+    def get(self, session_id: str) -> Optional[InterviewSession]:
+        """
+        Look up a session by its token
+
+        Returns:
+            The session, or None if it is unknown or expired
+        """
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._last_used[session_id] = time.monotonic()
+            return session
+
+    def save(self, session: InterviewSession):
+        """Record that a step changed the session (nothing to persist in memory)"""
+        with self._lock:
+            if session.interview_id in self._sessions:
+                self._last_used[session.interview_id] = time.monotonic()
+
+    def delete(self, session_id: str):
+        """Forget a session"""
+        with self._lock:
+            self._sessions.pop(session_id, None)
+            self._last_used.pop(session_id, None)
+
+    def expire(self) -> int:
+        """
+        Drop sessions from memory that have been idle for longer than the timeout
+
+        Returns:
+            Number of sessions dropped
+        """
+        now = time.monotonic()
+        cutoff = now - self.idle_timeout
+        with self._lock:
+            self._next_expiry = now + self.EXPIRE_INTERVAL
+            expired = [session_id for session_id, used in self._last_used.items()
+                       if used < cutoff and self._can_evict(session_id)]
+            for session_id in expired:
+                del self._sessions[session_id]
+                del self._last_used[session_id]
+        if expired:
+            metrics.increment('session_store.expired', len(expired))
+        return len(expired)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all saved sessions are persisted"""
+        return True
+
+    def close(self):
+        """Persist pending saves and release resources"""
+
+    def _remember(self, session: InterviewSession):
+        with self._lock:
+            self._sessions[session.interview_id] = session
+            self._last_used[session.interview_id] = time.monotonic()
+
+    def _can_evict(self, session_id: str) -> bool:
+        """Whether an idle session may be dropped from memory (lock held)"""
+        return True
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    Sessions persisted to SQLite with write-behind batching
+
+    ``save`` only marks a session dirty; a writer thread serializes dirty
+    sessions and writes them in one transaction every ``flush_interval``,
+    so several saves of a session in quick succession become one write and
+    no step waits on the disk. Any process sharing the database file can
+    resume an interview by its token: ``get`` reloads a session when the
+    stored version is newer than the copy in memory, e.g. after the
+    previous request went to another replica.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS sessions (
+            session_id TEXT PRIMARY KEY,
+            version INTEGER NOT NULL,
+            updated_at REAL NOT NULL,
+            state BLOB NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_sessions_updated_at ON sessions(updated_at);
+    """
+
+    def __init__(self, restore: Callable[[Dict], InterviewSession],
+                 db_path: str = os.path.join("data", "sessions.db"), idle_timeout: float = 3600.0,
+                 ttl: float = 24 * 3600.0, flush_interval: float = 0.2):
+        """
+        Initialize SQLite Session Store
+
+        Args:
+            restore: Rebuilds a session from its snapshot (InterviewEngine.restore_session)
+            db_path: Path of the database file
+            idle_timeout: Seconds without use after which a session is dropped from memory
+                (it stays resumable from the database)
+            ttl: Seconds without changes after which a session is deleted from the database
+            flush_interval: Maximum seconds a save waits before it is written
+        """
+        super().__init__(idle_timeout)
+        self.restore = restore
+        self.db_path = db_path
+        self.ttl = ttl
+        self.flush_interval = flush_interval
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._db_lock = threading.Lock()
+        with self._db_lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(self.SCHEMA)
+
+        self._dirty: Dict[str, InterviewSession] = {}
+        self._writing = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._writer = threading.Thread(target=self._run, name='session-store', daemon=True)
+        self._writer.start()
+        # Don't lose the last batch on a clean interpreter shutdown
+        atexit.register(self.close)
+
+    def get(self, session_id: str) -> Optional[InterviewSession]:
+        session = super().get(session_id)
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT version FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        if row is None or (session is not None and session.version >= row[0]):
+            # Unsaved, unchanged elsewhere, or newer here than on disk (write pending)
+            return session
+
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT version, state FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        if row is None:
+            return session
+        try:
+            restored = self.restore(decode_state(row[1]))
+        except (ValueError, KeyError, TypeError, zlib.error) as e:
+            print(f"[SessionStore] Could not restore session {session_id}: {str(e)}")
+            metrics.increment('session_store.errors')
+            return session
+        restored.version = row[0]
+        self._remember(restored)
+        metrics.increment('session_store.restored')
+        return restored
+
+    def save(self, session: InterviewSession):
+        """Mark the session for writing (non-blocking)"""
+        super().save(session)
+        with self._condition:
+            if self._closed:
+                raise ValueError("Session store is closed")
+            session.version += 1
+            self._dirty[session.interview_id] = session
+            self._condition.notify_all()
+
+    def delete(self, session_id: str):
+        super().delete(session_id)
+        with self._condition:
+            self._dirty.pop(session_id, None)
+        with self._db_lock, self._conn:
+            self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+    def expire(self) -> int:
+        dropped = super().expire()
+        with self._db_lock, self._conn:
+            self._conn.execute("DELETE FROM sessions WHERE updated_at < ?", (time.time() - self.ttl,))
+        return dropped
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every session saved so far is written
+
+        Args:
+            timeout: Maximum seconds to wait (None to wait indefinitely)
+
+        Returns:
+            True if everything is written, False on timeout
+        """
+        with self._condition:
+            self._condition.notify_all()
+            return self._condition.wait_for(lambda: not self._dirty and not self._writing, timeout=timeout)
+
+    def close(self):
+        """Write pending saves and stop the writer thread"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._writer.join()
+        with self._db_lock:
+            self._conn.close()
+
+    def _can_evict(self, session_id: str) -> bool:
+        # Keep sessions in memory until their last save is written
+        return session_id not in self._dirty
+
+    def _run(self):
+        """Writer thread: write dirty sessions in batches"""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._dirty or self._closed)
+                if not self._dirty and self._closed:
+                    return
+            if not self._closed:
+                # Let more saves accumulate into this batch
+                time.sleep(self.flush_interval)
+            with self._condition:
+                batch, self._dirty = self._dirty, {}
+                self._writing = True
+            try:
+                self._write_batch(batch)
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+    def _write_batch(self, batch: Dict[str, InterviewSession]):
+        """Serialize and write a batch of sessions in one transaction"""
+        started = time.perf_counter()
+        rows = []
+        busy = {}
+        for session_id, session in batch.items():
+            # Engine steps hold the session lock for their whole run, LLM calls
+            # included: rather than wait for one, write the session in a later batch
+            # (only on close is it worth waiting)
+            if not session.lock.acquire(blocking=self._closed):
+                busy[session_id] = session
+                continue
+            try:
+                version = session.version
+                state = session.to_state()
+            finally:
+                session.lock.release()
+            data = encode_state(state)
+            metrics.observe('session_store.state_bytes', len(data))
+            rows.append((session_id, version, time.time(), data))
+
+        try:
+            with self._db_lock, self._conn:
+                # Never overwrite a newer version written by another process
+                self._conn.executemany(
+                    "INSERT INTO sessions (session_id, version, updated_at, state) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(session_id) DO UPDATE SET version = excluded.version, "
+                    "updated_at = excluded.updated_at, state = excluded.state "
+                    "WHERE excluded.version > sessions.version",
+                    rows
+                )
+        except sqlite3.Error as e:
+            print(f"[SessionStore] Error writing sessions: {str(e)}")
+            metrics.increment('session_store.errors')
+
+        if busy:
+            with self._condition:
+                for session_id, session in busy.items():
+                    self._dirty.setdefault(session_id, session)
+            metrics.increment('session_store.deferred', len(busy))
+
+        metrics.observe('session_store.write_batch_size', len(rows))
+        metrics.observe('session_store.write_latency', time.perf_counter() - started)
+
+
+def create_session_store(restore: Callable[[Dict], InterviewSession], backend: Optional[str] = None,
+                         data_dir: str = "data") -> SessionStore:
+    """
+    Create the configured session store
+
+    Args:
+        restore: Rebuilds a session from its snapshot (InterviewEngine.restore_session)
+        backend: 'memory' or 'sqlite' (defaults to SESSION_STORE, then 'memory')
+        data_dir: Directory for the session database
+
+    Returns:
+        Session store
+    """
+    backend = (backend or os.getenv('SESSION_STORE', 'memory')).lower()
+    idle_timeout = float(os.getenv('SESSION_IDLE_MINUTES', '60')) * 60
+    if backend == 'memory':
+        return SessionStore(idle_timeout=idle_timeout)
+    if backend == 'sqlite':
+        return SQLiteSessionStore(
+            restore,
+            db_path=os.getenv('SESSION_STORE_PATH', os.path.join(data_dir, "sessions.db")),
+            idle_timeout=idle_timeout,
+            ttl=float(os.getenv('SESSION_TTL_HOURS', '24')) * 3600,
+            flush_interval=float(os.getenv('SESSION_FLUSH_MS', '200')) / 1000
+        )
+    raise ValueError(f"Unknown session store: {backend}")
@@ -0,0 +1,455 @@
+"""
+Storage Module
+Storage backends for anonymized candidate records and interview transcripts
+"""
+
+import glob
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import uuid
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class CandidateStore:
+    """Interface implemented by candidate storage backends"""
+
+    def save_candidate(self, record: Dict) -> bool:
+        """
+        Save one anonymized candidate record
+
+        Args:
+            record: Anonymized candidate data (must contain 'candidate_id')
+
+        Returns:
+            Success status
+        """
+        return self.save_candidates([record]) == 1
+
+    def save_candidates(self, records: List[Dict]) -> int:
+        """
+        Save many anonymized candidate records at once
+
+        Args:
+            records: Anonymized candidate records
+
+        Returns:
+            Number of records saved
+        """
+        raise NotImplementedError
+
+    def save_transcript(self, candidate_id: str, transcript: List[Dict], timestamp: Optional[str] = None) -> bool:
+        """
+        Save one interview transcript
+
+        Args:
+            candidate_id: Anonymized candidate ID
+            transcript: Interview conversation transcript
+            timestamp: ISO timestamp of the interview (defaults to now)
+
+        Returns:
+            Success status
+        """
+        return self.save_transcripts([(candidate_id, transcript, timestamp)]) == 1
+
+    def save_transcripts(self, items: List[Tuple[str, List[Dict], Optional[str]]]) -> int:
+        """
+        Save many interview transcripts at once
+
+        Args:
+            items: (candidate_id, transcript, timestamp) tuples
+
+        Returns:
+            Number of transcripts saved
+        """
+        raise NotImplementedError
+
+    def get_candidate(self, candidate_id: str) -> Optional[Dict]:
+        """Get the most recent record for a candidate"""
+        raise NotImplementedError
+
+    def find_candidates(self, tech: Optional[str] = None, position: Optional[str] = None,
+                        since: Optional[str] = None, until: Optional[str] = None,
+                        limit: int = 100) -> List[Dict]:
+        """
+        Find candidate records, newest first
+
+        Args:
+            tech: Only candidates listing this technology (case-insensitive)
+            position: Only candidates interested in this position (case-insensitive)
+            since: Only records at or after this ISO timestamp
+            until: Only records before this ISO timestamp
+            limit: Maximum number of records
+
+        Returns:
+            Matching candidate records
+        """
+        raise NotImplementedError
+
+    def iter_candidates(self) -> Iterator[Dict]:
+        """Iterate over every stored candidate record"""
+        raise NotImplementedError
+
+    def get_transcripts(self, candidate_id: str) -> List[Dict]:
+        """
+        Get all transcripts of a candidate, oldest first
+
+        Returns:
+            Dicts with 'candidate_id', 'timestamp' and 'transcript'
+        """
+        raise NotImplementedError
+
+    def iter_transcripts(self) -> Iterator[Dict]:
+        """Iterate over every stored transcript (same shape as get_transcripts)"""
+        raise NotImplementedError
+
+    def close(self):
+        """Release resources held by the backend"""
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now().isoformat()
+
+
+class JSONFileStore(CandidateStore):
+    """
+    One pretty-printed JSON file per event in a flat directory
+
+    Filenames carry a microsecond timestamp and a random suffix so concurrent
+    writes never collide, and each file is written atomically. Queries have to
+    read every file, so prefer SQLiteStore for large data directories.
+    """
+
+    def __init__(self, data_dir: str = "data"):
+        """
+        Initialize JSON File Store
+
+        Args:
+            data_dir: Directory for storing candidate data
+        """
+        self.data_dir = data_dir
+        os.makedirs(data_dir, exist_ok=True)
+
+    def save_candidates(self, records: List[Dict]) -> int:
+        saved = 0
+        for record in records:
+            if self._write_json(self._unique_path("candidates"), record):
+                saved += 1
+        return saved
+
+    def save_transcripts(self, items: List[Tuple[str, List[Dict], Optional[str]]]) -> int:
+        saved = 0
+        for candidate_id, transcript, _timestamp in items:
+            if self._write_json(self._unique_path(f"interview_{candidate_id}"), transcript):
+                saved += 1
+        return saved
+
+    def get_candidate(self, candidate_id: str) -> Optional[Dict]:
+        matches = [r for r in self.iter_candidates() if r.get('candidate_id') == candidate_id]
+        return max(matches, key=lambda r: r.get('timestamp', '')) if matches else None
+
+    def find_candidates(self, tech: Optional[str] = None, position: Optional[str] = None,
+                        since: Optional[str] = None, until: Optional[str] = None,
+                        limit: int = 100) -> List[Dict]:
+        results = []
+        for record in self.iter_candidates():
+            timestamp = record.get('timestamp', '')
+            if tech and tech.lower() not in [t.lower() for t in record.get('tech_stack', [])]:
+                continue
+            if position and position.lower() not in [p.lower() for p in record.get('desired_positions', [])]:
+                continue
+            if since and timestamp < since:
+                continue
+            if until and timestamp >= until:
+                continue
+            results.append(record)
+        results.sort(key=lambda r: r.get('timestamp', ''), reverse=True)
+        return results[:limit]
+
+    def get_transcripts(self, candidate_id: str) -> List[Dict]:
+        pattern = os.path.join(self.data_dir, f"interview_{candidate_id}_*.json")
+        return [t for t in (self._read_transcript(path) for path in sorted(glob.glob(pattern))) if t]
+
+    def iter_transcripts(self) -> Iterator[Dict]:
+        for path in sorted(glob.glob(os.path.join(self.data_dir, "interview_*.json"))):
+            transcript = self._read_transcript(path)
+            if transcript:
+                yield transcript
+
+    def iter_candidates(self) -> Iterator[Dict]:
+        for path in glob.glob(os.path.join(self.data_dir, "candidates_*.json")):
+            try:
+                with open(path) as f:
+                    yield json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Error reading candidate data {path}: {str(e)}")
+
+    def _read_transcript(self, path: str) -> Optional[Dict]:
+        # interview_<candidate_id>_<YYYYmmdd_HHMMSS[_ffffff_xxxxxx]>.json
+        name = os.path.basename(path)[len("interview_"):-len(".json")]
+        candidate_id = name.partition('_')[0]
+        try:
+            with open(path) as f:
+                transcript = json.load(f)
+            timestamp = datetime.fromtimestamp(os.path.getmtime(path)).isoformat()
+        except (OSError, ValueError) as e:
+            print(f"Error reading interview transcript {path}: {str(e)}")
+            return None
+        return {'candidate_id': candidate_id, 'timestamp': timestamp, 'transcript': transcript}
+
+    def _unique_path(self, prefix: str) -> str:
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        return os.path.join(self.data_dir, f"{prefix}_{stamp}_{uuid.uuid4().hex[:6]}.json")
+
+    def _write_json(self, filepath: str, data) -> bool:
+        """Write JSON atomically: a temporary file is renamed into place"""
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.data_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(data, f, indent=2)
+                os.replace(tmp_path, filepath)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            return True
+        except Exception as e:
+            print(f"Error saving {os.path.basename(filepath)}: {str(e)}")
+            return False
+
+
+class SQLiteStore(CandidateStore):
+    """
+    SQLite database in WAL mode
+
+    Candidates are indexed on candidate_id, timestamp, tech stack and
+    desired position. Every save runs in a single transaction, so bulk
+    inserts are atomic and cheap.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS candidates (
+            id INTEGER PRIMARY KEY,
+            candidate_id TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            years_of_experience REAL,
+            location TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_candidates_candidate_id ON candidates(candidate_id);
+        CREATE INDEX IF NOT EXISTS idx_candidates_timestamp ON candidates(timestamp);
+
+        CREATE TABLE IF NOT EXISTS candidate_tech (
+            candidate_row INTEGER NOT NULL REFERENCES candidates(id) ON DELETE CASCADE,
+            tech TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_candidate_tech_tech ON candidate_tech(tech, candidate_row);
+
+        CREATE TABLE IF NOT EXISTS candidate_positions (
+            candidate_row INTEGER NOT NULL REFERENCES candidates(id) ON DELETE CASCADE,
+            position TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_candidate_positions_position ON candidate_positions(position, candidate_row);
+
+        CREATE TABLE IF NOT EXISTS transcripts (
+            id INTEGER PRIMARY KEY,
+            candidate_id TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_transcripts_candidate_id ON transcripts(candidate_id, timestamp);
+    """
+
+    def __init__(self, db_path: str = os.path.join("data", "talentscout.db")):
+        """
+        Initialize SQLite Store
+
+        Args:
+            db_path: Path of the database file
+        """
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        # A single connection shared by all threads; SQLite allows one writer at a time anyway
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            self._conn.executescript(self.SCHEMA)
+
+    def save_candidates(self, records: List[Dict]) -> int:
+        try:
+            with self._lock, self._conn:
+                for record in records:
+                    cursor = self._conn.execute(
+                        "INSERT INTO candidates (candidate_id, timestamp, years_of_experience, location, data) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (
+                            record['candidate_id'],
+                            record.get('timestamp') or self._now(),
+                            record.get('years_of_experience'),
+                            record.get('location'),
+                            json.dumps(record, separators=(',', ':'))
+                        )
+                    )
+                    row_id = cursor.lastrowid
+                    techs = {t.strip().lower() for t in record.get('tech_stack', []) if t and t.strip()}
+                    positions = {p.strip().lower() for p in record.get('desired_positions', []) if p and p.strip()}
+                    self._conn.executemany(
+                        "INSERT INTO candidate_tech (candidate_row, tech) VALUES (?, ?)",
+                        [(row_id, tech) for tech in techs]
+                    )
+                    self._conn.executemany(
+                        "INSERT INTO candidate_positions (candidate_row, position) VALUES (?, ?)",
+                        [(row_id, position) for position in positions]
+                    )
+            return len(records)
+        except Exception as e:
+            print(f"Error saving candidate data: {str(e)}")
+            return 0
+
+    def save_transcripts(self, items: List[Tuple[str, List[Dict], Optional[str]]]) -> int:
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT INTO transcripts (candidate_id, timestamp, data) VALUES (?, ?, ?)",
+                    [
+                        (candidate_id, timestamp or self._now(), json.dumps(transcript, separators=(',', ':')))
+                        for candidate_id, transcript, timestamp in items
+                    ]
+                )
+            return len(items)
+        except Exception as e:
+            print(f"Error saving interview transcript: {str(e)}")
+            return 0
+
+    def get_candidate(self, candidate_id: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM candidates WHERE candidate_id = ? ORDER BY timestamp DESC LIMIT 1",
+                (candidate_id,)
+            ).fetchone()
+        return json.loads(row['data']) if row else None
+
+    def find_candidates(self, tech: Optional[str] = None, position: Optional[str] = None,
+                        since: Optional[str] = None, until: Optional[str] = None,
+                        limit: int = 100) -> List[Dict]:
+        query = "SELECT c.data FROM candidates c"
+        conditions, params = [], []
+        if tech:
+            conditions.append("c.id IN (SELECT candidate_row FROM candidate_tech WHERE tech = ?)")
+            params.append(tech.strip().lower())
+        if position:
+            conditions.append("c.id IN (SELECT candidate_row FROM candidate_positions WHERE position = ?)")
+            params.append(position.strip().lower())
+        if since:
+            conditions.append("c.timestamp >= ?")
+            params.append(since)
+        if until:
+            conditions.append("c.timestamp < ?")
+            params.append(until)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY c.timestamp DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [json.loads(row['data']) for row in rows]
+
+    def get_transcripts(self, candidate_id: str) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT candidate_id, timestamp, data FROM transcripts WHERE candidate_id = ? ORDER BY timestamp",
+                (candidate_id,)
+            ).fetchall()
+        return [self._transcript_row(row) for row in rows]
+
+    def iter_candidates(self, batch_size: int = 500) -> Iterator[Dict]:
+        for row in self._iter_rows("SELECT id, data FROM candidates", batch_size):
+            yield json.loads(row['data'])
+
+    def iter_transcripts(self, batch_size: int = 500) -> Iterator[Dict]:
+        for row in self._iter_rows("SELECT id, candidate_id, timestamp, data FROM transcripts", batch_size):
+            yield self._transcript_row(row)
+
+    def _iter_rows(self, select: str, batch_size: int) -> Iterator[sqlite3.Row]:
+        """Page through a table by rowid without holding the lock between pages"""
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"{select} WHERE id > ? ORDER BY id LIMIT ?", (last_id, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            yield from rows
+            last_id = rows[-1]['id']
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _transcript_row(row: sqlite3.Row) -> Dict:
+        return {'candidate_id': row['candidate_id'], 'timestamp': row['timestamp'], 'transcript': json.loads(row['data'])}
+
+
+def create_store(backend: Optional[str] = None, data_dir: str = "data") -> CandidateStore:
+    """
+    Create the configured storage backend
+
+    Args:
+        backend: 'sqlite' or 'json' (defaults to STORAGE_BACKEND, then 'sqlite')
+        data_dir: Directory for storing candidate data
+
+    Returns:
+        Storage backend
+    """
+    backend = (backend or os.getenv('STORAGE_BACKEND', 'sqlite')).lower()
+    if backend == 'json':
+        return JSONFileStore(data_dir)
+    if backend == 'sqlite':
+        return SQLiteStore(os.path.join(data_dir, "talentscout.db"))
+    raise ValueError(f"Unknown storage backend: {backend}")
+
+
+def copy_store(source: CandidateStore, target: CandidateStore, batch_size: int = 1000) -> Tuple[int, int]:
+    """
+    Copy all candidates and transcripts from one backend into another
+
+    Useful to move an existing JSON data directory into SQLite.
+
+    Args:
+        source: Backend to read from
+        target: Backend to write to
+        batch_size: Number of records per bulk insert
+
+    Returns:
+        Tuple of (candidates copied, transcripts copied)
+    """
+    copied_candidates = 0
+    batch = []
+    for record in source.iter_candidates():
+        batch.append(record)
+        if len(batch) >= batch_size:
+            copied_candidates += target.save_candidates(batch)
+            batch = []
+    if batch:
+        copied_candidates += target.save_candidates(batch)
+
+    copied_transcripts = 0
+    batch = []
+    for item in source.iter_transcripts():
+        batch.append((item['candidate_id'], item['transcript'], item['timestamp']))
+        if len(batch) >= batch_size:
+            copied_transcripts += target.save_transcripts(batch)
+            batch = []
+    if batch:
+        copied_transcripts += target.save_transcripts(batch)
+    return copied_candidates, copied_transcripts
@@ -0,0 +1,265 @@
+"""
+Transcript Log Module
+Append-only JSONL log of interview turns with batched fsync and segment rotation
+"""
+
+import atexit
+import glob
+import json
+import os
+import queue
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
+
+from utils.metrics import metrics
+
+
+class TranscriptLog:
+    """
+    Durable, append-only log of interview turns
+
+    Every turn is one compact JSON line. A single writer thread drains the
+    queue of appended turns, writes them in batches and fsyncs once per
+    batch (group commit), so many concurrent sessions share each fsync.
+    The log is split into numbered segment files that rotate by size.
+    """
+
+    SEGMENT_PATTERN = "transcript-*.jsonl"
+
+    def __init__(self, log_dir: str = os.path.join("data", "transcripts"),
+                 max_segment_bytes: int = 64 * 1024 * 1024, flush_interval: float = 0.2,
+                 max_batch: int = 512):
+        """
+        Initialize Transcript Log
+
+        Args:
+            log_dir: Directory holding the segment files
+            max_segment_bytes: Size after which a new segment is started
+            flush_interval: Maximum seconds a turn waits before it is fsynced
+            max_batch: Maximum number of turns written per fsync
+        """
+        self.log_dir = log_dir
+        self.max_segment_bytes = max_segment_bytes
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        os.makedirs(log_dir, exist_ok=True)
+
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._condition = threading.Condition()
+        self._appended = 0
+        self._durable = 0
+        self._closed = False
+
+        segments = self._segments()
+        self._segment_index = self._parse_index(segments[-1]) if segments else 1
+        self._file = self._open_segment(self._segment_index)
+
+        self._writer = threading.Thread(target=self._run, name='transcript-log', daemon=True)
+        self._writer.start()
+        # Don't lose the last batch on a clean interpreter shutdown
+        atexit.register(self.close)
+
+    def append(self, candidate_id: str, interview_id: str, turn: int, role: str, content: str, **fields):
+        """
+        Append one interview turn to the log (non-blocking)
+
+        Args:
+            candidate_id: Anonymized candidate ID
+            interview_id: Identifies one interview of the candidate
+            turn: Position of the turn in the interview
+            role: 'user' or 'assistant'
+            content: Message text
+            **fields: Extra fields stored with the turn
+        """
+        record = {
+            'candidate_id': candidate_id,
+            'interview_id': interview_id,
+            'turn': turn,
+            'ts': time.time(),
+            'role': role,
+            'content': content,
+        }
+        record.update(fields)
+        line = json.dumps(record, separators=(',', ':'), ensure_ascii=False) + '\n'
+        with self._condition:
+            if self._closed:
+                raise ValueError("Transcript log is closed")
+            self._appended += 1
+        self._queue.put(line)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every turn appended so far is on disk
+
+        Args:
+            timeout: Maximum seconds to wait (None to wait indefinitely)
+
+        Returns:
+            True if everything is durable, False on timeout
+        """
+        with self._condition:
+            target = self._appended
+            return self._condition.wait_for(lambda: self._durable >= target, timeout=timeout)
+
+    def close(self):
+        """Flush pending turns and stop the writer thread"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(None)
+        self._writer.join()
+        self._file.close()
+
+    def read_transcript(self, candidate_id: str, interview_id: Optional[str] = None) -> List[Dict]:
+        """
+        Rebuild a candidate's transcript from the log
+
+        Args:
+            candidate_id: Anonymized candidate ID
+            interview_id: Only turns of this interview (default: all interviews)
+
+        Returns:
+            Turns ordered by interview start and turn number
+        """
+        needle = f'"candidate_id":{json.dumps(candidate_id)}'
+        turns = []
+        for record in self._iter_records(needle):
+            if record.get('candidate_id') != candidate_id:
+                continue
+            if interview_id is not None and record.get('interview_id') != interview_id:
+                continue
+            turns.append(record)
+
+        started = {}
+        for record in turns:
+            interview = record['interview_id']
+            started[interview] = min(started.get(interview, record['ts']), record['ts'])
+        turns.sort(key=lambda r: (started[r['interview_id']], r['interview_id'], r['turn']))
+        return turns
+
+    def _iter_records(self, needle: Optional[str] = None) -> Iterator[Dict]:
+        """Iterate over records of all segments, skipping a torn final line"""
+        for path in self._segments():
+            with open(path, 'rb') as f:
+                for raw in f:
+                    line = raw.decode('utf-8', errors='replace')
+                    if needle and needle not in line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        # Partially written line from a crash
+                        continue
+
+    def _run(self):
+        """Writer thread: group-commit batches of turns"""
+        stopping = False
+        while not stopping:
+            try:
+                first = self._queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+
+            batch = []
+            if first is None:
+                stopping = True
+            else:
+                batch.append(first)
+            deadline = time.monotonic() + self.flush_interval
+            while not stopping and len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    line = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if line is None:
+                    stopping = True
+                else:
+                    batch.append(line)
+            # Pick up anything queued behind the stop marker or the deadline
+            while len(batch) < self.max_batch:
+                try:
+                    line = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if line is None:
+                    stopping = True
+                else:
+                    batch.append(line)
+
+            if batch:
+                self._write_batch(batch)
+
+    def _write_batch(self, batch: List[str]):
+        """Write and fsync a batch, rotating the segment if it grew too large"""
+        started = time.perf_counter()
+        try:
+            self._file.write(''.join(batch).encode('utf-8'))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            if self._file.tell() >= self.max_segment_bytes:
+                self._rotate()
+        except OSError as e:
+            print(f"[TranscriptLog] Error writing transcript log: {str(e)}")
+            metrics.increment('transcript_log.errors')
+
+        metrics.observe('transcript_log.fsync_batch_size', len(batch))
+        metrics.observe('transcript_log.write_latency', time.perf_counter() - started)
+        with self._condition:
+            self._durable += len(batch)
+            self._condition.notify_all()
+
+    def _rotate(self):
+        """Start a new segment file"""
+        self._file.close()
+        self._segment_index += 1
+        self._file = self._open_segment(self._segment_index)
+
+    def _open_segment(self, index: int):
+        """
+        Open a segment for appending
+
+        A crash can leave a partially written last line. It is cut off first,
+        so the next turn starts on a line of its own instead of being glued
+        to the fragment (and then skipped as unreadable).
+        """
+        path = self._segment_path(index)
+        segment = open(path, 'a+b')
+        size = segment.seek(0, os.SEEK_END)
+        if size:
+            segment.seek(size - 1)
+            if segment.read(1) != b'\n':
+                keep = self._last_line_end(segment, size)
+                segment.truncate(keep)
+                segment.flush()
+                os.fsync(segment.fileno())
+                print(f"[TranscriptLog] Dropped {size - keep} bytes of a partially written turn from {path}")
+                metrics.increment('transcript_log.repaired')
+        return segment
+
+    @staticmethod
+    def _last_line_end(segment, size: int, chunk_size: int = 65536) -> int:
+        """Offset just past the last newline of a file (0 if there is none)"""
+        position = size
+        while position > 0:
+            step = min(chunk_size, position)
+            position -= step
+            segment.seek(position)
+            newline = segment.read(step).rfind(b'\n')
+            if newline >= 0:
+                return position + newline + 1
+        return 0
+
+    def _segments(self) -> List[str]:
+        return sorted(glob.glob(os.path.join(self.log_dir, self.SEGMENT_PATTERN)), key=self._parse_index)
+
+    def _segment_path(self, index: int) -> str:
+        return os.path.join(self.log_dir, f"transcript-{index:06d}.jsonl")
+
+    @staticmethod
+    def _parse_index(path: str) -> int:
+        return int(os.path.basename(path)[len("transcript-"):-len(".jsonl")])
@@ -0,0 +1,151 @@
+"""
+Transcript Sentiment Module
+Offline sentiment scoring of every stored interview transcript
+
+Usage: python -m utils.transcript_sentiment [--backend sqlite] [--workers 4] [--output sentiment.csv]
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Deque, Dict, Iterator, List, Optional
+
+from utils.sentiment_analyzer import SentimentAnalyzer
+from utils.storage import CandidateStore, create_store
+
+FIELDS = ['candidate_id', 'timestamp', 'messages', 'polarity', 'subjectivity',
+          'min_polarity', 'max_polarity', 'sentiment']
+
+
+def score_transcripts_chunk(items: List[Dict]) -> List[Dict]:
+    """
+    Score the candidate messages of a chunk of transcripts
+
+    Runs in a worker process; all messages of the chunk are scored in one batch.
+
+    Args:
+        items: Transcripts as returned by CandidateStore.iter_transcripts
+
+    Returns:
+        One result per transcript (see FIELDS), in input order
+    """
+    texts, offsets = [], [0]
+    for item in items:
+        texts.extend(
+            message['content'] for message in item['transcript']
+            if message.get('role') == 'user' and message.get('content')
+        )
+        offsets.append(len(texts))
+
+    polarity, subjectivity = SentimentAnalyzer.score_batch(texts)
+
+    results = []
+    for position, item in enumerate(items):
+        start, end = offsets[position], offsets[position + 1]
+        result = {'candidate_id': item['candidate_id'], 'timestamp': item['timestamp'], 'messages': end - start}
+        if end > start:
+            mean = float(polarity[start:end].mean())
+            result.update({
+                'polarity': mean,
+                'subjectivity': float(subjectivity[start:end].mean()),
+                'min_polarity': float(polarity[start:end].min()),
+                'max_polarity': float(polarity[start:end].max()),
+                'sentiment': SentimentAnalyzer._classify_sentiment(mean),
+            })
+        else:
+            result.update({'polarity': 0.0, 'subjectivity': 0.0, 'min_polarity': 0.0,
+                           'max_polarity': 0.0, 'sentiment': 'neutral'})
+        results.append(result)
+    return results
+
+
+def score_transcripts(store: CandidateStore, workers: Optional[int] = None,
+                      chunk_size: int = 500) -> Iterator[Dict]:
+    """
+    Score every stored transcript using a pool of worker processes
+
+    Transcripts are streamed from the store in chunks and only a few chunks
+    per worker are in flight, so memory stays flat for large stores.
+
+    Args:
+        store: Storage backend to read transcripts from
+        workers: Number of worker processes (default: CPU count; 1 scores inline)
+        chunk_size: Transcripts per worker task
+
+    Yields:
+        One result per transcript (see FIELDS), in store order
+    """
+    workers = workers or os.cpu_count() or 1
+
+    def chunks() -> Iterator[List[Dict]]:
+        chunk = []
+        for item in store.iter_transcripts():
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    if workers == 1:
+        for chunk in chunks():
+            yield from score_transcripts_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight: Deque = deque()
+        for chunk in chunks():
+            in_flight.append(executor.submit(score_transcripts_chunk, chunk))
+            if len(in_flight) >= workers * 2:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Score all stored transcripts and print average polarity per month"""
+    parser = argparse.ArgumentParser(description="Score sentiment of all stored interview transcripts")
+    parser.add_argument('--backend', help="'sqlite' or 'json' (default: STORAGE_BACKEND)")
+    parser.add_argument('--data-dir', default='data', help='data directory (default: data)')
+    parser.add_argument('--workers', type=int, help='worker processes (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=500, help='transcripts per worker task')
+    parser.add_argument('--output', help='write per-transcript results to this CSV file')
+    args = parser.parse_args(argv)
+
+    store = create_store(args.backend, args.data_dir)
+    output = open(args.output, 'w', newline='') if args.output else None
+    writer = csv.DictWriter(output, fieldnames=FIELDS) if output else None
+    if writer:
+        writer.writeheader()
+
+    started = time.perf_counter()
+    monthly: Dict[str, List[float]] = {}
+    count = 0
+    try:
+        for result in score_transcripts(store, args.workers, args.chunk_size):
+            count += 1
+            if writer:
+                writer.writerow(result)
+            if result['messages']:
+                totals = monthly.setdefault(str(result['timestamp'])[:7], [0.0, 0])
+                totals[0] += result['polarity']
+                totals[1] += 1
+    finally:
+        if output:
+            output.close()
+        store.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"Scored {count} transcripts in {elapsed:.2f}s ({count / elapsed if elapsed else 0:.0f}/s)")
+    for month in sorted(monthly):
+        total, scored = monthly[month]
+        print(f"  {month}  {scored:6d} interviews  average polarity {total / scored:+.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
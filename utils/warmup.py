@@ -0,0 +1,43 @@
+"""
+Warm-up Module
+Preloads slow optional NLP dependencies off the request path
+"""
+
+import threading
+import time
+from typing import Optional
+
+from utils.language_detector import LanguageHandler
+from utils.metrics import metrics
+from utils.sentiment_analyzer import SentimentAnalyzer
+
+
+def warm_up(background: bool = True) -> Optional[threading.Thread]:
+    """
+    Load TextBlob and langdetect (including its language profiles)
+
+    Args:
+        background: Run on a daemon thread instead of blocking the caller
+
+    Returns:
+        The warm-up thread when running in the background, otherwise None
+    """
+    if not background:
+        _warm_up()
+        return None
+
+    thread = threading.Thread(target=_warm_up, name='nlp-warmup', daemon=True)
+    thread.start()
+    return thread
+
+
+def _warm_up():
+    """Run every warm-up step, recording how long each one took"""
+    for name, step in (('sentiment', SentimentAnalyzer.warm_up), ('language', LanguageHandler.warm_up)):
+        started = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            print(f"[Warmup] {name} warm-up failed: {str(e)}")
+            continue
+        metrics.observe(f'warmup.{name}', time.perf_counter() - started)